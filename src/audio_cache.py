@@ -0,0 +1,202 @@
+"""
+Herald Audio Cache
+
+Persistent, content-addressed cache of generated speech audio.
+Entries are keyed by normalized text + voice + rate, so audio rendered
+with an old voice or speed is never reused. Eviction is LRU, bounded by
+total size and entry age. The index survives restarts.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from loguru import logger
+
+
+class AudioCache:
+    """Disk cache of audio files with size- and age-bounded LRU eviction."""
+
+    INDEX_FILE = "index.json"
+    INDEX_VERSION = 1
+
+    def __init__(self, cache_dir: Path, max_bytes: int, max_age: float, suffix: str = ".mp3"):
+        """
+        Args:
+            cache_dir: Directory holding audio files and the index
+            max_bytes: Evict least-recently-used entries above this total size
+            max_age: Evict entries not used for this many seconds
+            suffix: File extension for stored audio
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.suffix = suffix
+
+        # key -> {"size": bytes, "created": timestamp, "last_used": timestamp}
+        self._entries: dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self._dirty = False  # Index has unsaved last_used updates
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._load_index()
+        self.evict()
+
+    @staticmethod
+    def make_key(text: str, voice_id: str, rate: str) -> str:
+        """Build a cache key from normalized text, voice and rate modifier."""
+        normalized = " ".join(text.split())
+        digest = hashlib.sha256(f"{voice_id}\0{rate}\0{normalized}".encode()).hexdigest()
+        return digest[:32]
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{self.suffix}"
+
+    def _load_index(self):
+        """Load the index, dropping entries whose files are gone and orphaned files."""
+        index_path = self.cache_dir / self.INDEX_FILE
+        entries = {}
+        try:
+            with open(index_path) as f:
+                data = json.load(f)
+            if data.get("version") == self.INDEX_VERSION:
+                entries = data.get("entries", {})
+        except FileNotFoundError:
+            pass
+        except (OSError, json.JSONDecodeError, AttributeError) as e:
+            logger.warning(f"Audio cache index unreadable, starting fresh: {e}")
+
+        self._entries = {key: entry for key, entry in entries.items() if self._path(key).exists()}
+
+        # Files without an index entry (e.g. crash before index save) are unaccounted for
+        for f in self.cache_dir.glob(f"*{self.suffix}"):
+            if f.stem not in self._entries:
+                try:
+                    f.unlink()
+                except OSError:
+                    pass
+
+        if len(self._entries) != len(entries):
+            self._dirty = True
+        logger.debug(f"Audio cache: {len(self._entries)} entries, {self._total_bytes_locked() / 1e6:.1f} MB")
+
+    def _save_index(self):
+        """Write the index atomically (caller holds the lock)."""
+        index_path = self.cache_dir / self.INDEX_FILE
+        tmp_path = index_path.with_suffix(".tmp")
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump({"version": self.INDEX_VERSION, "entries": self._entries}, f)
+            os.replace(tmp_path, index_path)
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"Failed to save audio cache index: {e}")
+
+    def get(self, key: str) -> Path | None:
+        """Return the cached file path for key (marking it recently used), or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            path = self._path(key)
+            if not path.exists():
+                del self._entries[key]
+                self._dirty = True
+                return None
+            entry["last_used"] = time.time()
+            self._dirty = True
+            return path
+
+    def read(self, key: str) -> bytes | None:
+        """Return the cached audio bytes for key (marking it recently used), or None."""
+        path = self.get(key)
+        if path is None:
+            return None
+        try:
+            return path.read_bytes()
+        except OSError as e:
+            logger.debug(f"Audio cache entry unreadable: {e}")
+            return None
+
+    def put(self, key: str, data: bytes) -> Path:
+        """Store audio bytes under key and return the cached file path."""
+        path = self._path(key)
+        # Per-thread temp name: speak and a prefetch it attached to may store the same key
+        tmp_path = path.with_suffix(f".{threading.get_ident()}.part")
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        self._add_entry(key, len(data))
+        return path
+
+    def _add_entry(self, key: str, size: int):
+        now = time.time()
+        with self._lock:
+            self._entries[key] = {"size": size, "created": now, "last_used": now}
+            self._evict_locked()
+            self._save_index()
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def total_bytes(self) -> int:
+        """Total size of all cached audio (read from the metrics and resource monitor threads too)."""
+        with self._lock:
+            return self._total_bytes_locked()
+
+    def _total_bytes_locked(self) -> int:
+        return sum(entry["size"] for entry in self._entries.values())
+
+    def evict(self):
+        """Remove expired entries, then least-recently-used ones until under the size limit."""
+        with self._lock:
+            if self._evict_locked() or self._dirty:
+                self._save_index()
+
+    def _evict_locked(self) -> bool:
+        """Evict entries (caller holds the lock). Returns True if anything was removed."""
+        removed = False
+        now = time.time()
+        total = self._total_bytes_locked()
+
+        # Oldest last_used first
+        for key, entry in sorted(self._entries.items(), key=lambda item: item[1]["last_used"]):
+            expired = now - entry["last_used"] > self.max_age
+            if not expired and total <= self.max_bytes:
+                break
+            try:
+                self._path(key).unlink(missing_ok=True)
+            except OSError:
+                # Still open for playback (Windows locks loaded files) - try again next time
+                continue
+            del self._entries[key]
+            total -= entry["size"]
+            removed = True
+            logger.debug(f"Evicted audio cache entry: {key[:8]}...")
+
+        return removed
+
+    def flush(self):
+        """Persist pending last-used updates to the index."""
+        with self._lock:
+            if self._dirty:
+                self._save_index()
+
+    def clear(self):
+        """Delete all cached audio."""
+        with self._lock:
+            for key in list(self._entries):
+                try:
+                    self._path(key).unlink(missing_ok=True)
+                except OSError:
+                    continue
+                del self._entries[key]
+            self._save_index()
@@ -54,6 +54,40 @@ RATE_STEP = 25  # Amount to change per speed hotkey press
 # Line navigation
 DEFAULT_LINE_DELAY = 0  # Milliseconds between lines (0 = no delay)
 DEFAULT_READ_MODE = "lines"  # "lines" or "continuous"
+LINE_WAIT_TIMEOUT = 0.05  # Seconds next/prev wait for a line still being prepared before deferring it
+
+# Prefetch (online voices generate upcoming lines during playback)
+PREFETCH_WORKERS = 3  # Maximum concurrent prefetch generations
+PREFETCH_MIN_LOOKAHEAD = 1  # Lines ahead, lower bound for adaptive lookahead
+PREFETCH_MAX_LOOKAHEAD = 8  # Lines ahead, upper bound for adaptive lookahead
+
+# Continuous mode (long text is split at sentences and generated in parallel)
+CONTINUOUS_CHUNK_SECONDS = 15  # Target speaking time per chunk at the current rate
+CONTINUOUS_WORKERS = 3  # Maximum concurrent chunk generations
+
+# Audio playback
+DEFAULT_STREAM_AUDIO = True  # Start playing edge-tts audio as chunks arrive (vs. after full download)
+DEFAULT_GAPLESS_LINES = True  # Queue the next prefetched line in the mixer when line_delay is 0
+DEFAULT_TIME_STRETCH = False  # Render online voices at one rate, change speed at playback (needs numpy)
+TIME_STRETCH_BASE_RATE = 600  # wpm that audio is rendered at when time stretch is on
+
+# Audio cache (generated speech persisted across restarts)
+AUDIO_CACHE_DIR = PROJECT_ROOT / "temp" / "cache"
+DEFAULT_AUDIO_CACHE_DIR = ""  # Empty = AUDIO_CACHE_DIR
+DEFAULT_AUDIO_CACHE_MAX_MB = 200  # Evict least-recently-used audio above this size
+DEFAULT_AUDIO_CACHE_MAX_AGE_DAYS = 30  # Evict audio not played for this long
+
+# Edge service endpoint (developer option, not in DEFAULT_SETTINGS)
+# Set "edge_endpoint" in settings.json to e.g. a local stand-in: python src/edge_standin.py
+DEFAULT_EDGE_ENDPOINT = ""  # Empty = Microsoft's read-aloud service
+
+# Synthetic engine (offline stand-in for edge, for benchmarks and load tests)
+# Developer option: select with "engine": "synthetic" and override these keys in settings.json
+DEFAULT_SYNTHETIC_LATENCY_MS = 300  # Delay before each request's first audio chunk
+DEFAULT_SYNTHETIC_JITTER_MS = 100  # Latency varies uniformly by up to this much either way
+DEFAULT_SYNTHETIC_FAILURE_RATE = 0.0  # Fraction of requests that fail (0-1)
+DEFAULT_SYNTHETIC_REALTIME_FACTOR = 10.0  # Audio delivered this many times faster than it plays
+DEFAULT_SYNTHETIC_SEED = 0  # Seed for latency and failure draws
 
 # Privacy
 DEFAULT_LOG_PREVIEW = True  # Show text preview in console/logs
@@ -82,7 +116,34 @@ LOG_FILE = "herald.log"
 LOG_ROTATION = "1 day"  # Daily rotation (was 10MB — too high, never triggered)
 LOG_RETENTION = "7 days"
 
-# Engine: "edge" (online, better quality) or "pyttsx3" (offline)
+# Tracing (per-utterance latency spans, see tracing.py)
+DEFAULT_TRACING = False  # Append spans to TRACE_FILE
+TRACE_FILE = PROJECT_ROOT / LOG_DIR / "trace.jsonl"
+
+# Metrics (counters and latency histograms, see metrics.py; also in the tray Diagnostics menu)
+DEFAULT_METRICS_PORT = 0  # Serve Prometheus text at http://127.0.0.1:<port>/metrics (0 = off)
+
+# Profiling sessions (tray Diagnostics > Profiling, see profiler.py)
+PROFILE_DIR = PROJECT_ROOT / LOG_DIR
+
+# Resource monitor (leak tracking in the heartbeat, see resource_monitor.py)
+DEFAULT_RESOURCE_MONITOR = False  # Sample RSS, heap, threads, temp files and cache size each heartbeat
+TEMP_DIR = PROJECT_ROOT / "temp"
+DEFAULT_RESOURCE_MONITOR_WINDOW = 10  # Heartbeats (1 min each) of steady growth before warning
+DEFAULT_RESOURCE_GROWTH_THRESHOLDS = {  # Growth over one window that is flagged as a possible leak
+    "rss_mb": 50,
+    "traced_mb": 20,
+    "threads": 5,
+    "temp_files": 5,
+}  # The audio cache size is logged but not checked: its LRU cap (audio_cache_max_mb) already bounds it
+
+# User filter rules (skip/keep/replace patterns, see filter_rules.py); reloaded when the file changes
+FILTER_RULES_FILE = CONFIG_DIR / "filter_rules.json"
+
+# Pronunciation dictionary (term -> spoken form, see pronunciation.py); reloaded when the file changes
+PRONUNCIATION_FILE = CONFIG_DIR / "pronunciation.json"
+
+# Engine: "edge" (online, better quality), "pyttsx3" (offline) or "synthetic" (testing)
 DEFAULT_ENGINE = "edge"
 
 # Default settings structure
@@ -108,6 +169,15 @@ DEFAULT_SETTINGS = {
     "auto_read": DEFAULT_AUTO_READ,
     "filter_code": DEFAULT_FILTER_CODE,
     "normalize_text": DEFAULT_NORMALIZE_TEXT,
+    "stream_audio": DEFAULT_STREAM_AUDIO,
+    "gapless_lines": DEFAULT_GAPLESS_LINES,
+    "time_stretch": DEFAULT_TIME_STRETCH,
+    "audio_cache_dir": DEFAULT_AUDIO_CACHE_DIR,
+    "audio_cache_max_mb": DEFAULT_AUDIO_CACHE_MAX_MB,
+    "audio_cache_max_age_days": DEFAULT_AUDIO_CACHE_MAX_AGE_DAYS,
+    "tracing": DEFAULT_TRACING,
+    "metrics_port": DEFAULT_METRICS_PORT,
+    "resource_monitor": DEFAULT_RESOURCE_MONITOR,
 }
 
 
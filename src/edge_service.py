@@ -0,0 +1,218 @@
+"""
+Herald Edge TTS Generation Service
+
+Runs all edge-tts requests on one long-lived asyncio event loop in a
+background thread, instead of a new thread + asyncio.run() per request.
+Callers get a concurrent.futures.Future (whole-utterance audio) or a
+StreamHandle (audio chunks as they arrive).
+"""
+
+import asyncio
+import queue
+import threading
+import time
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import Future
+from urllib.parse import urlparse
+from loguru import logger
+
+from metrics import REGISTRY
+
+# Host of the edge-tts WebSocket endpoint (resolved during warm-up)
+EDGE_HOST = "speech.platform.bing.com"
+
+# edge-tts requests audio-24khz-48kbitrate-mono-mp3, a constant bitrate stream
+EDGE_MP3_BITRATE = 48_000
+
+_STREAM_END = object()  # Sentinel marking the end of a StreamHandle
+
+GENERATION_SECONDS = REGISTRY.histogram("herald_generation_seconds", "Time to generate an utterance's audio")
+FIRST_CHUNK_SECONDS = REGISTRY.histogram("herald_first_chunk_seconds", "Time from request to first audio chunk")
+GENERATION_FAILURES = REGISTRY.counter(
+    "herald_generation_failures_total", "Generation requests that failed or timed out"
+)
+
+
+def mp3_duration(audio: bytes) -> float:
+    """Playback length in seconds of edge-tts MP3 audio."""
+    return len(audio) * 8 / EDGE_MP3_BITRATE
+
+
+class StreamHandle:
+    """Thread-safe view of an in-progress streamed generation.
+
+    Iterate from any thread to receive MP3 chunks as they arrive. Iteration
+    raises the generation's exception if it failed.
+    """
+
+    def __init__(self):
+        self._chunks: queue.Queue = queue.Queue()
+        self._future: Future | None = None
+        self.cancelled = False
+        self.first_chunk_latency: float | None = None  # Seconds from submit to first chunk
+
+    def __iter__(self) -> Iterator[bytes]:
+        while True:
+            item = self._chunks.get()
+            if item is _STREAM_END:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+
+    def cancel(self):
+        """Abort the generation; iteration ends after any chunks already received."""
+        self.cancelled = True
+        if self._future:
+            self._future.cancel()
+        self._chunks.put(_STREAM_END)
+
+
+class EdgeGenerationService:
+    """One background event loop shared by every edge-tts request of an engine."""
+
+    def __init__(self, endpoint: str = ""):
+        """
+        Args:
+            endpoint: WebSocket URL of the read-aloud service ("" = Microsoft's),
+                e.g. a local stand-in server for offline benchmarks
+        """
+        self._endpoint = endpoint
+        self._host = urlparse(endpoint).hostname if endpoint else EDGE_HOST
+        self._overrides = 0  # Requests using the endpoint override (event loop thread only)
+        self._default_wss_url: str | None = None  # edge-tts's own URL while overridden
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run_loop, daemon=True, name="edge_tts_loop")
+        self._thread.start()
+
+        # Pay one-time costs (module import, DNS) before the first utterance
+        asyncio.run_coroutine_threadsafe(self._warm_up(), self._loop)
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    async def _warm_up(self):
+        """Import edge-tts and resolve the service host ahead of the first request.
+
+        edge-tts opens a fresh WebSocket per request and closes any connector it
+        is given, so the connection itself can't be pooled; this removes the
+        remaining per-process setup from the first line's latency.
+        """
+        start = time.time()
+        try:
+            import edge_tts  # noqa: F401
+
+            await self._loop.getaddrinfo(self._host, 443)
+            logger.debug(f"Edge TTS warm-up done in {time.time() - start:.2f}s")
+        except Exception as e:
+            logger.debug(f"Edge TTS warm-up failed (will retry on first request): {e}")
+
+    def submit(self, text: str, voice_id: str, rate: str, timeout: float) -> Future:
+        """Generate audio for text; the future resolves to the complete MP3 bytes."""
+        return asyncio.run_coroutine_threadsafe(self._generate(text, voice_id, rate, timeout), self._loop)
+
+    def stream(self, text: str, voice_id: str, rate: str, timeout: float) -> StreamHandle:
+        """Generate audio for text, delivering MP3 chunks through the returned handle."""
+        handle = StreamHandle()
+        handle._future = asyncio.run_coroutine_threadsafe(
+            self._stream(text, voice_id, rate, handle, timeout), self._loop
+        )
+        return handle
+
+    def _wss_url(self) -> str:
+        """Service URL for edge-tts (it appends its own "&ConnectionId=..." parameters)."""
+        from edge_tts import constants
+
+        if not self._endpoint:
+            return constants.WSS_URL
+        separator = "&" if "?" in self._endpoint else "?"
+        return f"{self._endpoint}{separator}TrustedClientToken={constants.TRUSTED_CLIENT_TOKEN}"
+
+    async def _audio_chunks(self, text: str, voice_id: str, rate: str) -> AsyncIterator[bytes]:
+        """Yield MP3 audio for text as it arrives from the service."""
+        import edge_tts
+        import edge_tts.communicate
+
+        # edge-tts has no endpoint parameter, so a custom endpoint replaces its module-level
+        # URL while this service has requests running, and is put back after the last one
+        if self._endpoint:
+            if not self._overrides:
+                self._default_wss_url = edge_tts.communicate.WSS_URL
+                edge_tts.communicate.WSS_URL = self._wss_url()
+            self._overrides += 1
+        try:
+            communicate = edge_tts.Communicate(text, voice_id, rate=rate)
+            async for chunk in communicate.stream():
+                if chunk["type"] == "audio":
+                    yield chunk["data"]
+        finally:
+            if self._endpoint:
+                self._overrides -= 1
+                if not self._overrides:
+                    self._restore_wss_url()
+
+    def _restore_wss_url(self):
+        """Give edge-tts back its own service URL if this service replaced it."""
+        if self._default_wss_url is None:
+            return
+        import edge_tts.communicate
+
+        edge_tts.communicate.WSS_URL = self._default_wss_url
+        self._default_wss_url = None
+        self._overrides = 0
+
+    async def _generate(self, text: str, voice_id: str, rate: str, timeout: float) -> bytes:
+        submitted = time.time()
+        audio = bytearray()
+
+        async def collect():
+            async for data in self._audio_chunks(text, voice_id, rate):
+                if not audio:
+                    FIRST_CHUNK_SECONDS.observe(time.time() - submitted)
+                audio.extend(data)
+
+        try:
+            await asyncio.wait_for(collect(), timeout=timeout)
+        except Exception:
+            GENERATION_FAILURES.inc()
+            raise
+        GENERATION_SECONDS.observe(time.time() - submitted)
+        return bytes(audio)
+
+    async def _stream(self, text: str, voice_id: str, rate: str, handle: StreamHandle, timeout: float):
+        submitted = time.time()
+
+        async def pump():
+            async for data in self._audio_chunks(text, voice_id, rate):
+                if handle.first_chunk_latency is None:
+                    handle.first_chunk_latency = time.time() - submitted
+                    FIRST_CHUNK_SECONDS.observe(handle.first_chunk_latency)
+                handle._chunks.put(data)
+
+        try:
+            await asyncio.wait_for(pump(), timeout=timeout)
+            GENERATION_SECONDS.observe(time.time() - submitted)
+            handle._chunks.put(_STREAM_END)
+        except asyncio.CancelledError:
+            handle._chunks.put(_STREAM_END)
+            raise
+        except Exception as e:
+            GENERATION_FAILURES.inc()
+            handle._chunks.put(e)
+
+    def shutdown(self):
+        """Cancel running requests (closing their connections), then stop the event loop thread."""
+        try:
+            asyncio.run_coroutine_threadsafe(self._cancel_requests(), self._loop).result(timeout=2)
+        except Exception as e:
+            logger.debug(f"Edge TTS requests not cancelled cleanly on shutdown: {e}")
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=2)
+        self._restore_wss_url()  # In case a request never reached its finally
+
+    async def _cancel_requests(self):
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
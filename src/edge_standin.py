@@ -0,0 +1,243 @@
+"""
+Herald Edge Stand-in Server
+
+Local WebSocket server speaking the subset of the Edge read-aloud protocol
+that edge_tts.Communicate uses, so the real online generation path (edge-tts,
+timeouts, prefetch concurrency, streaming) can be benchmarked without
+internet under reproducible network conditions:
+- Silent MP3 audio chunks sized to the text and requested rate
+- WordBoundary / SentenceBoundary metadata with matching offsets
+- Scripted first-chunk latency, jitter, delivery speed, failures and stalls
+
+Point Herald at it with the "edge_endpoint" setting, e.g.
+    python src/edge_standin.py --port 8765 --latency-ms 200
+    "edge_endpoint": "ws://127.0.0.1:8765/edge/v1"
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import re
+import threading
+import uuid
+from html import unescape
+from loguru import logger
+
+from aiohttp import WSMsgType, web
+
+from synthetic_service import CHUNK_FRAMES, MP3_FRAME, MP3_FRAME_SECONDS, rate_modifier_to_wpm, synthetic_audio
+
+# Metadata offsets and durations are in 100 ns ticks
+TICKS_PER_SECOND = 10_000_000
+
+SSML_TEXT_PATTERN = re.compile(r"<prosody[^>]*\brate='([^']*)'[^>]*>(.*?)</prosody>", re.DOTALL)
+
+
+def _text_message(request_id: str, path: str, body: str) -> str:
+    return f"X-RequestId:{request_id}\r\nContent-Type:application/json; charset=utf-8\r\nPath:{path}\r\n\r\n{body}"
+
+
+def _audio_message(request_id: str, data: bytes) -> bytes:
+    """Binary frame: 2-byte big-endian header length, headers, then MP3 data."""
+    content_type = "Content-Type:audio/mpeg\r\n" if data else ""
+    header = f"X-RequestId:{request_id}\r\n{content_type}Path:audio\r\n".encode()
+    return len(header).to_bytes(2, "big") + header + data
+
+
+def _boundaries(text: str, rate: str, word_boundary: bool) -> list[dict]:
+    """Boundary metadata spread evenly over the synthetic audio's duration."""
+    words = text.split()
+    if not words:
+        return []
+    word_ticks = int(60 / rate_modifier_to_wpm(rate) * TICKS_PER_SECOND)
+    if not word_boundary:
+        return [{"Type": "SentenceBoundary", "Data": _boundary_data(0, word_ticks * len(words), " ".join(words))}]
+    return [
+        {"Type": "WordBoundary", "Data": _boundary_data(i * word_ticks, word_ticks, word)}
+        for i, word in enumerate(words)
+    ]
+
+
+def _boundary_data(offset: int, duration: int, text: str) -> dict:
+    return {
+        "Offset": offset,
+        "Duration": duration,
+        "text": {"Text": text, "Length": len(text), "BoundaryType": "WordBoundary"},
+    }
+
+
+class EdgeStandInServer:
+    """Edge read-aloud protocol stand-in, run on its own event loop thread."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.2,
+        jitter: float = 0.05,
+        realtime_factor: float = 10.0,
+        failure_rate: float = 0.0,
+        stall_rate: float = 0.0,
+        seed: int = 0,
+    ):
+        """
+        Args:
+            host: Interface to listen on
+            port: Port to listen on (0 = pick a free one)
+            latency: Seconds between the SSML request and the first audio chunk
+            jitter: Latency varies uniformly by up to this many seconds either way
+            realtime_factor: Audio delivered this many times faster than it plays
+            failure_rate: Fraction of connections (0-1) rejected with HTTP 503
+            stall_rate: Fraction of requests (0-1) that never answer (exercises timeouts)
+            seed: Seed for latency, failure and stall draws
+        """
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.jitter = jitter
+        self.realtime_factor = realtime_factor
+        self.failure_rate = failure_rate
+        self.stall_rate = stall_rate
+        self._random = random.Random(seed)
+
+        # Counters for benchmarks (updated on the server loop thread)
+        self.requests = 0
+        self.failures = 0
+        self.stalls = 0
+        self.active = 0
+        self.peak_active = 0  # Most requests in flight at once
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._runner: web.AppRunner | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """Endpoint to use as the "edge_endpoint" setting."""
+        return f"ws://{self.host}:{self.port}/edge/v1"
+
+    def start(self) -> str:
+        """Start serving in a background thread and return the endpoint URL."""
+        self._loop = asyncio.new_event_loop()
+        ready = threading.Event()
+
+        def run():
+            asyncio.set_event_loop(self._loop)
+            self._loop.run_until_complete(self._start_site())
+            ready.set()
+            self._loop.run_forever()
+
+        self._thread = threading.Thread(target=run, daemon=True, name="edge_standin")
+        self._thread.start()
+        ready.wait(timeout=5)
+        logger.info(f"Edge stand-in listening on {self.url}")
+        return self.url
+
+    async def _start_site(self):
+        app = web.Application()
+        app.router.add_get("/{tail:.*}", self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+
+    def stop(self):
+        """Close all connections and stop the server thread."""
+        if not self._loop:
+            return
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result(timeout=5)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=2)
+        self._loop = None
+
+    async def _handle(self, request: web.Request) -> web.StreamResponse:
+        if self._random.random() < self.failure_rate:
+            self.failures += 1
+            return web.Response(status=503, text="Stand-in failure")
+
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+
+        word_boundary = False
+        async for message in ws:
+            if message.type != WSMsgType.TEXT:
+                continue
+            headers, _, body = message.data.partition("\r\n\r\n")
+            if "Path:speech.config" in headers:
+                word_boundary = '"wordBoundaryEnabled":"true"' in body
+            elif "Path:ssml" in headers:
+                await self._answer(ws, body, word_boundary)
+        return ws
+
+    async def _answer(self, ws: web.WebSocketResponse, ssml: str, word_boundary: bool):
+        """Reply to one SSML request: turn.start, metadata, audio chunks, turn.end."""
+        self.requests += 1
+        self.active += 1
+        self.peak_active = max(self.peak_active, self.active)
+        try:
+            stall = self._random.random() < self.stall_rate
+            delay = max(0.0, self.latency + self._random.uniform(-self.jitter, self.jitter))
+            if stall:
+                self.stalls += 1
+                await ws.receive()  # Hold the connection until the client gives up
+                return
+
+            match = SSML_TEXT_PATTERN.search(ssml)
+            rate, text = (match.group(1), unescape(match.group(2))) if match else ("+0%", "")
+            request_id = uuid.uuid4().hex
+
+            await ws.send_str(_text_message(request_id, "turn.start", '{"context":{"serviceTag":"standin"}}'))
+            await asyncio.sleep(delay)
+
+            for boundary in _boundaries(text, rate, word_boundary):
+                await ws.send_str(_text_message(request_id, "audio.metadata", json.dumps({"Metadata": [boundary]})))
+
+            audio = synthetic_audio(text, rate)
+            chunk_size = CHUNK_FRAMES * len(MP3_FRAME)
+            interval = CHUNK_FRAMES * MP3_FRAME_SECONDS / self.realtime_factor
+            for i in range(0, len(audio), chunk_size):
+                await ws.send_bytes(_audio_message(request_id, audio[i : i + chunk_size]))
+                await asyncio.sleep(interval)
+
+            await ws.send_bytes(_audio_message(request_id, b""))  # End of audio (no Content-Type)
+            await ws.send_str(_text_message(request_id, "turn.end", "{}"))
+        except ConnectionResetError:
+            logger.debug("Edge stand-in: client disconnected mid-response")
+        finally:
+            self.active -= 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the Edge read-aloud TTS service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=200, help="delay before the first audio chunk")
+    parser.add_argument("--jitter-ms", type=float, default=50, help="uniform latency variation either way")
+    parser.add_argument("--realtime-factor", type=float, default=10, help="audio delivered this many times faster")
+    parser.add_argument("--failure-rate", type=float, default=0, help="fraction of connections rejected (503)")
+    parser.add_argument("--stall-rate", type=float, default=0, help="fraction of requests never answered")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    server = EdgeStandInServer(
+        host=args.host,
+        port=args.port,
+        latency=args.latency_ms / 1000,
+        jitter=args.jitter_ms / 1000,
+        realtime_factor=args.realtime_factor,
+        failure_rate=args.failure_rate,
+        stall_rate=args.stall_rate,
+        seed=args.seed,
+    )
+    server.start()
+    print(f'Set "edge_endpoint": "{server.url}" in config/settings.json - Ctrl+C to stop')
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,324 @@
+"""
+Herald Filter Rules
+
+Site-specific line rules in config/filter_rules.json, on top of the built-in filters:
+- skip: lines matching a pattern are never read
+- keep: lines matching a pattern are always read, even if a built-in code filter
+  or a skip rule matches (blank/symbol-only lines and code blocks are still dropped)
+- replace: text matching a pattern is replaced before normalization ("k8s" -> "kubernetes")
+
+Each kind is compiled into one regex when the file loads, and the file is
+reloaded when it changes. Patterns that could backtrack catastrophically
+(nested quantifiers, ambiguous repeated alternatives) are rejected with a warning.
+
+Example (config/filter_rules.example.json):
+    {
+      "skip": [{"name": "kubectl", "pattern": "^kubectl\\s"}],
+      "keep": ["^Note:"],
+      "replace": [{"pattern": "\\bk8s\\b", "with": "kubernetes", "ignore_case": true}]
+    }
+"""
+
+import re
+import string
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from loguru import logger
+
+from metrics import REGISTRY
+from watched_file import WatchedJsonFile
+
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+except ImportError:  # pragma: no cover - Python 3.10
+    import sre_parse
+
+RULE_KINDS = ("skip", "keep", "replace")
+
+# Possessive repeats and atomic groups (Python 3.11+) never give back what they matched
+_NO_BACKTRACKING = {
+    getattr(sre_parse, name) for name in ("POSSESSIVE_REPEAT", "ATOMIC_GROUP") if hasattr(sre_parse, name)
+}
+
+# Longest pattern accepted (keeps one bad rule from slowing every line)
+MAX_PATTERN_LENGTH = 500
+
+# Characters tried against repeated alternatives to find ones that overlap
+_PROBE_CHARS = string.printable + "éß漢─"
+
+
+# All rules together; per-rule counts live on the RuleSet, since rule names are free text
+RULE_HITS = REGISTRY.counter("herald_filter_rule_hits_total", "Lines matched by user filter rules")
+
+
+class Rule:
+    """One rule from the rules file."""
+
+    def __init__(self, kind: str, name: str, pattern: str, ignore_case: bool = False, replacement: str = ""):
+        self.kind = kind
+        self.name = name
+        self.pattern = pattern
+        self.ignore_case = ignore_case
+        self.replacement = replacement
+
+
+def pattern_problem(pattern: str) -> str | None:
+    """Why a pattern can't be used as a rule, or None if it's fine."""
+    if len(pattern) > MAX_PATTERN_LENGTH:
+        return f"longer than {MAX_PATTERN_LENGTH} characters"
+    try:
+        compiled = re.compile(f"(?:{pattern})")  # As it will be combined (no global flags mid-pattern)
+        parsed = sre_parse.parse(pattern)
+    except re.error as e:
+        return f"invalid regex: {e}"
+    if compiled.groupindex:
+        return "named groups aren't supported"
+    return _backtracking_problem(parsed)
+
+
+def _backtracking_problem(parsed) -> str | None:
+    """Find constructs that backtrack exponentially on lines that almost match.
+
+    A repeat whose body can split the same text in more than one way - a
+    variable-length repeat nothing delimits, like (a+)+ or (.*x)+, or
+    alternatives that start with the same character, like (a|aa)* - tries every
+    split before giving up. Possessive and atomic forms (a++, (?>...)) can't.
+    """
+    for op, av in parsed:
+        if op is sre_parse.GROUPREF or op is sre_parse.GROUPREF_EXISTS:
+            return "backreferences aren't supported"
+        if op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT):
+            _, high, body = av
+            problem = (_repeated_body_problem(body) if high > 1 else None) or _backtracking_problem(body)
+        elif op is sre_parse.BRANCH:
+            problem = next(filter(None, (_backtracking_problem(branch) for branch in av[1])), None)
+        elif op is sre_parse.SUBPATTERN:
+            problem = _backtracking_problem(av[-1])
+        elif op in (sre_parse.ASSERT, sre_parse.ASSERT_NOT):
+            problem = _backtracking_problem(av[1])
+        else:
+            problem = None
+        if problem:
+            return problem
+    return None
+
+
+def _repeated_body_problem(body) -> str | None:
+    items = _unwrap(body)
+    if len(items) == 1 and items[0][0] is sre_parse.BRANCH:
+        branches = items[0][1][1]
+        firsts = [chars for chars in (_first_chars(branch) for branch in branches) if chars is not None]
+        if any(firsts[i] & firsts[j] for i in range(len(firsts)) for j in range(i + 1, len(firsts))):
+            return "repeated alternatives can match the same text, e.g. (a|aa)*"
+        return next(filter(None, (_repeated_body_problem(branch) for branch in branches)), None)
+
+    # Variable-length parts need a required character they can't match to split them
+    # apart ("\w+\." can only split one way, "\w+\w" or "a(?:a)?" can split many)
+    delimiters = [(i, chars) for i, item in enumerate(items) if (chars := _required_chars(item)) is not None]
+    for i, item in enumerate(items):
+        low, high = sre_parse.SubPattern(items.state, [item]).getwidth()
+        if low == high or item[0] in _NO_BACKTRACKING:
+            continue
+        chars = _variable_chars(item)
+        if chars is None or not any(j != i and chars.isdisjoint(other) for j, other in delimiters):
+            return "nested quantifiers can backtrack catastrophically, e.g. (a+)+ (a++ or (?>a+) are fine)"
+    return None
+
+
+def _unwrap(parsed):
+    """A (sub)pattern, looking through groups that are the whole of it."""
+    while len(parsed) == 1 and parsed[0][0] is sre_parse.SUBPATTERN:
+        parsed = parsed[0][1][-1]
+    return parsed
+
+
+def _variable_chars(item) -> set[str] | None:
+    """Characters a variable-length item can consume, if it's a simple repeat or choice of characters."""
+    op, av = item
+    if op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT):
+        return _atom_chars(av[2])
+    if op is sre_parse.BRANCH:
+        chars = set()
+        for branch in av[1]:
+            if len(branch):
+                branch_chars = _atom_chars(branch)
+                if branch_chars is None:
+                    return None
+                chars |= branch_chars
+        return chars
+    return None
+
+
+def _first_chars(parsed) -> set[str] | None:
+    """Characters a (sub)pattern can start with, or None if that's not simple to tell."""
+    items = [item for item in _unwrap(parsed) if item[0] is not sre_parse.AT]
+    if not items:
+        return None
+    return _required_chars(items[0])
+
+
+def _required_chars(item) -> set[str] | None:
+    """Characters a required single-character item (or its 1+ repeat) matches, else None."""
+    op, av = item
+    if op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT):
+        return _atom_chars(av[2]) if av[0] >= 1 else None
+    return _atom_chars(sre_parse.SubPattern(None, [item]))
+
+
+def _atom_chars(parsed) -> set[str] | None:
+    """Probe characters matched by a single-character item, or None if it isn't one."""
+    items = _unwrap(parsed)
+    if len(items) != 1:
+        return None
+    op, av = items[0]
+    try:
+        if op is sre_parse.LITERAL:
+            atom = re.escape(chr(av))
+        elif op is sre_parse.NOT_LITERAL:
+            atom = f"[^{re.escape(chr(av))}]"
+        elif op is sre_parse.ANY:
+            atom = "."
+        elif op is sre_parse.IN:
+            atom = "[" + "".join(_class_item(entry) for entry in av) + "]"
+        else:
+            return None
+        regex = re.compile(atom)
+    except (KeyError, re.error):
+        return None
+    return {c for c in _PROBE_CHARS if regex.fullmatch(c)}
+
+
+_CATEGORIES = {
+    "CATEGORY_DIGIT": r"\d",
+    "CATEGORY_NOT_DIGIT": r"\D",
+    "CATEGORY_SPACE": r"\s",
+    "CATEGORY_NOT_SPACE": r"\S",
+    "CATEGORY_WORD": r"\w",
+    "CATEGORY_NOT_WORD": r"\W",
+}
+
+
+def _class_item(entry) -> str:
+    op, av = entry
+    if op is sre_parse.LITERAL:
+        return re.escape(chr(av))
+    if op is sre_parse.RANGE:
+        return f"{re.escape(chr(av[0]))}-{re.escape(chr(av[1]))}"
+    if op is sre_parse.NEGATE:
+        return "^"
+    return _CATEGORIES[str(av)]  # CATEGORY (KeyError for anything else)
+
+
+class RuleSet:
+    """Rules of each kind compiled into one regex ("r<index>" groups map back to the rule), with hit counts."""
+
+    def __init__(self, rules: list[Rule] | None = None):
+        self.rules = rules or []
+        self._hits = dict.fromkeys(self.rules, 0)
+        self._hits_lock = threading.Lock()
+        self._matchers: dict[str, tuple[re.Pattern, dict[str, Rule]] | None] = {
+            kind: self._compile([rule for rule in self.rules if rule.kind == kind]) for kind in RULE_KINDS
+        }
+
+    def __bool__(self) -> bool:
+        return bool(self.rules)
+
+    @staticmethod
+    def _compile(rules: list[Rule]) -> tuple[re.Pattern, dict[str, Rule]] | None:
+        if not rules:
+            return None
+        groups = {f"r{i}": rule for i, rule in enumerate(rules)}
+        pattern = "|".join(
+            f"(?P<{group}>(?i:{rule.pattern}))" if rule.ignore_case else f"(?P<{group}>(?:{rule.pattern}))"
+            for group, rule in groups.items()
+        )
+        return re.compile(pattern), groups
+
+    def _search(self, kind: str, line: str) -> Rule | None:
+        matcher = self._matchers[kind]
+        if matcher is None:
+            return None
+        regex, groups = matcher
+        match = regex.search(line)
+        if not match:
+            return None
+        rule = groups[match.lastgroup]
+        self._count_hit(rule)
+        return rule
+
+    def _count_hit(self, rule: Rule):
+        with self._hits_lock:
+            self._hits[rule] += 1
+        RULE_HITS.inc()
+
+    def keeps(self, line: str) -> bool:
+        """Whether a keep rule matches (the line is read whatever else matches)."""
+        return self._search("keep", line) is not None
+
+    def skip_rule(self, line: str) -> str | None:
+        """Name of the first skip rule matching the line, or None."""
+        rule = self._search("skip", line)
+        return rule.name if rule else None
+
+    def replace(self, text: str) -> str:
+        """Apply every replace rule (one pass; earlier rules win where matches overlap)."""
+        matcher = self._matchers["replace"]
+        if matcher is None:
+            return text
+        regex, groups = matcher
+
+        def substitute(match: re.Match) -> str:
+            rule = groups[match.lastgroup]
+            self._count_hit(rule)
+            return rule.replacement
+
+        return regex.sub(substitute, text)
+
+    def hit_counts(self) -> list[tuple[str, int]]:
+        """(kind:name, hits) for every rule, most hits first."""
+        with self._hits_lock:
+            counts = [(f"{rule.kind}:{rule.name}", self._hits[rule]) for rule in self.rules]
+        return sorted(counts, key=lambda item: item[1], reverse=True)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "RuleSet":
+        """Build from the rules file's contents, leaving out (and logging) rules that can't be used."""
+        rules = []
+        for kind in RULE_KINDS:
+            for index, entry in enumerate(data.get(kind, [])):
+                if isinstance(entry, str):
+                    entry = {"pattern": entry}
+                if not isinstance(entry, dict) or not isinstance(entry.get("pattern"), str):
+                    logger.warning(f'Filter rule {kind}[{index}] ignored: needs a "pattern" string')
+                    continue
+                name = str(entry.get("name") or entry["pattern"])
+                problem = pattern_problem(entry["pattern"])
+                if kind == "replace" and not isinstance(entry.get("with"), str):
+                    problem = 'needs a "with" string'
+                if problem:
+                    logger.warning(f"Filter rule {kind} '{name}' ignored: {problem}")
+                    continue
+                rules.append(Rule(kind, name, entry["pattern"], bool(entry.get("ignore_case")), entry.get("with", "")))
+        return cls(rules)
+
+
+def _describe(rules: RuleSet) -> str:
+    counts = ", ".join(f"{sum(rule.kind == kind for rule in rules.rules)} {kind}" for kind in RULE_KINDS)
+    return f"{len(rules.rules)} filter rules ({counts})"
+
+
+class RulesFile(WatchedJsonFile):
+    """The rules file, recompiled when it changes."""
+
+    def __init__(self, path: Path | str, on_reload: Callable[[], None] | None = None):
+        """
+        Args:
+            path: JSON rules file (it's fine for it not to exist)
+            on_reload: Called after the rules change (e.g. to drop cached results)
+        """
+        super().__init__(path, RuleSet.from_dict, RuleSet(), _describe, on_reload)
+
+    def rules(self) -> RuleSet:
+        """Current rules - one stat() per call, recompiling only when the file changed."""
+        return self.current()
@@ -0,0 +1,80 @@
+"""
+Herald Line Queue
+
+Lines to read, filled from a lazy source (text_filter.iter_speakable_lines)
+on a background thread so the first line can be spoken straight away:
+- Indexing and len() cover the lines produced so far
+- wait_for() blocks until a line exists or the source is exhausted
+- close() stops filling when the queue is cleared or replaced
+"""
+
+import threading
+import time
+from collections.abc import Iterable
+from loguru import logger
+
+from tracing import NULL_TRACE, Trace
+
+
+class LineQueue:
+    """Append-only list of lines, filled from an iterable on a daemon thread."""
+
+    def __init__(self, source: Iterable[str] | None = None, trace: Trace = NULL_TRACE):
+        """
+        Args:
+            source: Lines to read; None makes an empty, already complete queue
+            trace: Trace to record the fill span on
+        """
+        self._lines: list[str] = []
+        self._condition = threading.Condition()
+        self._filling = source is not None
+        self._closed = False
+        self.trace = trace  # Trace of the read these lines belong to
+        if source is not None:
+            threading.Thread(target=self._fill, args=(source,), daemon=True, name="line_queue").start()
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    def __getitem__(self, index):
+        return self._lines[index]
+
+    @property
+    def filling(self) -> bool:
+        """True while the source may still produce more lines."""
+        return self._filling
+
+    @property
+    def total_label(self) -> str:
+        """Line count for logs: "120", or "120+" while still filling."""
+        return f"{len(self._lines)}+" if self._filling else str(len(self._lines))
+
+    def wait_for(self, index: int, timeout: float | None = None) -> bool:
+        """Wait until line index exists or filling ends. Returns whether it exists."""
+        with self._condition:
+            self._condition.wait_for(lambda: index < len(self._lines) or not self._filling, timeout)
+            return index < len(self._lines)
+
+    def close(self):
+        """Stop filling; lines already produced stay readable."""
+        self._closed = True
+
+    def _fill(self, source: Iterable[str]):
+        start = time.time()
+        iterator = iter(source)
+        try:
+            for line in iterator:
+                if self._closed:
+                    break
+                with self._condition:
+                    self._lines.append(line)
+                    self._condition.notify_all()
+        except Exception as e:
+            logger.error(f"Preparing lines failed after {len(self._lines)} lines: {e}")
+        finally:
+            if hasattr(iterator, "close"):
+                iterator.close()  # Generators can only be closed from the thread running them
+            with self._condition:
+                self._filling = False
+                self._condition.notify_all()
+            self.trace.add("prepare_lines", start, time.time(), lines=len(self._lines), cancelled=self._closed)
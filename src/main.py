@@ -30,6 +30,7 @@ import warnings
 # See: https://github.com/pygame/pygame/issues - pygame needs to update to importlib.resources
 # TODO: Remove this filter once pygame updates their pkgdata.py
 warnings.filterwarnings("ignore", message="pkg_resources is deprecated", category=UserWarning)
+import threading
 import time
 import ctypes
 import pyperclip
@@ -55,6 +56,7 @@ from config import (
     set_setting,
     save_settings,
     DEFAULT_LINE_DELAY,
+    LINE_WAIT_TIMEOUT,
     DEFAULT_READ_MODE,
     DEFAULT_LOG_PREVIEW,
     DEFAULT_AUTO_COPY,
@@ -64,13 +66,25 @@ from config import (
     DEFAULT_AUTO_READ_THRESHOLD,
     DEFAULT_FILTER_CODE,
     DEFAULT_NORMALIZE_TEXT,
+    DEFAULT_TRACING,
+    TRACE_FILE,
+    DEFAULT_METRICS_PORT,
+    PROFILE_DIR,
+    DEFAULT_RESOURCE_MONITOR,
+    DEFAULT_RESOURCE_MONITOR_WINDOW,
+    TEMP_DIR,
 )
-from tts_engine import get_engine, switch_engine, EdgeTTSEngine, Pyttsx3Engine
+from tts_engine import get_engine, switch_engine, set_playback_listener, EdgeTTSEngine, Pyttsx3Engine
 from text_grab import get_content_to_speak, ocr_image
-from text_filter import filter_lines, normalize_for_speech
+from text_filter import iter_speakable_lines, pronunciations, user_rules
+from line_queue import LineQueue
 from region_capture import select_and_capture
 from persistent_region import PersistentRegion, set_persistent_region
 from tray_app import TrayApp
+from tracing import NULL_TRACE, Trace, configure_tracing, start_trace
+from metrics import REGISTRY, start_metrics_server, summary_lines
+from profiler import ProfilingSession
+from resource_monitor import ResourceMonitor
 from utils import setup_logging
 
 
@@ -135,9 +149,10 @@ _tray_app: TrayApp | None = None
 _console_visible = True
 _current_hotkeys: dict[str, str] = {}  # setting_key -> current hotkey string
 
-# Line queue for skip functionality
-_line_queue: list[str] = []
+# Line queue for skip functionality (filled in the background as lines are prepared)
+_line_queue = LineQueue()
 _current_line_index = 0
+_line_pending = False  # Current line is still being prepared; the main loop speaks it when ready
 _was_speaking = False  # Track state for auto-advance
 _line_delay = DEFAULT_LINE_DELAY  # Delay in ms between lines
 _read_mode = DEFAULT_READ_MODE  # "lines" or "continuous"
@@ -159,22 +174,38 @@ _auto_read_queue: queue.Queue = queue.Queue()
 # Action queue: hotkey callbacks dispatch here instead of doing work directly.
 # This prevents Windows from removing the low-level keyboard hook when
 # a callback blocks too long (e.g., waiting on mixer lock or clipboard).
-_action_queue: queue.Queue = queue.Queue()
+_action_queue: queue.Queue = queue.Queue()  # (setting_key, time pressed)
+
+# Hotkeys that start reading text; each press begins a new latency trace, passed to the callback
+_TRACED_HOTKEYS = ("hotkey_speak", "hotkey_ocr")
+
+# Set when the engine finishes a line, waking the main loop to advance immediately
+_playback_finished = threading.Event()
 
 # Heartbeat tracking for diagnostics
 _last_heartbeat = 0.0
 
+# Optional localhost metrics endpoint (metrics_port setting)
+_metrics_server = None
+
+# On-demand profiling (tray Diagnostics > Profiling); started/stopped on the main thread
+_profiling = ProfilingSession(PROFILE_DIR)
+
+# Optional leak tracking sampled with the heartbeat (resource_monitor setting)
+_resource_monitor: ResourceMonitor | None = None
+
 # Tray state tracking to avoid redundant updates (prevents icon blink)
 _last_tray_state: str | None = None  # "idle", "generating", "speaking", "paused"
 
 
-def on_speak_hotkey():
-    """Called when the speak hotkey is pressed."""
+def on_speak_hotkey(trace: Trace = NULL_TRACE):
+    """Called when the speak hotkey is pressed (trace: latency trace of this read)."""
     global _line_queue, _current_line_index
 
     # Check if persistent region is active - use that instead
     if _persistent_region and _persistent_region.is_active:
-        text = _persistent_region.read_now()
+        with trace.span("ocr_region_read"):
+            text = _persistent_region.read_now()
         source = "ocr" if text else "none"
         if text and _ocr_to_clipboard:
             try:
@@ -184,7 +215,8 @@ def on_speak_hotkey():
                 logger.warning(f"Failed to copy text to clipboard: {e}")
     else:
         # Auto-copy selection and get content (text or OCR'd image)
-        text, source = get_content_to_speak(auto_copy=_auto_copy)
+        with trace.span("get_content", auto_copy=_auto_copy):
+            text, source = get_content_to_speak(auto_copy=_auto_copy, trace=trace)
 
     if not text:
         logger.warning("No text to speak (clipboard empty or OCR failed)")
@@ -202,40 +234,37 @@ def on_speak_hotkey():
 
     if _read_mode == "continuous":
         # Original behavior: speak all text as one block
-        _speak_continuous(text)
+        _speak_continuous(text, trace)
     else:
         # Line-by-line mode (default)
-        raw_lines = [line.strip() for line in text.split("\n") if line.strip()]
-        lines = filter_lines(raw_lines, filter_code=_filter_code)
+        lines = _prepare_lines(text, trace)
 
         if not lines:
             logger.warning("No text to speak (only whitespace or filtered)")
             return
 
-        # Apply text normalization if enabled
-        if _normalize_text:
-            lines = [normalize_for_speech(line, filter_paths_urls=_filter_code) for line in lines]
-
+        _line_queue.close()
         _line_queue = lines
         _current_line_index = 0
         _speak_current_line()
 
 
-def on_ocr_region():
-    """Called when the OCR region capture hotkey is pressed."""
+def on_ocr_region(trace: Trace = NULL_TRACE):
+    """Called when the OCR region capture hotkey is pressed (trace: latency trace of this read)."""
     global _line_queue, _current_line_index
 
     logger.info("OCR region capture - select area with mouse...")
 
     # Capture screen region
-    image = select_and_capture()
+    with trace.span("select_region"):
+        image = select_and_capture()
 
     if image is None:
         logger.info("OCR cancelled")
         return
 
     # Run OCR on the captured region
-    text = ocr_image(image)
+    text = ocr_image(image, trace)
 
     if not text:
         logger.warning("OCR found no text in selection")
@@ -254,19 +283,15 @@ def on_ocr_region():
             logger.warning(f"Failed to copy OCR text to clipboard: {e}")
 
     if _read_mode == "continuous":
-        _speak_continuous(text)
+        _speak_continuous(text, trace)
     else:
-        raw_lines = [line.strip() for line in text.split("\n") if line.strip()]
-        lines = filter_lines(raw_lines, filter_code=_filter_code)
+        lines = _prepare_lines(text, trace)
 
         if not lines:
             logger.warning("OCR result was only whitespace or filtered")
             return
 
-        # Apply text normalization if enabled
-        if _normalize_text:
-            lines = [normalize_for_speech(line, filter_paths_urls=_filter_code) for line in lines]
-
+        _line_queue.close()
         _line_queue = lines
         _current_line_index = 0
         _speak_current_line()
@@ -345,6 +370,7 @@ def _process_auto_read_queue():
         return
 
     logger.info(f"Processing auto-read text ({len(text)} chars)")
+    trace = start_trace("auto_read")
 
     # Copy to clipboard if enabled
     if _ocr_to_clipboard:
@@ -356,19 +382,43 @@ def _process_auto_read_queue():
 
     # Speak the text
     if _read_mode == "continuous":
-        _speak_continuous(text)
+        _speak_continuous(text, trace)
     else:
-        raw_lines = [line.strip() for line in text.split("\n") if line.strip()]
-        lines = filter_lines(raw_lines, filter_code=_filter_code)
+        lines = _prepare_lines(text, trace)
         if lines:
-            # Apply text normalization if enabled
-            if _normalize_text:
-                lines = [normalize_for_speech(line, filter_paths_urls=_filter_code) for line in lines]
+            _line_queue.close()
             _line_queue = lines
             _current_line_index = 0
             _speak_current_line()
 
 
+def _prepare_lines(text: str, trace: Trace) -> LineQueue:
+    """Split text into lines to speak, filtered and normalized per settings.
+
+    Returns once the first line is ready (or the text turned out to have none);
+    the rest of the text is prepared in the background while it is read. The
+    queue keeps trace, so every line of the read is recorded on it.
+    """
+    with trace.span("first_line", filter_code=_filter_code, normalize=_normalize_text):
+        lines = LineQueue(
+            iter_speakable_lines(text, filter_code=_filter_code, normalize=_normalize_text),
+            trace=trace,
+        )
+        lines.wait_for(0)
+    return lines
+
+
+def _diagnostics_lines() -> list[str]:
+    """Metrics summary for the tray Diagnostics submenu."""
+    lines = summary_lines()
+    rule_hits = user_rules().hit_counts()
+    if rule_hits:
+        lines.append("Filter rules: " + ", ".join(f"{name} {hits}" for name, hits in rule_hits[:5]))
+    if _metrics_server:
+        lines.append(f"Endpoint: http://127.0.0.1:{_metrics_server.server_address[1]}/metrics")
+    return lines
+
+
 def _process_action_queue():
     """Process queued actions from hotkey callbacks (runs in main thread).
 
@@ -378,14 +428,27 @@ def _process_action_queue():
     """
     while True:
         try:
-            setting_key = _action_queue.get_nowait()
+            setting_key, pressed_at = _action_queue.get_nowait()
         except queue.Empty:
             return
 
+        if setting_key in ("profiling_start", "profiling_stop"):
+            # cProfile only sees the thread that enables it, so this must run here
+            if setting_key == "profiling_start":
+                _profiling.start()
+            else:
+                _profiling.stop()
+            continue
+
         if setting_key in _HOTKEY_REGISTRY:
             callback, _ = _HOTKEY_REGISTRY[setting_key]
             try:
-                callback()
+                if setting_key in _TRACED_HOTKEYS:
+                    trace = start_trace(setting_key, start=pressed_at)
+                    trace.add("hotkey_queue", pressed_at, time.time())
+                    callback(trace)
+                else:
+                    callback()
             except Exception as e:
                 logger.error(f"Error processing {setting_key}: {e}", exc_info=True)
 
@@ -417,7 +480,7 @@ def _recover_keyboard_hooks():
 
 
 def _maybe_log_heartbeat():
-    """Log periodic heartbeat with audio, hook, and thread health."""
+    """Log periodic heartbeat with audio, hook, and thread health (and resource usage if monitored)."""
     global _last_heartbeat
     now = time.time()
     if now - _last_heartbeat >= 60:
@@ -460,9 +523,16 @@ def _maybe_log_heartbeat():
             logger.warning("Keyboard hook thread dead - re-registering hotkeys")
             _recover_keyboard_hooks()
 
+        # Leak tracking (optional): resource readings and steady-growth warnings
+        if _resource_monitor:
+            try:
+                _resource_monitor.sample()
+            except Exception as e:
+                logger.warning(f"Resource monitor sample failed: {e}")
 
-def _speak_continuous(text: str):
-    """Speak all text as one continuous block (original behavior)."""
+
+def _speak_continuous(text: str, trace: Trace):
+    """Speak all text as one continuous stream (generated in sentence chunks)."""
     engine = get_engine()
 
     if _log_preview:
@@ -484,20 +554,34 @@ def _speak_continuous(text: str):
         if _tray_app:
             _tray_app.set_speaking(True)
 
-    engine.speak(text)
+    engine.speak_continuous(text, trace)
 
 
-def _speak_current_line():
-    """Speak the current line from the queue."""
-    global _current_line_index
+def _speak_current_line(timeout: float = LINE_WAIT_TIMEOUT):
+    """Speak the current line from the queue.
 
-    if not _line_queue or _current_line_index >= len(_line_queue):
+    Waits at most timeout for a line that is still being prepared, then leaves
+    it pending for the main loop (see _speak_pending_line) instead of blocking
+    hotkeys until the text filter gets there.
+    """
+    global _line_pending
+
+    if not _line_queue.wait_for(_current_line_index, timeout=timeout):
+        if _line_queue.filling:
+            _line_pending = True
+            return
         logger.info("Finished all lines")
+        if _line_pending:
+            # Skipped past the end while the text was still being prepared
+            get_engine().stop()
+            if _tray_app:
+                _tray_app.set_speaking(False)
         _clear_queue()
         return
+    _line_pending = False
 
     line = _line_queue[_current_line_index]
-    total_lines = len(_line_queue)
+    total_lines = _line_queue.total_label
     line_num = _current_line_index + 1
     engine = get_engine()
 
@@ -517,24 +601,58 @@ def _speak_current_line():
     if isinstance(engine, EdgeTTSEngine):
         if _tray_app:
             _tray_app.set_generating(True)
-
-        # Prefetch next lines while this one plays
-        for offset in range(1, 3):
-            idx = _current_line_index + offset
-            if idx < len(_line_queue):
-                engine.prefetch(_line_queue[idx])
     else:
         if _tray_app:
             _tray_app.set_speaking(True)
 
-    engine.speak(line)
+    engine.speak(line, _line_queue.trace)
+    _prepare_upcoming_lines(engine)
+
+
+def _prepare_upcoming_lines(engine):
+    """Prefetch lines after the current one and queue the next for gapless playback."""
+    if isinstance(engine, EdgeTTSEngine):
+        # Prefetch upcoming lines while this one plays (depth adapts to generation speed).
+        # After speak(), which takes over any in-flight prefetch of the current line.
+        engine.prefetch_ahead(_line_queue, _current_line_index)
+
+    # With no delay between lines, the engine can switch to the next line itself
+    if _line_delay == 0 and _current_line_index + 1 < len(_line_queue):
+        engine.set_next_line(_line_queue[_current_line_index + 1])
+
+
+def _advance_gapless_lines():
+    """Follow lines the engine switched to on its own (gapless playback)."""
+    global _current_line_index
+
+    engine = get_engine()
+    for _ in range(engine.take_lines_advanced()):
+        if not _line_queue or _current_line_index + 1 >= len(_line_queue):
+            return
+        _current_line_index += 1
+        line_num = _current_line_index + 1
+        if _log_preview:
+            line = _line_queue[_current_line_index]
+            preview = f"{line[:40]}..." if len(line) > 40 else line
+            logger.info(f"[{line_num}/{_line_queue.total_label}] Speaking: {preview}")
+        else:
+            logger.info(f"[{line_num}/{_line_queue.total_label}] Speaking...")
+        _prepare_upcoming_lines(engine)
+
+
+def _speak_pending_line():
+    """Speak a line skipped to before it was prepared, once it is (called from the main loop)."""
+    if _line_pending:
+        _speak_current_line(timeout=0)
 
 
 def _clear_queue():
     """Clear the line queue and prefetch cache."""
-    global _line_queue, _current_line_index
-    _line_queue = []
+    global _line_queue, _current_line_index, _line_pending
+    _line_queue.close()
+    _line_queue = LineQueue()
     _current_line_index = 0
+    _line_pending = False
 
     # Clear prefetch cache if using edge-tts
     engine = get_engine()
@@ -549,15 +667,18 @@ def on_next_line():
     if not _line_queue:
         return
 
+    # speak() interrupts the current line itself; a full stop() here would also
+    # cancel the prefetch of the line being skipped to
     engine = get_engine()
-    engine.stop()
 
-    if _current_line_index < len(_line_queue) - 1:
+    # A line still being prepared is spoken once it's ready (without blocking the main loop)
+    if _line_queue.wait_for(_current_line_index + 1, timeout=0) or _line_queue.filling:
         _current_line_index += 1
-        logger.info(f"Skipping to line {_current_line_index + 1}/{len(_line_queue)}")
+        logger.info(f"Skipping to line {_current_line_index + 1}/{_line_queue.total_label}")
         _speak_current_line()
     else:
         logger.info("Already at last line")
+        engine.stop()
         _clear_queue()
         if _tray_app:
             _tray_app.set_speaking(False)
@@ -570,12 +691,9 @@ def on_prev_line():
     if not _line_queue:
         return
 
-    engine = get_engine()
-    engine.stop()
-
     if _current_line_index > 0:
         _current_line_index -= 1
-        logger.info(f"Going back to line {_current_line_index + 1}/{len(_line_queue)}")
+        logger.info(f"Going back to line {_current_line_index + 1}/{_line_queue.total_label}")
         _speak_current_line()
     else:
         logger.info("Already at first line - restarting")
@@ -609,6 +727,13 @@ def on_pause_resume():
             _tray_app.set_paused(True)
 
 
+def _announce_speed(engine, message: str):
+    """Confirm a speed change aloud, unless it's already audible in the line being read."""
+    if engine.rate_changes_live and engine.is_speaking:
+        return
+    engine.speak(message)
+
+
 def on_speed_up():
     """Increase speech rate."""
     engine = get_engine()
@@ -617,10 +742,10 @@ def on_speed_up():
 
     if engine.rate >= MAX_RATE:
         logger.info(f"Speed: {engine.rate} wpm (maximum)")
-        engine.speak("Maximum speed")
+        _announce_speed(engine, "Maximum speed")
     else:
         logger.info(f"Speed: {engine.rate} wpm (faster)")
-        engine.speak("Faster")
+        _announce_speed(engine, "Faster")
 
     if _tray_app:
         _tray_app.set_speed(engine.rate)
@@ -634,10 +759,10 @@ def on_speed_down():
 
     if engine.rate <= MIN_RATE:
         logger.info(f"Speed: {engine.rate} wpm (minimum)")
-        engine.speak("Minimum speed")
+        _announce_speed(engine, "Minimum speed")
     else:
         logger.info(f"Speed: {engine.rate} wpm (slower)")
-        engine.speak("Slower")
+        _announce_speed(engine, "Slower")
 
     if _tray_app:
         _tray_app.set_speed(engine.rate)
@@ -807,6 +932,11 @@ def on_normalize_text_change(enabled: bool):
         engine.speak("Text normalization disabled")
 
 
+def on_profiling_change(enabled: bool):
+    """Handle profiling toggle from tray menu (handed to the main thread)."""
+    _action_queue.put(("profiling_start" if enabled else "profiling_stop", time.time()))
+
+
 def on_console_toggle(visible: bool):
     """Handle console visibility toggle from tray menu."""
     global _console_visible
@@ -859,7 +989,7 @@ def register_hotkey(setting_key: str, hotkey_string: str):
     should_suppress = suppress_default or ("]" in hotkey_string or "[" in hotkey_string)
 
     def queued_callback():
-        _action_queue.put(setting_key)
+        _action_queue.put((setting_key, time.time()))
 
     keyboard.add_hotkey(hotkey_string, queued_callback, suppress=should_suppress)
 
@@ -946,7 +1076,9 @@ def update_tray_state():
     # Check if we need to auto-advance to next line
     is_active = engine.is_speaking or engine.is_paused or (hasattr(engine, "is_generating") and engine.is_generating)
 
-    if _was_speaking and not is_active and _line_queue:
+    if _was_speaking and not is_active and _line_queue and not _line_pending:
+        if _line_queue.filling and not _line_queue.wait_for(_current_line_index + 1, timeout=0):
+            return  # Next line is still being prepared; advance on a later tick
         # Just finished a line, advance to next
         _current_line_index += 1
         if _current_line_index < len(_line_queue):
@@ -1147,7 +1279,7 @@ def _start_session_monitor():
 
 def main():
     """Main entry point."""
-    global _tray_app, _current_hotkeys
+    global _tray_app, _current_hotkeys, _metrics_server, _resource_monitor
     global \
         _line_delay, \
         _read_mode, \
@@ -1179,6 +1311,28 @@ def main():
     _auto_read = settings.get("auto_read", DEFAULT_AUTO_READ)
     _filter_code = settings.get("filter_code", DEFAULT_FILTER_CODE)
     _normalize_text = settings.get("normalize_text", DEFAULT_NORMALIZE_TEXT)
+    configure_tracing(settings.get("tracing", DEFAULT_TRACING), TRACE_FILE)
+    user_rules()  # Load config/filter_rules.json now so rule problems are logged at startup
+    pronunciations()  # Likewise config/pronunciation.json
+
+    # Metrics: queue depths are read live; the endpoint is opt-in and localhost-only
+    REGISTRY.gauge("herald_action_queue_depth", "Hotkey actions waiting for the main loop", read=_action_queue.qsize)
+    REGISTRY.gauge(
+        "herald_lines_remaining",
+        "Lines queued after the current one",
+        read=lambda: max(0, len(_line_queue) - _current_line_index - 1),
+    )
+    metrics_port = settings.get("metrics_port", DEFAULT_METRICS_PORT)
+    if metrics_port:
+        _metrics_server = start_metrics_server(metrics_port)
+
+    if settings.get("resource_monitor", DEFAULT_RESOURCE_MONITOR):
+        _resource_monitor = ResourceMonitor(
+            TEMP_DIR,
+            thresholds=settings.get("resource_growth_thresholds"),
+            window=settings.get("resource_monitor_window", DEFAULT_RESOURCE_MONITOR_WINDOW),
+        )
+        _resource_monitor.start()
 
     logger.info("Herald started")
     for key, hotkey in _current_hotkeys.items():
@@ -1189,6 +1343,7 @@ def main():
     print()
 
     # Initialize engine
+    set_playback_listener(_playback_finished.set)
     engine = get_engine()
     logger.info(f"Voice: {engine.voice_name}, Speed: {engine.rate} wpm")
 
@@ -1209,6 +1364,9 @@ def main():
         on_hotkey_change=on_hotkey_change,
         on_reset_hotkeys=on_reset_hotkeys,
         on_quit=on_quit,
+        get_diagnostics=_diagnostics_lines,
+        on_reset_diagnostics=REGISTRY.reset,
+        on_profiling_change=on_profiling_change,
         current_voice=engine.voice_name,
         current_speed=engine.rate,
         current_line_delay=_line_delay,
@@ -1233,13 +1391,17 @@ def main():
 
     try:
         # Main loop - poll for quit, process hotkey actions, update state
-        # 50ms sleep keeps hotkey response snappy without wasting CPU
+        # 50ms wait keeps hotkey response snappy without wasting CPU; the end of
+        # a line wakes it early so the next line starts without a polling delay
         while not _quit_requested:
+            _advance_gapless_lines()  # Before hotkeys, so next/prev start from the line being heard
             _process_action_queue()  # Handle hotkey actions (queued for non-blocking)
+            _speak_pending_line()
             update_tray_state()
             _process_auto_read_queue()  # Handle auto-read from main thread
             _maybe_log_heartbeat()
-            time.sleep(0.05)
+            _playback_finished.wait(0.05)
+            _playback_finished.clear()
     except KeyboardInterrupt:
         logger.info("Ctrl+C - exiting")
     except Exception as e:
@@ -1257,9 +1419,12 @@ def main():
         except Exception as e:
             logger.error(f"Error unhooking keyboard: {e}")
 
-        engine.stop()
+        get_engine().shutdown()
         if _tray_app:
             _tray_app.stop()
+        if _metrics_server:
+            _metrics_server.shutdown()
+        _profiling.stop()  # Keep the results of a session left running at quit
 
         # Release the mutex
         if _instance_mutex:
@@ -0,0 +1,242 @@
+"""
+Herald Metrics
+
+In-process counters, gauges and latency histograms for tuning prefetch
+depth, cache size and poll intervals on real machines:
+- One thread-safe registry shared by every module (REGISTRY)
+- Histograms keep Prometheus buckets plus a window of recent samples for p50/p95
+- Prometheus text format, optionally served on a localhost-only port
+- Short summaries for the tray Diagnostics submenu
+"""
+
+import bisect
+import math
+import threading
+from collections import deque
+from collections.abc import Callable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from loguru import logger
+
+# Default histogram buckets (seconds) - covers ms-level gaps up to slow generations
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Recent samples kept per histogram for percentile estimates
+PERCENTILE_WINDOW = 1000
+
+
+class Counter:
+    """Monotonically increasing count."""
+
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help = help_text
+        self._value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: int = 1):
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    def reset(self):
+        with self._lock:
+            self._value = 0
+
+    def render(self) -> list[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter", f"{self.name} {self._value}"]
+
+
+class Gauge:
+    """Current value, set directly or read from a callback at render time."""
+
+    def __init__(self, name: str, help_text: str, read: Callable[[], float] | None = None):
+        self.name = name
+        self.help = help_text
+        self._read = read
+        self._value = 0.0
+
+    def set(self, value: float):
+        self._value = value
+
+    def set_reader(self, read: Callable[[], float] | None):
+        """Read the value from a callback (e.g. a queue's length) instead of set()."""
+        self._read = read
+
+    @property
+    def value(self) -> float:
+        if self._read:
+            try:
+                return self._read()
+            except Exception:
+                return math.nan
+        return self._value
+
+    def reset(self):
+        self._value = 0.0
+
+    def render(self) -> list[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} gauge", f"{self.name} {self.value:g}"]
+
+
+class Histogram:
+    """Distribution of observed values (Prometheus buckets + recent-sample percentiles)."""
+
+    def __init__(self, name: str, help_text: str, buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._bucket_counts = [0] * len(self.buckets)  # Non-cumulative; summed when rendered
+            self._count = 0
+            self._sum = 0.0
+            self._recent: deque[float] = deque(maxlen=PERCENTILE_WINDOW)
+
+    def observe(self, value: float):
+        with self._lock:
+            index = bisect.bisect_left(self.buckets, value)
+            if index < len(self.buckets):
+                self._bucket_counts[index] += 1
+            self._count += 1
+            self._sum += value
+            self._recent.append(value)
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def percentile(self, q: float) -> float | None:
+        """q-th percentile (0-100) of recent samples, or None if there are none."""
+        with self._lock:
+            samples = sorted(self._recent)
+        if not samples:
+            return None
+        index = min(len(samples) - 1, max(0, math.ceil(q / 100 * len(samples)) - 1))
+        return samples[index]
+
+    def render(self) -> list[str]:
+        with self._lock:
+            counts, count, total = list(self._bucket_counts), self._count, self._sum
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets, counts, strict=True):
+            cumulative += bucket_count
+            lines.append(f'{self.name}_bucket{{le="{bound:g}"}} {cumulative}')
+        lines.append(f'{self.name}_bucket{{le="+Inf"}} {count}')
+        lines.append(f"{self.name}_sum {total:g}")
+        lines.append(f"{self.name}_count {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """Named metrics; get-or-create so modules can declare what they record at import."""
+
+    def __init__(self):
+        self._metrics: dict[str, Counter | Gauge | Histogram] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, name: str, factory):
+        with self._lock:
+            if name not in self._metrics:
+                self._metrics[name] = factory()
+            return self._metrics[name]
+
+    def counter(self, name: str, help_text: str) -> Counter:
+        return self._get_or_create(name, lambda: Counter(name, help_text))
+
+    def gauge(self, name: str, help_text: str, read: Callable[[], float] | None = None) -> Gauge:
+        return self._get_or_create(name, lambda: Gauge(name, help_text, read))
+
+    def histogram(self, name: str, help_text: str, buckets: tuple[float, ...] = LATENCY_BUCKETS) -> Histogram:
+        return self._get_or_create(name, lambda: Histogram(name, help_text, buckets))
+
+    def get(self, name: str) -> Counter | Gauge | Histogram | None:
+        return self._metrics.get(name)
+
+    def reset(self):
+        """Zero every counter and histogram (gauges with readers keep reporting live values)."""
+        for metric in list(self._metrics.values()):
+            metric.reset()
+
+    def render_prometheus(self) -> str:
+        """All metrics in Prometheus text exposition format."""
+        lines = []
+        for name in sorted(self._metrics):
+            lines.extend(self._metrics[name].render())
+        return "\n".join(lines) + "\n"
+
+
+# Shared registry for the whole app
+REGISTRY = MetricsRegistry()
+
+
+def _ratio(part: int, whole: int) -> str:
+    return f"{part / whole:.0%}" if whole else "-"
+
+
+def _latency(histogram: Histogram | None) -> str:
+    if histogram is None or histogram.count == 0:
+        return "no data"
+    p50, p95 = histogram.percentile(50), histogram.percentile(95)
+    return f"p50 {p50 * 1000:.0f} ms, p95 {p95 * 1000:.0f} ms (n={histogram.count})"
+
+
+def _value(name: str) -> float:
+    metric = REGISTRY.get(name)
+    return metric.value if isinstance(metric, Counter | Gauge) else 0
+
+
+def summary_lines() -> list[str]:
+    """Human-readable headline numbers (tray Diagnostics submenu)."""
+    hits, misses = int(_value("herald_cache_hits_total")), int(_value("herald_cache_misses_total"))
+    used, wasted = int(_value("herald_prefetch_used_total")), int(_value("herald_prefetch_wasted_total"))
+    polls, skipped = int(_value("herald_auto_read_polls_total")), int(_value("herald_auto_read_polls_skipped_total"))
+    line_hits, line_misses = int(_value("herald_line_cache_hits_total")), int(_value("herald_line_cache_misses_total"))
+    return [
+        f"Cache: {hits} hits, {misses} misses ({_ratio(hits, hits + misses)} hit rate)",
+        f"Prefetch: {used} used, {wasted} wasted ({_ratio(used, used + wasted)} used)",
+        f"Line cache: {line_hits} hits, {line_misses} misses ({_ratio(line_hits, line_hits + line_misses)} hit rate)",
+        f"Generation: {_latency(REGISTRY.get('herald_generation_seconds'))}",
+        f"First audio chunk: {_latency(REGISTRY.get('herald_first_chunk_seconds'))}",
+        f"Gap between lines: {_latency(REGISTRY.get('herald_inter_line_gap_seconds'))}",
+        f"OCR: {_latency(REGISTRY.get('herald_ocr_seconds'))}",
+        f"Auto-read polls: {polls} ({skipped} skipped)",
+        f"Queued: {_value('herald_action_queue_depth'):g} actions, {_value('herald_lines_remaining'):g} lines",
+    ]
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    """Read-only: GET /metrics, nothing else."""
+
+    def do_GET(self):
+        if self.path.split("?")[0] not in ("/metrics", "/"):
+            self.send_error(404)
+            return
+        body = REGISTRY.render_prometheus().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug(f"Metrics request: {format % args}")
+
+
+def start_metrics_server(port: int) -> ThreadingHTTPServer | None:
+    """Serve REGISTRY at http://127.0.0.1:<port>/metrics (localhost only). Returns None on failure."""
+    try:
+        server = ThreadingHTTPServer(("127.0.0.1", port), _MetricsHandler)
+    except OSError as e:
+        logger.warning(f"Metrics endpoint unavailable on port {port}: {e}")
+        return None
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True, name="metrics_server").start()
+    logger.info(f"Metrics endpoint: http://127.0.0.1:{server.server_address[1]}/metrics")
+    return server
@@ -17,9 +17,15 @@ from loguru import logger
 from pathlib import Path
 from difflib import SequenceMatcher
 
+from metrics import REGISTRY
 from region_capture import select_region, get_helper_path
 from text_grab import ocr_image
 
+AUTO_READ_POLLS = REGISTRY.counter("herald_auto_read_polls_total", "Auto-read OCR polls of the monitor region")
+AUTO_READ_POLLS_SKIPPED = REGISTRY.counter(
+    "herald_auto_read_polls_skipped_total", "Auto-read polls that found no new text to read"
+)
+
 
 # Persistent overlay script - runs in separate process
 # Shows a rounded border OUTSIDE the capture region (so it doesn't appear in screenshots)
@@ -391,6 +397,8 @@ class PersistentRegion:
         """Background loop that polls for text changes."""
         first_run = True
         while not self._stop_event.is_set() and self.is_active:
+            AUTO_READ_POLLS.inc()
+            read = False
             try:
                 # Capture and OCR
                 image = self.capture()
@@ -408,6 +416,7 @@ class PersistentRegion:
                             )
                             self._last_text = text
                             first_run = False
+                            read = True
 
                             if self.on_text_detected:
                                 self.on_text_detected(text)
@@ -419,6 +428,9 @@ class PersistentRegion:
             except Exception as e:
                 logger.error(f"Auto-read error: {e}")
 
+            if not read:
+                AUTO_READ_POLLS_SKIPPED.inc()
+
             # Wait for next poll
             self._stop_event.wait(self.poll_interval)
 
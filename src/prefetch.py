@@ -0,0 +1,179 @@
+"""
+Herald Prefetch Scheduler
+
+Generates audio for upcoming lines ahead of playback:
+- Bounded number of concurrent generations (worker slots)
+- Pending jobs ordered by distance from the current line
+- Jobs outside the lookahead window are cancelled on skip, stop or voice change
+- Lookahead depth adapts to measured generation time vs. playback duration
+"""
+
+import heapq
+import itertools
+import math
+import threading
+import time
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future
+from loguru import logger
+
+from metrics import REGISTRY
+
+PREFETCH_USED = REGISTRY.counter("herald_prefetch_used_total", "Lines played from prefetched audio")
+PREFETCH_WASTED = REGISTRY.counter(
+    "herald_prefetch_wasted_total", "Prefetches cancelled mid-generation or finished but never played"
+)
+
+
+class PrefetchScheduler:
+    """Priority-ordered, cancellable prefetch with adaptive lookahead."""
+
+    # Smoothing factor for the generation/playback time ratio (higher = reacts faster)
+    RATIO_SMOOTHING = 0.3
+
+    def __init__(
+        self,
+        submit: Callable[[object], Future],
+        on_result: Callable[[Hashable, object, object], None],
+        audio_seconds: Callable[[object], float],
+        max_workers: int = 3,
+        min_lookahead: int = 1,
+        max_lookahead: int = 8,
+        default_lookahead: int = 2,
+    ):
+        """
+        Args:
+            submit: Start generating a job's payload; returns a future of the result
+            on_result: Called with (key, payload, result) when a job completes
+            audio_seconds: Playback duration of a result, for adaptive lookahead
+            max_workers: Maximum concurrent generations
+            min_lookahead: Lower bound on lines prefetched ahead
+            max_lookahead: Upper bound on lines prefetched ahead
+            default_lookahead: Lookahead used until timings have been measured
+        """
+        self._submit = submit
+        self._on_result = on_result
+        self._audio_seconds = audio_seconds
+        self.max_workers = max_workers
+        self.min_lookahead = min_lookahead
+        self.max_lookahead = max_lookahead
+        self._default_lookahead = default_lookahead
+
+        self._lock = threading.Lock()
+        self._pending: list[tuple[int, int, Hashable, object]] = []  # heap of (distance, seq, key, payload)
+        self._running: dict[Hashable, Future] = {}  # key -> in-flight future
+        self._seq = itertools.count()
+        self._ratio: float | None = None  # Smoothed generation time / playback duration
+
+    @property
+    def lookahead(self) -> int:
+        """How many lines ahead to prefetch.
+
+        Keeping the next line ready needs roughly generation/playback lines in
+        flight at once, plus one so a slow line doesn't drain the window.
+        """
+        if self._ratio is None:
+            return self._default_lookahead
+        depth = math.ceil(self._ratio) + 1
+        return max(self.min_lookahead, min(self.max_lookahead, depth))
+
+    @property
+    def pending_count(self) -> int:
+        """Jobs waiting for a worker slot."""
+        return len(self._pending)
+
+    @property
+    def running_count(self) -> int:
+        """Jobs currently generating."""
+        return len(self._running)
+
+    def is_running(self, key: Hashable) -> bool:
+        """Whether a job for key is currently generating."""
+        with self._lock:
+            return key in self._running
+
+    def claim(self, key: Hashable) -> Future | None:
+        """Take over the in-flight generation for key, if any.
+
+        The claimed future is detached from the scheduler, so later updates
+        won't cancel it; its result is still delivered to on_result. A pending
+        (not yet started) job for key is dropped so it can't start a duplicate.
+        """
+        with self._lock:
+            future = self._running.pop(key, None)
+            remaining = [job for job in self._pending if job[2] != key]
+            if len(remaining) != len(self._pending):
+                self._pending = remaining
+                heapq.heapify(self._pending)
+        if future is not None:
+            PREFETCH_USED.inc()
+            logger.debug(f"Attached to in-flight prefetch: {str(key)[:8]}...")
+        return future
+
+    def update(self, jobs: list[tuple[int, Hashable, object]]):
+        """Replace the wanted set of jobs.
+
+        Args:
+            jobs: (distance, key, payload) for each line wanted ahead of playback.
+                Running jobs not in this list are cancelled; pending ones are dropped.
+        """
+        wanted = {key for _, key, _ in jobs}
+        with self._lock:
+            dropped = [self._running.pop(k) for k in [k for k in self._running if k not in wanted]]
+            self._pending = [
+                (distance, next(self._seq), key, payload) for distance, key, payload in jobs if key not in self._running
+            ]
+            heapq.heapify(self._pending)
+
+        # Cancel outside the lock: done callbacks run synchronously and take it again
+        PREFETCH_WASTED.inc(sum(future.cancel() for future in dropped))
+        if dropped:
+            logger.debug(f"Prefetch cancelled {len(dropped)} job(s) out of window")
+        self._dispatch()
+
+    def cancel_all(self):
+        """Drop pending jobs and cancel running ones (stop, voice or rate change)."""
+        with self._lock:
+            self._pending.clear()
+            running = list(self._running.values())
+            self._running.clear()
+        PREFETCH_WASTED.inc(sum(future.cancel() for future in running))
+
+    def _dispatch(self):
+        """Start pending jobs, nearest first, while worker slots are free."""
+        while True:
+            with self._lock:
+                if not self._pending or len(self._running) >= self.max_workers:
+                    return
+                _, _, key, payload = heapq.heappop(self._pending)
+                future = self._submit(payload)
+                self._running[key] = future
+            started = time.time()
+            future.add_done_callback(lambda f, k=key, p=payload, t=started: self._on_done(k, p, f, t))
+
+    def _on_done(self, key: Hashable, payload: object, future: Future, started: float):
+        elapsed = time.time() - started
+        with self._lock:
+            if self._running.get(key) is future:
+                del self._running[key]
+
+        if not future.cancelled():
+            try:
+                result = future.result()
+                self._record_timing(elapsed, self._audio_seconds(result))
+                self._on_result(key, payload, result)
+            except Exception as e:
+                logger.debug(f"Prefetch failed: {e}")
+
+        self._dispatch()
+
+    def _record_timing(self, generation_seconds: float, audio_seconds: float):
+        """Fold one measurement into the smoothed generation/playback ratio."""
+        if audio_seconds <= 0:
+            return
+        ratio = generation_seconds / audio_seconds
+        if self._ratio is None:
+            self._ratio = ratio
+        else:
+            self._ratio += self.RATIO_SMOOTHING * (ratio - self._ratio)
+        logger.debug(f"Prefetch ratio {ratio:.2f} (smoothed {self._ratio:.2f}) -> lookahead {self.lookahead}")
@@ -0,0 +1,120 @@
+"""
+Herald Profiler
+
+On-demand profiling sessions for when Herald gets sluggish on a user's machine:
+- cProfile on the main thread (hotkey actions, line queue, tray/icon updates)
+- Low-overhead periodic stack sampler across all threads (speak thread,
+  prefetch workers, auto-read loop, tray thread, generation loop)
+- Written to logs/ as pstats and collapsed stacks (flamegraph.pl, speedscope):
+      python -m pstats logs/profile-<time>.pstats
+      flamegraph.pl logs/profile-<time>.collapsed.txt > profile.svg
+
+Started and stopped from the tray (Diagnostics > Profiling).
+"""
+
+import cProfile
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from loguru import logger
+
+# Seconds between stack samples (100 Hz keeps overhead to a few percent of one core)
+SAMPLE_INTERVAL = 0.01
+
+# Deepest stack kept per sample (outermost frames are dropped beyond this)
+MAX_STACK_DEPTH = 64
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{Path(code.co_filename).stem}:{code.co_name}"
+
+
+class StackSampler:
+    """Samples every thread's stack on a timer and counts identical stacks."""
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL):
+        self.interval = interval
+        self.samples = 0
+        self._stacks: Counter[str] = Counter()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self):
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="profile_sampler")
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=2)
+            self._thread = None
+
+    def _run(self):
+        own_id = threading.get_ident()
+        while not self._stop_event.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                labels = []
+                while frame is not None and len(labels) < MAX_STACK_DEPTH:
+                    labels.append(_frame_label(frame))
+                    frame = frame.f_back
+                labels.append(names.get(thread_id, f"thread-{thread_id}"))
+                self._stacks[";".join(reversed(labels))] += 1
+            self.samples += 1
+
+    def collapsed(self) -> list[str]:
+        """Stacks in collapsed format ("thread;outer;...;inner count"), most frequent first."""
+        return [f"{stack} {count}" for stack, count in self._stacks.most_common()]
+
+
+class ProfilingSession:
+    """cProfile on the calling thread plus a stack sampler for all threads."""
+
+    def __init__(self, output_dir: Path | str, interval: float = SAMPLE_INTERVAL):
+        self.output_dir = Path(output_dir)
+        self.interval = interval
+        self._profile: cProfile.Profile | None = None
+        self._sampler = StackSampler(interval)
+        self._started_at = 0.0
+
+    @property
+    def active(self) -> bool:
+        return self._profile is not None
+
+    def start(self):
+        """Begin profiling. cProfile only sees the thread that calls this (the main thread)."""
+        if self.active:
+            return
+        self._started_at = time.time()
+        self._profile = cProfile.Profile()
+        self._sampler = StackSampler(self.interval)
+        self._profile.enable()
+        self._sampler.start()
+        logger.info("Profiling started")
+
+    def stop(self) -> tuple[Path, Path] | None:
+        """End profiling and write the results. Returns (pstats path, collapsed stacks path)."""
+        if not self.active:
+            return None
+        self._profile.disable()
+        self._sampler.stop()
+
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(self._started_at))
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        stats_path = self.output_dir / f"profile-{stamp}.pstats"
+        stacks_path = self.output_dir / f"profile-{stamp}.collapsed.txt"
+        self._profile.dump_stats(stats_path)
+        stacks_path.write_text("\n".join(self._sampler.collapsed()) + "\n", encoding="utf-8")
+        self._profile = None
+
+        logger.info(
+            f"Profiling stopped after {time.time() - self._started_at:.1f}s "
+            f"({self._sampler.samples} samples): {stats_path.name}, {stacks_path.name}"
+        )
+        return stats_path, stacks_path
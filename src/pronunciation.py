@@ -0,0 +1,186 @@
+"""
+Herald Pronunciation Dictionary
+
+Words, abbreviations and units to say differently, from config/pronunciation.json:
+- "API": "A P I" - terms with capitals match only that exact spelling
+- "k8s": "kubernetes" - lowercase terms match any case ("K8s" -> "Kubernetes")
+- {"say": ..., "match_case": true} forces either rule ("ms" but not "MS")
+
+Terms only match as whole words (a term starting or ending with a letter or
+digit needs a non-word character or the line edge there), and the longest term
+wins. Terms are stored in one trie of tokens (words, symbols, spaces), so a line
+is tokenized once and rewritten in a single left-to-right pass; only tokens that
+start some term are looked at, so the cost barely grows with the dictionary size.
+
+Applied by text_filter.normalize_for_speech after identifiers and units are split
+into words, so terms inside code are found too ("getAPIKey" -> "get A P I Key",
+"k8s_cluster" -> "kubernetes cluster", "30ms" -> "30 milliseconds").
+
+Example (config/pronunciation.example.json):
+    {
+      "API": "A P I",
+      "e.g.": "for example",
+      "k8s": "kubernetes",
+      "ms": {"say": "milliseconds", "match_case": true}
+    }
+"""
+
+import re
+from collections.abc import Callable
+from itertools import accumulate
+from pathlib import Path
+from loguru import logger
+
+from watched_file import WatchedJsonFile
+
+# Words, whitespace runs and single symbols; matching whole tokens gives the word boundaries
+TOKEN_PATTERN = re.compile(r"\w+|\s+|[^\w\s]")
+
+# Trie node key holding the entries that end there: [(term, spoken, match_case)], exact-case first
+_END = None
+
+
+class PronunciationDictionary:
+    """Term -> spoken form, compiled into a trie keyed on lowercased tokens."""
+
+    def __init__(self, entries: dict[str, tuple[str, bool]] | None = None):
+        """
+        Args:
+            entries: term -> (spoken form, match_case); whitespace in terms matches any run of it
+        """
+        self._root: dict = {}
+        self._size = 0
+        for term, (spoken, match_case) in (entries or {}).items():
+            term = " ".join(term.split())
+            node = self._root
+            for token in TOKEN_PATTERN.findall(term.lower()):
+                node = node.setdefault(token, {})
+            ending = node.setdefault(_END, [])
+            ending.append((term, spoken, match_case))
+            ending.sort(key=lambda entry: not entry[2])
+            self._size += 1
+        self._first_tokens = frozenset(self._root)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    def apply(self, text: str) -> str:
+        """Replace every dictionary term in text (leftmost, then longest, match wins)."""
+        if not self._size:
+            return text
+        folded = text.lower()
+        if len(folded) == len(text):
+            tokens = TOKEN_PATTERN.findall(folded)
+            lengths = map(len, tokens)
+        else:  # A character lowercases to several ("İ"); keep offsets into the original text
+            original = TOKEN_PATTERN.findall(text)
+            tokens = [token.lower() for token in original]
+            lengths = map(len, original)
+        if self._first_tokens.isdisjoint(tokens):
+            return text
+
+        offsets = list(accumulate(lengths, initial=0))
+        first_tokens = self._first_tokens
+        parts = []
+        done = 0  # Tokens before this index are already replaced or copied
+        for index in [i for i, token in enumerate(tokens) if token in first_tokens]:
+            if index < done:
+                continue
+            found = self._longest(text, tokens, offsets, index)
+            if found is None:
+                continue
+            end, spoken = found
+            parts.append(text[offsets[done] : offsets[index]])
+            parts.append(spoken)
+            done = end
+        if not parts:
+            return text
+        parts.append(text[offsets[done] :])
+        return "".join(parts)
+
+    def _longest(self, text: str, tokens: list[str], offsets: list[int], start: int) -> tuple[int, str] | None:
+        """(end token index, spoken form) of the longest term starting at token start, or None."""
+        node = self._root
+        best = None
+        for position in range(start, len(tokens)):
+            token = tokens[position]
+            child = node.get(token)
+            if child is None and token.isspace():
+                child = node.get(" ")
+            if child is None:
+                break
+            node = child
+            ending = node.get(_END)
+            if ending is None:
+                continue
+            matched = text[offsets[start] : offsets[position + 1]]
+            for term, spoken, match_case in ending:
+                if not match_case:
+                    best = position + 1, _match_capital(matched, spoken)
+                    break
+                if matched == term or " ".join(matched.split()) == term:
+                    best = position + 1, spoken
+                    break
+        return best
+
+    @classmethod
+    def from_dict(cls, data: dict, variant: Callable[[str], str] | None = None) -> "PronunciationDictionary":
+        """Build from the dictionary file's contents, leaving out (and logging) entries that can't be used.
+
+        Args:
+            data: term -> spoken form, or term -> {"say": ..., "match_case": ...}
+            variant: Rewrites a term the way text is rewritten before lookup (identifier
+                splitting); where that changes the term, the rewritten form matches too
+        """
+        entries = {}
+        for term, value in data.items():
+            if isinstance(value, str):
+                value = {"say": value}
+            if not term.strip() or not isinstance(value, dict) or not isinstance(value.get("say"), str):
+                logger.warning(f'Pronunciation "{term}" ignored: needs a non-empty term and a "say" string')
+                continue
+            match_case = value.get("match_case")
+            if match_case is None:
+                match_case = term != term.lower()
+            entries[term] = (value["say"], bool(match_case))
+            if variant:
+                entries.setdefault(variant(term), entries[term])
+        return cls(entries)
+
+
+def _match_capital(matched: str, spoken: str) -> str:
+    """Capitalize the spoken form when the text it replaces is ("E.g." -> "For example")."""
+    if matched[:1].isupper() and spoken[:1].islower():
+        return spoken[0].upper() + spoken[1:]
+    return spoken
+
+
+class PronunciationFile(WatchedJsonFile):
+    """The pronunciation dictionary file, rebuilt when it changes."""
+
+    def __init__(
+        self,
+        path: Path | str,
+        on_reload: Callable[[], None] | None = None,
+        variant: Callable[[str], str] | None = None,
+    ):
+        """
+        Args:
+            path: JSON dictionary file (it's fine for it not to exist)
+            on_reload: Called after the dictionary changes (e.g. to drop cached results)
+            variant: Passed to PronunciationDictionary.from_dict
+        """
+        super().__init__(
+            path,
+            lambda data: PronunciationDictionary.from_dict(data, variant),
+            PronunciationDictionary(),
+            lambda dictionary: f"{len(dictionary)} pronunciations",
+            on_reload,
+        )
+
+    def dictionary(self) -> PronunciationDictionary:
+        """Current dictionary - one stat() per call, rebuilding only when the file changed."""
+        return self.current()
@@ -0,0 +1,203 @@
+"""
+Herald Resource Monitor
+
+Leak tracking for long-running sessions, sampled from the main-loop heartbeat:
+- Process RSS and Python heap (tracemalloc) with the top allocation deltas
+- Live threads grouped by name (speak, prefetch workers, OCR, overlays)
+- Open file handles under temp/ and the size of the prefetch/audio cache
+- Warns when a value grows steadily for a window of heartbeats past a configurable threshold
+  (not the cache: it fills up to its size cap by design, which evicts beyond that)
+
+Off by default ("resource_monitor" setting) - tracemalloc slows allocation.
+"""
+
+import ctypes
+import ctypes.wintypes
+import gc
+import io
+import os
+import re
+import sys
+import threading
+import tracemalloc
+from collections import Counter, deque
+from pathlib import Path
+from loguru import logger
+
+from config import DEFAULT_RESOURCE_GROWTH_THRESHOLDS, DEFAULT_RESOURCE_MONITOR_WINDOW
+from metrics import REGISTRY
+
+# Allocation sites logged per sample, and frames kept per allocation (more = slower)
+TOP_ALLOCATIONS = 5
+TRACEMALLOC_FRAMES = 1
+
+RSS_BYTES = REGISTRY.gauge("herald_process_rss_bytes", "Resident memory of the Herald process")
+THREAD_COUNT = REGISTRY.gauge("herald_threads", "Live Python threads")
+
+MB = 1024 * 1024
+
+
+def process_rss() -> int | None:
+    """Resident set size in bytes, or None where it can't be read."""
+    if sys.platform == "win32":
+
+        class ProcessMemoryCounters(ctypes.Structure):
+            _fields_ = [
+                ("cb", ctypes.c_ulong),
+                ("PageFaultCount", ctypes.c_ulong),
+                ("PeakWorkingSetSize", ctypes.c_size_t),
+                ("WorkingSetSize", ctypes.c_size_t),
+                ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                ("PagefileUsage", ctypes.c_size_t),
+                ("PeakPagefileUsage", ctypes.c_size_t),
+            ]
+
+        counters = ProcessMemoryCounters()
+        counters.cb = ctypes.sizeof(counters)
+        kernel32, psapi = ctypes.windll.kernel32, ctypes.windll.psapi
+        kernel32.GetCurrentProcess.restype = ctypes.wintypes.HANDLE
+        psapi.GetProcessMemoryInfo.argtypes = [ctypes.wintypes.HANDLE, ctypes.c_void_p, ctypes.wintypes.DWORD]
+        if psapi.GetProcessMemoryInfo(kernel32.GetCurrentProcess(), ctypes.byref(counters), counters.cb):
+            return counters.WorkingSetSize
+        return None
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def thread_counts() -> Counter[str]:
+    """Live threads grouped by name, with numbering collapsed ("Thread-#_#")."""
+    return Counter(re.sub(r"\d+", "#", thread.name) for thread in threading.enumerate())
+
+
+def open_files_under(directory: Path) -> list[str]:
+    """Paths of files this process has open under directory.
+
+    Uses /proc/self/fd where available (sees native handles too), otherwise
+    the open Python file objects.
+    """
+    root = str(directory.resolve())
+    fd_dir = Path("/proc/self/fd")
+    if fd_dir.is_dir():
+        paths = []
+        for fd in fd_dir.iterdir():
+            try:
+                paths.append(os.readlink(fd))
+            except OSError:
+                continue
+    else:
+        paths = [
+            str(Path(obj.name).resolve())
+            for obj in gc.get_objects()
+            if isinstance(obj, io.FileIO) and not obj.closed and isinstance(obj.name, str)
+        ]
+    return sorted(path for path in paths if path.startswith(root))
+
+
+class ResourceMonitor:
+    """Samples resource usage each heartbeat and flags steady growth."""
+
+    def __init__(
+        self, temp_dir: Path, thresholds: dict[str, float] | None = None, window: int = DEFAULT_RESOURCE_MONITOR_WINDOW
+    ):
+        """
+        Args:
+            temp_dir: Directory whose open file handles are counted
+            thresholds: Growth per window that warns, overriding DEFAULT_RESOURCE_GROWTH_THRESHOLDS
+            window: Heartbeats of uninterrupted growth before a value is flagged
+        """
+        self.temp_dir = Path(temp_dir)
+        self.thresholds = {**DEFAULT_RESOURCE_GROWTH_THRESHOLDS, **(thresholds or {})}
+        self.window = window
+        self._history: dict[str, deque[float]] = {name: deque(maxlen=window) for name in self.thresholds}
+        self._snapshot: tracemalloc.Snapshot | None = None
+        self._started_tracemalloc = False
+
+    def start(self):
+        """Start tracemalloc (if nothing else has) and take the baseline snapshot."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+            self._started_tracemalloc = True
+        self._snapshot = self._take_snapshot()
+        logger.info(f"Resource monitor started (window {self.window} heartbeats)")
+
+    def stop(self):
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        self._snapshot = None
+
+    @staticmethod
+    def _take_snapshot() -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot().filter_traces(
+            (
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+                tracemalloc.Filter(False, "<unknown>"),
+            )
+        )
+
+    def sample(self) -> dict[str, float]:
+        """Record one heartbeat's readings, log them, and return them."""
+        rss = process_rss()
+        threads = thread_counts()
+        temp_files = open_files_under(self.temp_dir)
+        cache = REGISTRY.get("herald_audio_cache_bytes")
+        readings = {
+            "rss_mb": (rss or 0) / MB,
+            "traced_mb": tracemalloc.get_traced_memory()[0] / MB if tracemalloc.is_tracing() else 0.0,
+            "threads": sum(threads.values()),
+            "temp_files": len(temp_files),
+            "prefetch_cache_mb": (cache.value if cache else 0) / MB,
+        }
+        if rss is not None:
+            RSS_BYTES.set(rss)
+        THREAD_COUNT.set(readings["threads"])
+
+        logger.debug(
+            f"Resources: rss={readings['rss_mb']:.1f}MB, heap={readings['traced_mb']:.1f}MB, "
+            f"cache={readings['prefetch_cache_mb']:.1f}MB, temp_files={len(temp_files)}, "
+            f"threads={dict(threads.most_common())}"
+        )
+        self._log_allocation_deltas()
+
+        if temp_files:
+            logger.debug(f"Open temp files: {temp_files}")
+
+        for name, value in readings.items():
+            self._record(name, value)
+        return readings
+
+    def _log_allocation_deltas(self):
+        if self._snapshot is None or not tracemalloc.is_tracing():
+            return
+        snapshot = self._take_snapshot()
+        for stat in snapshot.compare_to(self._snapshot, "lineno")[:TOP_ALLOCATIONS]:
+            if stat.size_diff:
+                logger.debug(
+                    f"Allocation delta: {stat.size_diff / 1024:+.1f} KB ({stat.count_diff:+d}) {stat.traceback}"
+                )
+        self._snapshot = snapshot
+
+    def _record(self, name: str, value: float):
+        """Add a reading and warn if it never fell across a full window and grew past the threshold."""
+        history = self._history.get(name)
+        if history is None:
+            return
+        history.append(value)
+        if len(history) < self.window:
+            return
+        values = list(history)
+        growing = all(later >= earlier for earlier, later in zip(values, values[1:], strict=False))
+        growth = values[-1] - values[0]
+        if growing and growth >= self.thresholds[name]:
+            logger.warning(
+                f"Possible leak: {name} kept growing over the last {self.window} heartbeats "
+                f"({values[0]:g} -> {values[-1]:g}, threshold {self.thresholds[name]:g})"
+            )
+            history.clear()  # Warn again only after another full window of growth
@@ -0,0 +1,95 @@
+"""
+Herald Synthetic Generation Service
+
+Offline stand-in for the Edge TTS service, for benchmarking and load-testing
+the line queue, prefetch, cache and playback code without network access:
+- Silent MP3 in edge-tts's own format (24 kHz mono, 48 kbps)
+- Duration follows the word count and the requested rate modifier
+- Configurable first-chunk latency, jitter, delivery speed and failure rate
+- Seeded, so a run's latencies and failures are reproducible
+"""
+
+import asyncio
+import math
+import random
+import re
+from collections.abc import AsyncIterator
+from loguru import logger
+
+from edge_service import EdgeGenerationService
+
+# One silent MPEG-2 Layer III frame: 48 kbps, 24 kHz, mono, 576 samples (24 ms)
+MP3_FRAME = bytes([0xFF, 0xF3, 0x64, 0xC0]) + bytes(140)
+MP3_FRAME_SECONDS = 0.024
+
+# Frames per delivered chunk (edge-tts sends audio in small WebSocket messages)
+CHUNK_FRAMES = 10
+
+# Speaking rate at a "+0%" modifier, matching EdgeTTSEngine's wpm mapping
+BASELINE_WPM = 300
+
+RATE_MODIFIER_PATTERN = re.compile(r"^([+-]\d+)%$")
+
+
+def rate_modifier_to_wpm(rate: str) -> float:
+    """Words per minute for an edge-tts rate modifier such as "+100%"."""
+    match = RATE_MODIFIER_PATTERN.match(rate)
+    percent = int(match.group(1)) if match else 0
+    return BASELINE_WPM * (1 + percent / 100)
+
+
+def synthetic_audio(text: str, rate: str) -> bytes:
+    """Silent MP3 as long as text takes to speak at the given rate modifier."""
+    seconds = max(1, len(text.split())) * 60 / rate_modifier_to_wpm(rate)
+    return MP3_FRAME * math.ceil(seconds / MP3_FRAME_SECONDS)
+
+
+class SyntheticGenerationService(EdgeGenerationService):
+    """EdgeGenerationService that fabricates audio locally instead of calling edge-tts."""
+
+    def __init__(
+        self,
+        latency: float = 0.3,
+        jitter: float = 0.1,
+        failure_rate: float = 0.0,
+        realtime_factor: float = 10.0,
+        seed: int = 0,
+    ):
+        """
+        Args:
+            latency: Seconds before the first audio chunk of each request
+            jitter: Latency varies uniformly by up to this many seconds either way
+            failure_rate: Fraction of requests (0-1) that fail with ConnectionError
+            realtime_factor: Audio delivered this many times faster than it plays
+            seed: Seed for latency and failure draws
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.realtime_factor = realtime_factor
+        self._random = random.Random(seed)
+        self.requests = 0
+        self.failures = 0
+        super().__init__()
+
+    async def _warm_up(self):
+        """Nothing to warm up - no network or imports."""
+
+    async def _audio_chunks(self, text: str, voice_id: str, rate: str) -> AsyncIterator[bytes]:
+        # Draws happen on the loop thread in request order, so a seeded run repeats exactly
+        self.requests += 1
+        delay = max(0.0, self.latency + self._random.uniform(-self.jitter, self.jitter))
+        fail = self._random.random() < self.failure_rate
+
+        await asyncio.sleep(delay)
+        if fail:
+            self.failures += 1
+            logger.debug(f"Synthetic generation failure (request {self.requests})")
+            raise ConnectionError("Synthetic generation failure")
+
+        audio = synthetic_audio(text, rate)
+        chunk_size = CHUNK_FRAMES * len(MP3_FRAME)
+        interval = CHUNK_FRAMES * MP3_FRAME_SECONDS / self.realtime_factor
+        for i in range(0, len(audio), chunk_size):
+            yield audio[i : i + chunk_size]
+            await asyncio.sleep(interval)
@@ -0,0 +1,82 @@
+"""
+Herald Text Chunker
+
+Splits long text into speakable chunks for continuous read mode:
+- Breaks at sentence boundaries, packing whole sentences up to a word budget
+- Over-long sentences are broken at clause punctuation, then between words
+- Chunk size is derived from a target playback duration at the current rate
+"""
+
+import re
+
+# Sentence end: terminal punctuation, optionally followed by a closing quote/bracket, then space
+SENTENCE_BREAK_PATTERN = re.compile(r"(?:(?<=[.!?])|(?<=[.!?][\"')\]]))\s+")
+
+# Clause break inside a sentence: comma, semicolon, colon or dash followed by space
+CLAUSE_BREAK_PATTERN = re.compile(r"(?<=[,;:–—])\s+")
+
+
+def words_for_duration(seconds: float, rate_wpm: int) -> int:
+    """Number of words that take roughly `seconds` to speak at `rate_wpm`."""
+    return max(1, int(rate_wpm * seconds / 60))
+
+
+def _split_long(sentence: str, max_words: int) -> list[str]:
+    """Break a sentence longer than max_words at clauses, then between words."""
+    pieces = []
+    for clause in CLAUSE_BREAK_PATTERN.split(sentence):
+        words = clause.split()
+        for i in range(0, len(words), max_words):
+            pieces.append(" ".join(words[i : i + max_words]))
+    return pieces
+
+
+def split_into_chunks(text: str, max_words: int) -> list[str]:
+    """Split text into chunks of whole sentences, each at most max_words long.
+
+    Line breaks are sentence boundaries too, and are kept inside a chunk so
+    unpunctuated lines still get a pause between them.
+
+    Args:
+        text: Text to split (may contain line breaks)
+        max_words: Word budget per chunk (a single word is never split)
+
+    Returns:
+        Non-empty chunks in reading order
+    """
+    chunks: list[str] = []
+    current: list[str] = []  # Sentences, each prefixed with its separator
+    current_words = 0
+
+    def flush():
+        nonlocal current, current_words
+        if current:
+            chunks.append("".join(current).lstrip())
+        current, current_words = [], 0
+
+    def add(piece: str, separator: str):
+        nonlocal current_words
+        count = len(piece.split())
+        if current_words + count > max_words:
+            flush()
+        current.append(separator + piece)
+        current_words += count
+
+    for line in text.splitlines():
+        separator = "\n"
+        for sentence in SENTENCE_BREAK_PATTERN.split(line):
+            sentence = " ".join(sentence.split())
+            if not sentence:
+                continue
+            if len(sentence.split()) > max_words:
+                # Too long on its own: start fresh and pack its clauses like sentences
+                flush()
+                for piece in _split_long(sentence, max_words):
+                    add(piece, " ")
+                flush()
+            else:
+                add(sentence, separator)
+            separator = " "
+
+    flush()
+    return chunks
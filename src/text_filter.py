@@ -5,14 +5,43 @@ Filters out lines that cannot be meaningfully spoken by TTS engines.
 Two-tier filtering:
 1. Always filtered (unspeakable): box-drawing characters, lines with no letters
 2. Configurable (code/tech): URLs, file paths, code syntax, shell commands
+User skip/keep/replace rules from config/filter_rules.json apply on top (see filter_rules.py),
+then the pronunciation dictionary in config/pronunciation.json (see pronunciation.py) - with
+normalization on, after identifiers are split into words.
 """
 
 import re
+import threading
+from collections import Counter, OrderedDict
+from collections.abc import Iterable, Iterator
 from loguru import logger
 
+from config import FILTER_RULES_FILE, PRONUNCIATION_FILE
+from filter_rules import RuleSet, RulesFile
+from metrics import REGISTRY
+from pronunciation import PronunciationDictionary, PronunciationFile
+
+# Per-line results kept for repeated text (auto-read re-OCRs the same region,
+# documents get re-read); longer lines are rarely repeated and aren't cached
+LINE_CACHE_SIZE = 10_000
+LINE_CACHE_MAX_CHARS = 2_000
+
+LINE_CACHE_HITS = REGISTRY.counter("herald_line_cache_hits_total", "Lines filtered/normalized from the line cache")
+LINE_CACHE_MISSES = REGISTRY.counter("herald_line_cache_misses_total", "Lines that had to be filtered/normalized")
+
+# Skip reason for lines is_unspeakable rejects (code-like lines use their rule name)
+UNSPEAKABLE = "unspeakable"
+
 # Box-drawing and similar decorative characters
 BOX_DRAWING_CHARS = set("─│┌┐└┘├┤┬┴┼═║╔╗╚╝╠╣╦╩╬━┃┏┓┗┛┣┫┳┻╋▀▄█▌▐░▒▓■□▪▫●○◆◇★☆")
 
+# Character classes for is_unspeakable, matched in C instead of per-character Python loops
+BOX_DRAWING_RUN_PATTERN = re.compile("[" + re.escape("".join(sorted(BOX_DRAWING_CHARS))) + "]+")
+ASCII_LETTER_PATTERN = re.compile(r"[A-Za-z]")
+# Word characters other than digits and "_": every letter, plus a few numeric symbols
+# ("²", "½") that str.isalpha rejects, so matches are confirmed with isalpha
+LETTER_CANDIDATE_PATTERN = re.compile(r"[^\W\d_]")
+
 # Patterns for code/URL detection
 URL_PATTERN = re.compile(
     r"^[\s]*"  # Optional leading whitespace
@@ -144,9 +173,25 @@ CODE_REGEX = [re.compile(p, re.IGNORECASE) for p in CODE_PATTERNS]
 GIT_HASH_PATTERN = re.compile(r"^[a-f0-9]{40}$", re.IGNORECASE)  # Full git hash
 SHORT_HASH_PATTERN = re.compile(r"^[a-f0-9]{7,8}$", re.IGNORECASE)  # Short commit hash
 UUID_PATTERN = re.compile(r"^[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12}$", re.IGNORECASE)
-HEX_DUMP_PATTERN = re.compile(r"(0x[a-f0-9]+\s*){3,}", re.IGNORECASE)  # Multiple 0x values
+HEX_DUMP_PATTERN = re.compile(r"0x[a-f0-9]+\s*(?:0x[a-f0-9]+\s*){2,}", re.IGNORECASE)  # 3+ 0x values
 LOG_TIMESTAMP_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2}")
 
+# Multi-line code regions (see code_blocks), dropped whole instead of line by line
+FENCE_PATTERN = re.compile(r"^(`{3,}|~{3,})")  # ```python ... ```
+DIFF_HEADER_PATTERN = re.compile(
+    r"^(?:index [0-9a-f]+\.\.|--- |\+\+\+ |(?:new|deleted) file mode |(?:old|new) mode |similarity index |rename (?:from|to) )"
+)
+DIFF_HUNK_PATTERN = re.compile(r"^@@ -\d+(?:,(\d+))? \+\d+(?:,(\d+))? @@")  # Old/new line counts
+# Stack frames: Java/.NET "at pkg.Class.method(...)", JS "at fn (file:1:2)" / "at file:1:2",
+# Python 'File "...", line N', Java "... 12 more" (prose like "at the office" isn't a frame)
+STACK_FRAME_PATTERN = re.compile(
+    r"^(?:at (?:async |new )?[\w$.<>/\[\]]+ ?\(.*\)|at \S+:\d+:\d+$|File \".*\", line \d+|\.\.\. \d+ more$)"
+)
+# List items aren't code evidence in indented runs (the diff-marker rule also matches "- item")
+LIST_ITEM_PATTERN = re.compile(r"^(?:[-+*]|\d+[.)])\s")
+MIN_BLOCK_LINES = 2  # Non-blank lines an indented run needs to count as a region
+MAX_RUN_LINES = 200  # Indented runs are classified in pieces this long, so reading isn't held back
+
 # Patterns for text normalization
 ANSI_ESCAPE_PATTERN = re.compile(r"\x1b\[[0-9;]*m")
 MARKDOWN_BOLD_PATTERN = re.compile(r"\*\*([^*]+)\*\*")  # **bold**
@@ -154,13 +199,19 @@ MARKDOWN_UNDERLINE_BOLD_PATTERN = re.compile(r"__([^_]+)__")  # __bold__
 MARKDOWN_CODE_PATTERN = re.compile(r"`([^`]+)`")  # `code`
 MARKDOWN_STRIKE_PATTERN = re.compile(r"~~([^~]+)~~")  # ~~strike~~
 MARKDOWN_LINK_PATTERN = re.compile(r"\[([^\]]+)\]\([^)]+\)")  # [text](url) -> text
-REPEATED_DOTS_PATTERN = re.compile(r"\.{2,}")
-REPEATED_EXCLAIM_PATTERN = re.compile(r"!{2,}")
-REPEATED_QUESTION_PATTERN = re.compile(r"\?{2,}")
-UNICODE_ELLIPSIS_PATTERN = re.compile(r"…")  # Unicode ellipsis -> .
-MULTIPLE_SPACES_PATTERN = re.compile(r" {2,}")  # Multiple spaces -> single
 HASHTAG_PATTERN = re.compile(r"#(\w+)")  # #tag -> tag
 MENTION_PATTERN = re.compile(r"@(\w+)")  # @user -> user
+SNAKE_CASE_PATTERN = re.compile(r"(\w)_(\w)")  # snake_case -> snake case
+SNAKE_CASE_SINGLE_PATTERN = re.compile(r"(?<=\w)_(?=\w)")  # Same result in one pass when no "__"
+# camelCase -> camel Case, and XMLParser -> XML Parser
+CAMEL_CASE_PATTERN = re.compile(r"(?<=[a-z])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])")
+# A number with a unit or suffix glued on: "30ms" (not ordinals, or digits inside words like "k8s").
+# Split only where the unit is a pronunciation term, so other text ("3x", "1080p") reads as before
+NUMBER_UNIT_PATTERN = re.compile(r"\b(\d+(?:\.\d+)?)(?!(?:st|nd|rd|th)\b)([A-Za-z]+)\b")
+DIGIT_LETTER_PATTERN = re.compile(r"\d[A-Za-z]")  # Cheap check for whether NUMBER_UNIT_PATTERN can match
+MULTIPLE_SPACES_PATTERN = re.compile(r" {2,}")  # Multiple spaces -> single
+# Repeated . ! ? -> one, and multiple spaces -> single
+REPEATED_PUNCTUATION_PATTERN = re.compile(r"([.!? ])\1+")
 
 # Email pattern for filtering standalone email lines
 EMAIL_PATTERN = re.compile(r"^[\s]*[\w.-]+@[\w.-]+\.\w+[\s]*$", re.IGNORECASE)
@@ -189,6 +240,105 @@ CLAUDE_CODE_PATTERNS = [
     re.compile(r"^[\s]*```"),
 ]
 
+
+def _literal_prefix(pattern: str, flags: int = 0) -> tuple[str, str]:
+    """Split a regex into its leading literal text and the rest ("->\\s*\\w+" -> ("->", "\\s*\\w+")).
+
+    Letters end the prefix of IGNORECASE patterns, since they match either case.
+    """
+    prefix = []
+    i = 0
+    while i < len(pattern):
+        char, step = pattern[i], 1
+        if char == "\\" and i + 1 < len(pattern) and not pattern[i + 1].isalnum():
+            char, step = pattern[i + 1], 2  # Escaped punctuation (\\-, \\.)
+        elif char in ".^$*+?{}[]()|\\":
+            break
+        if flags & re.IGNORECASE and char.lower() != char.upper():
+            break
+        if pattern[i + step : i + step + 1] in ("*", "+", "?", "{"):
+            break  # Quantified, so not a fixed prefix
+        prefix.append(char)
+        i += step
+    return "".join(prefix), pattern[i:]
+
+
+def _trie_pattern(entries: list[tuple[str, str]]) -> str:
+    """Alternation of (literal prefix, rest) entries with shared prefixes factored out.
+
+    The regex walks the prefixes as a trie - one character test per step instead
+    of retrying every entry - and when every entry has a prefix, the pattern
+    starts with a character set the engine uses to skip ahead while searching.
+        [("Get-", ""), ("Set-", ""), ("Select-", "")] -> "(?:Get\\-|S(?:e(?:lect\\-|t\\-)))"
+    """
+    trie: dict = {}
+    for prefix, rest in entries:
+        node = trie
+        for char in prefix:
+            node = node.setdefault(char, {})
+        node.setdefault(None, []).append(rest)  # Entries ending at this node
+
+    def build(node: dict) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items(), key=str) if char]
+        branches += node.get(None, [])
+        return branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+
+    return build(trie)
+
+
+# is_code_like rules, checked with two precompiled regexes instead of 100+ scans:
+# - Rules anchored at the line start: one alternation of named groups, matched once
+# - Rules found anywhere (keywords, operators, hex dumps): a trie keyed on each
+#   rule's literal prefix, searched once
+# Rule names are reported by code_like_rule; numbered ones index CODE_PATTERNS
+# and CLAUDE_CODE_PATTERNS.
+
+
+def _named(name: str, pattern: re.Pattern | str, flags: int = 0) -> str:
+    """Pattern as a named group, keeping its own case sensitivity."""
+    if isinstance(pattern, re.Pattern):
+        pattern, flags = pattern.pattern, pattern.flags
+    return f"(?P<{name}>(?i:{pattern}))" if flags & re.IGNORECASE else f"(?P<{name}>(?:{pattern}))"
+
+
+_ANCHORED_RULES = [
+    _named("url", URL_PATTERN),
+    _named("file_path", FILE_PATH_PATTERN),  # A single token, so never a sentence mentioning a path
+    _named("shell_prompt", SHELL_PROMPT_PATTERN),
+    _named("cli_command", _trie_pattern([(cmd, "") for cmd in CLI_COMMANDS]), re.IGNORECASE),
+    *[_named(f"code_syntax_{i}", p) for i, p in enumerate(CODE_REGEX) if p.pattern.startswith("^")],
+    _named("git_hash", GIT_HASH_PATTERN),
+    _named("short_hash", SHORT_HASH_PATTERN),
+    _named("uuid", UUID_PATTERN),
+    _named("log_timestamp", LOG_TIMESTAMP_PATTERN),
+    _named("email", EMAIL_PATTERN),
+    *[_named(f"tool_output_{i}", p) for i, p in enumerate(CLAUDE_CODE_PATTERNS)],
+]
+CODE_LIKE_ANCHORED = re.compile("|".join(_ANCHORED_RULES))
+
+_UNANCHORED_RULES = [
+    *[("powershell_cmdlet", cmdlet, 0) for cmdlet in POWERSHELL_CMDLETS],
+    *[(f"code_syntax_{i}", p.pattern, p.flags) for i, p in enumerate(CODE_REGEX) if not p.pattern.startswith("^")],
+    ("hex_dump", HEX_DUMP_PATTERN.pattern, HEX_DUMP_PATTERN.flags),
+]
+
+
+def _prefix_trie(rules: list[tuple[str, str, int]]) -> str:
+    """Trie of (name, pattern, flags) rules keyed on their literal prefixes.
+
+    Several rules share a name (one per PowerShell verb), so each rule's
+    remainder gets its own group, "r<index>", which _UNANCHORED_GROUPS maps back.
+    """
+    entries = []
+    for i, (_, pattern, flags) in enumerate(rules):
+        prefix, rest = _literal_prefix(pattern, flags)
+        entries.append((prefix, _named(f"r{i}", rest, flags)))
+    return _trie_pattern(entries)
+
+
+_UNANCHORED_GROUPS = {f"r{i}": name for i, (name, _, _) in enumerate(_UNANCHORED_RULES)}
+CODE_LIKE_UNANCHORED = re.compile(_prefix_trie(_UNANCHORED_RULES))
+
 # Patterns for inline URL/path detection (embedded in sentences)
 INLINE_URL_PATTERN = re.compile(r'https?://[^\s<>"\')\]]+|www\.[^\s<>"\')\]]+', re.IGNORECASE)
 INLINE_PATH_PATTERN = re.compile(
@@ -219,27 +369,36 @@ def remove_inline_urls_and_paths(text: str) -> str:
     if not text:
         return text
 
-    result = INLINE_URL_PATTERN.sub("", text)
-    result = INLINE_PATH_PATTERN.sub("", result)
+    result = text
+    # Skip the passes that can't match (URLs need "://" or "www.", paths ":\\" or "/")
+    if "://" in result or "www." in result.lower():
+        result = INLINE_URL_PATTERN.sub("", result)
+    if "/" in result or ":\\" in result:
+        result = INLINE_PATH_PATTERN.sub("", result)
     # Clean up double spaces left behind
-    result = re.sub(r" {2,}", " ", result)
+    if "  " in result:
+        result = MULTIPLE_SPACES_PATTERN.sub(" ", result)
     return result.strip()
 
 
-def normalize_for_speech(text: str, filter_paths_urls: bool = False) -> str:
+def normalize_for_speech(
+    text: str, filter_paths_urls: bool = False, dictionary: PronunciationDictionary | None = None
+) -> str:
     """Transform text to read more naturally for TTS.
 
     Applies the following transformations:
     1. (Optional) Remove inline URLs and file paths
     2. Strip ANSI escape codes (terminal colors)
     3. Strip markdown formatting (**bold**, __bold__, `code`, ~~strike~~)
-    4. Convert snake_case to spaces
-    5. Convert camelCase/PascalCase to spaces
+    4. Convert snake_case and camelCase/PascalCase to spaces
+    5. (Optional) Apply the pronunciation dictionary to the split words, splitting
+       numbers from units it knows first ("30ms" -> "30 ms")
     6. Simplify repeated punctuation
 
     Args:
         text: Text to normalize
         filter_paths_urls: If True, remove inline URLs and file paths
+        dictionary: Pronunciations to apply (see pronunciation.py)
 
     Returns:
         Normalized text suitable for TTS
@@ -249,48 +408,84 @@ def normalize_for_speech(text: str, filter_paths_urls: bool = False) -> str:
 
     result = text
 
+    # Each step only runs if the text can contain a match (substring checks are
+    # far cheaper than a regex pass), so most lines take two regex passes
+
     # 0. Remove inline URLs and paths if enabled
     if filter_paths_urls:
         result = remove_inline_urls_and_paths(result)
 
     # 1. Strip ANSI escape codes
-    result = ANSI_ESCAPE_PATTERN.sub("", result)
+    if "\x1b" in result:
+        result = ANSI_ESCAPE_PATTERN.sub("", result)
 
     # 2. Strip markdown formatting (keep the content)
-    result = MARKDOWN_BOLD_PATTERN.sub(r"\1", result)
-    result = MARKDOWN_UNDERLINE_BOLD_PATTERN.sub(r"\1", result)
-    result = MARKDOWN_CODE_PATTERN.sub(r"\1", result)
-    result = MARKDOWN_STRIKE_PATTERN.sub(r"\1", result)
-    result = MARKDOWN_LINK_PATTERN.sub(r"\1", result)  # [text](url) -> text
+    if "**" in result:
+        result = MARKDOWN_BOLD_PATTERN.sub(r"\1", result)
+    if "__" in result:
+        result = MARKDOWN_UNDERLINE_BOLD_PATTERN.sub(r"\1", result)
+    if "`" in result:
+        result = MARKDOWN_CODE_PATTERN.sub(r"\1", result)
+    if "~~" in result:
+        result = MARKDOWN_STRIKE_PATTERN.sub(r"\1", result)
+    if "](" in result:
+        result = MARKDOWN_LINK_PATTERN.sub(r"\1", result)  # [text](url) -> text
 
     # 3. Normalize hashtags and mentions
-    result = HASHTAG_PATTERN.sub(r"\1", result)  # #tag -> tag
-    result = MENTION_PATTERN.sub(r"\1", result)  # @user -> user
+    if "#" in result:
+        result = HASHTAG_PATTERN.sub(r"\1", result)  # #tag -> tag
+    if "@" in result:
+        result = MENTION_PATTERN.sub(r"\1", result)  # @user -> user
+
+    # 4. Split identifiers into words (XMLParser -> XML Parser)
+    result = split_identifiers(result)
+
+    # 5. Say terms as the dictionary says, including inside identifiers and after numbers
+    # ("getAPIKey" -> "get API Key" -> "get A P I Key", "30ms" -> "30 milliseconds")
+    if dictionary:
+        if DIGIT_LETTER_PATTERN.search(result):
+            result = NUMBER_UNIT_PATTERN.sub(lambda match: _split_unit(match, dictionary), result)
+        result = dictionary.apply(result)
 
-    # 4. Convert snake_case to spaces
-    # Match underscores between word characters and replace with space
-    result = re.sub(r"(\w)_(\w)", r"\1 \2", result)
-    # Handle multiple consecutive underscores (run multiple times for chains)
-    while "_" in result and re.search(r"(\w)_(\w)", result):
-        result = re.sub(r"(\w)_(\w)", r"\1 \2", result)
+    # 6. Simplify repeated punctuation and collapse multiple spaces
+    result = REPEATED_PUNCTUATION_PATTERN.sub(r"\1", result)
 
-    # 5. Convert camelCase/PascalCase to spaces
-    # Insert space before uppercase letters that follow lowercase letters
-    result = re.sub(r"([a-z])([A-Z])", r"\1 \2", result)
-    # Insert space before uppercase letters followed by lowercase (for acronyms like XMLParser -> XML Parser)
-    result = re.sub(r"([A-Z]+)([A-Z][a-z])", r"\1 \2", result)
+    # 7. Replace unicode ellipsis (after 6, so "..…" stays two dots)
+    result = result.replace("…", ".")
 
-    # 6. Simplify repeated punctuation
-    result = REPEATED_DOTS_PATTERN.sub(".", result)
-    result = REPEATED_EXCLAIM_PATTERN.sub("!", result)
-    result = REPEATED_QUESTION_PATTERN.sub("?", result)
+    return result
+
+
+def split_identifiers(text: str) -> str:
+    """Split snake_case and camelCase/PascalCase (XMLParser -> XML Parser) into words."""
+    if "_" in text:
+        text = _split_snake_case(text)
+    if not text.islower():
+        text = CAMEL_CASE_PATTERN.sub(" ", text)
+    return text
+
+
+def _split_unit(match: re.Match, dictionary: PronunciationDictionary) -> str:
+    """The number and its unit as two words if the dictionary has a term for the unit ("30ms" -> "30 ms")."""
+    number, unit = match.groups()
+    if dictionary.apply(unit) == unit:
+        return match.group(0)
+    return f"{number} {unit}"
 
-    # 7. Replace unicode ellipsis
-    result = UNICODE_ELLIPSIS_PATTERN.sub(".", result)
 
-    # 8. Collapse multiple spaces (do this last)
-    result = MULTIPLE_SPACES_PATTERN.sub(" ", result)
+def _split_snake_case(text: str) -> str:
+    """Replace underscores between word characters with spaces.
 
+    Underscores count as word characters, so runs like "a__b" resolve over
+    several left-to-right passes ("a _b"); those keep the repeated passes.
+    Single underscores all resolve in one.
+    """
+    if "__" not in text:
+        return SNAKE_CASE_SINGLE_PATTERN.sub(" ", text)
+
+    result = SNAKE_CASE_PATTERN.sub(r"\1 \2", text)
+    while "_" in result and SNAKE_CASE_PATTERN.search(result):
+        result = SNAKE_CASE_PATTERN.sub(r"\1 \2", result)
     return result
 
 
@@ -307,19 +502,25 @@ def is_unspeakable(line: str) -> bool:
     Returns:
         True if the line should always be filtered out
     """
-    if not line or not line.strip():
+    stripped = line.strip() if line else ""
+    if not stripped:
         return True
 
-    stripped = line.strip()
+    # ASCII lines (checked in O(1)) can't contain box-drawing characters
+    if stripped.isascii():
+        return ASCII_LETTER_PATTERN.search(stripped) is None
 
-    # Check for box-drawing lines (>50% box chars)
-    box_char_count = sum(1 for c in stripped if c in BOX_DRAWING_CHARS)
+    # Check for box-drawing lines (>50% box chars); removing them in runs counts them
+    remainder = BOX_DRAWING_RUN_PATTERN.sub("", stripped)
+    box_char_count = len(stripped) - len(remainder)
     if box_char_count > 0 and box_char_count >= len(stripped) * 0.5:
         return True
 
-    # Check for lines with no alphabetic characters
-    has_letters = any(c.isalpha() for c in stripped)
-    return not has_letters
+    # Check for lines with no alphabetic characters (box-drawing characters aren't letters)
+    match = LETTER_CANDIDATE_PATTERN.search(remainder)
+    while match and not match.group().isalpha():
+        match = LETTER_CANDIDATE_PATTERN.search(remainder, match.end())
+    return match is None
 
 
 def is_code_like(line: str) -> bool:
@@ -337,70 +538,236 @@ def is_code_like(line: str) -> bool:
     Returns:
         True if the line looks like code/URLs/paths
     """
+    return code_like_rule(line) is not None
+
+
+def code_like_rule(line: str) -> str | None:
+    """Name of the rule that makes a line code-like (e.g. "url", "cli_command"), or None.
+
+    Numbered names ("code_syntax_3", "tool_output_0") index CODE_PATTERNS and
+    CLAUDE_CODE_PATTERNS.
+    """
     if not line or not line.strip():
-        return False
+        return None
 
     stripped = line.strip()
 
-    # Check for URLs
-    if URL_PATTERN.match(stripped):
-        return True
+    match = CODE_LIKE_ANCHORED.match(stripped)
+    if match:
+        return match.lastgroup
 
-    # Check for file paths (but not if it looks like a sentence)
-    if FILE_PATH_PATTERN.match(stripped):
-        # Don't filter if it has multiple words (probably a sentence mentioning a path)
-        words = stripped.split()
-        if len(words) <= 2:
-            return True
+    match = CODE_LIKE_UNANCHORED.search(stripped)
+    if match:
+        return _UNANCHORED_GROUPS[match.lastgroup]
 
-    # Check for shell prompts
-    if SHELL_PROMPT_PATTERN.match(stripped):
-        return True
+    return None
 
-    # Check for PowerShell cmdlets
-    for cmdlet in POWERSHELL_CMDLETS:
-        if cmdlet in stripped:
-            return True
 
-    # Check for CLI commands at start of line
-    lower_stripped = stripped.lower()
-    for cmd in CLI_COMMANDS:
-        if lower_stripped.startswith(cmd):
-            return True
+class _Lookahead:
+    """Line iterator that lines can be pushed back onto."""
 
-    # Check for code syntax patterns
-    for regex in CODE_REGEX:
-        if regex.search(stripped):
-            return True
+    def __init__(self, lines: Iterable[str]):
+        self._source = iter(lines)
+        self._pushed: list[str] = []
 
-    # Check for git hashes (full 40-char or short 7-8 char)
-    if GIT_HASH_PATTERN.match(stripped):
-        return True
-    if SHORT_HASH_PATTERN.match(stripped):
-        return True
+    def take(self) -> str | None:
+        if self._pushed:
+            return self._pushed.pop()
+        return next(self._source, None)
 
-    # Check for UUIDs
-    if UUID_PATTERN.match(stripped):
-        return True
+    def push(self, line: str):
+        self._pushed.append(line)
 
-    # Check for hex dumps (multiple 0x values on a line)
-    if HEX_DUMP_PATTERN.search(stripped):
-        return True
 
-    # Check for log timestamps at start of line
-    if LOG_TIMESTAMP_PATTERN.match(stripped):
-        return True
+def code_blocks(lines: Iterable[str]) -> Iterator[tuple[str, str | None]]:
+    """Pair each line with the multi-line code region it is part of, or None.
 
-    # Check for standalone email addresses
-    if EMAIL_PATTERN.match(stripped):
-        return True
+    Regions are:
+    - "fenced_block": ``` or ~~~ fence through its closing fence
+    - "diff": git diff headers, and @@ hunks up to the hunk's line counts
+    - "stack_trace": Python tracebacks and indented runs of stack frames (the
+      exception message after them is left to be read)
+    - "indented_code": indented runs where most lines are code-like
+
+    Lines need their original indentation. Reads lines once, holding back only
+    the region being examined, so it can run over a stream. Indented runs end
+    at a blank line and are examined at most MAX_RUN_LINES at a time, so text
+    that is indented throughout still starts reading straight away.
+    """
+    reader = _Lookahead(lines)
+    while (line := reader.take()) is not None:
+        stripped = line.strip()
+
+        # Cheap prefix checks first: most lines start no region
+        fence = stripped.startswith(("```", "~~~")) and FENCE_PATTERN.match(stripped)
+        if fence:
+            block = _read_fenced_block(reader, line, fence.group(1))
+            if block is None:  # Never closed - not a block after all
+                yield line, None
+            else:
+                yield from ((block_line, "fenced_block") for block_line in block)
+            continue
+
+        if line.startswith("diff --git "):
+            yield line, "diff"
+            while (header := reader.take()) is not None and DIFF_HEADER_PATTERN.match(header):
+                yield header, "diff"
+            if header is not None:
+                reader.push(header)
+            continue
+
+        hunk = line.startswith("@@ -") and DIFF_HUNK_PATTERN.match(line)
+        if hunk:
+            yield line, "diff"
+            yield from ((hunk_line, "diff") for hunk_line in _read_hunk(reader, hunk))
+            continue
 
-    # Check for Claude Code / LLM tool output patterns
-    for pattern in CLAUDE_CODE_PATTERNS:
-        if pattern.match(stripped):
-            return True
+        if stripped.startswith("Traceback (most recent call last):"):
+            yield line, "stack_trace"
+            while (frame := reader.take()) is not None and (not frame.strip() or frame[0] in " \t"):
+                yield frame, "stack_trace"
+            if frame is not None:
+                reader.push(frame)  # The exception message
+            continue
 
-    return False
+        if stripped and line[0] in " \t":
+            run = [line]
+            while len(run) < MAX_RUN_LINES and (indented := reader.take()) is not None:
+                if not indented.strip() or indented[0] not in " \t":
+                    reader.push(indented)  # A blank line or unindented text ends the run
+                    break
+                run.append(indented)
+            region = _indented_run_kind(run)
+            yield from ((run_line, region) for run_line in run)
+            continue
+
+        yield line, None
+
+
+def _read_fenced_block(reader: _Lookahead, opener: str, fence: str) -> list[str] | None:
+    """Lines from the opening fence through the closing one, or None (lines pushed back) if it never closes."""
+    block = [opener]
+    while (line := reader.take()) is not None:
+        block.append(line)
+        stripped = line.strip()
+        if stripped.startswith(fence) and not stripped.strip(fence[0]):
+            return block
+    for line in reversed(block[1:]):
+        reader.push(line)
+    return None
+
+
+def _read_hunk(reader: _Lookahead, header: re.Match) -> list[str]:
+    """The lines of a unified diff hunk, counted off against its header's line counts."""
+    old = int(header.group(1) or 1)
+    new = int(header.group(2) or 1)
+    hunk = []
+    while (old > 0 or new > 0) and (line := reader.take()) is not None:
+        marker = line[:1]
+        if (marker == " " or not line.strip()) and old > 0 and new > 0:  # Context (pasting can drop the space)
+            old, new = old - 1, new - 1
+        elif marker == "-" and old > 0:
+            old -= 1
+        elif marker == "+" and new > 0:
+            new -= 1
+        elif marker != "\\":  # "\ No newline at end of file" doesn't count
+            reader.push(line)
+            break
+        hunk.append(line)
+    return hunk
+
+
+def _indented_run_kind(run: list[str]) -> str | None:
+    """Region name for a run of indented lines, or None to check its lines one by one."""
+    lines = [line.strip() for line in run]
+    if len(lines) < MIN_BLOCK_LINES:
+        return None
+    frames = sum(1 for line in lines if STACK_FRAME_PATTERN.match(line))
+    if frames * 2 >= len(lines):
+        return "stack_trace"
+
+    # Code is indented a full level; checks stop once the verdict is certain
+    if not all(line.startswith(("    ", "\t")) for line in run):
+        return None
+    needed = (len(lines) + 1) // 2
+    code = 0
+    for checked, line in enumerate(lines, 1):
+        if not LIST_ITEM_PATTERN.match(line) and code_like_rule(line):
+            code += 1
+            if code >= needed:
+                return "indented_code"
+        if code + len(lines) - checked < needed:
+            return None
+    return None
+
+
+class LineCache:
+    """Bounded LRU of per-line filter/normalize results, shared by every read. Thread-safe."""
+
+    def __init__(self, maxsize: int = LINE_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple, tuple[str | None, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: tuple) -> tuple[str | None, str] | None:
+        """Cached result for key (marking it recently used), or None."""
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+            return result
+
+    def put(self, key: tuple, result: tuple[str | None, str]):
+        with self._lock:
+            self._entries[key] = result
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared by filter_lines and iter_speakable_lines
+_line_cache = LineCache()
+
+
+def clear_line_cache():
+    """Forget cached per-line results (e.g. after the filter rules change)."""
+    _line_cache.clear()
+
+
+# User rules; reloading them invalidates cached results
+_user_rules = RulesFile(FILTER_RULES_FILE, on_reload=clear_line_cache)
+
+
+def user_rules() -> RuleSet:
+    """The rules from config/filter_rules.json, reloaded if the file changed."""
+    return _user_rules.rules()
+
+
+# Pronunciations; reloading them invalidates cached results too. Terms are also
+# indexed split the way normalization splits text ("GitHub" -> "Git Hub")
+_pronunciations = PronunciationFile(PRONUNCIATION_FILE, on_reload=clear_line_cache, variant=split_identifiers)
+
+
+def pronunciations() -> PronunciationDictionary:
+    """The dictionary from config/pronunciation.json, reloaded if the file changed."""
+    return _pronunciations.dictionary()
+
+
+def line_cache_stats() -> dict[str, int | float]:
+    """Entries, hits, misses, and hit rate of the shared line cache (since the last counter reset)."""
+    hits, misses = LINE_CACHE_HITS.value, LINE_CACHE_MISSES.value
+    return {
+        "size": len(_line_cache),
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+    }
 
 
 def filter_lines(lines: list[str], filter_code: bool = True) -> list[str]:
@@ -408,35 +775,118 @@ def filter_lines(lines: list[str], filter_code: bool = True) -> list[str]:
 
     Args:
         lines: List of text lines to filter
-        filter_code: If True, also filter URLs, paths, and code syntax
+        filter_code: If True, also filter URLs, paths, and code syntax, and
+            drop code blocks, diffs and stack traces whole (see code_blocks)
 
     Returns:
         Filtered list of lines that can be spoken
     """
     if not lines:
         return []
+    return list(_speakable(lines, filter_code, normalize=False))
 
-    result = []
-    skipped_unspeakable = 0
-    skipped_code = 0
 
-    for line in lines:
-        if is_unspeakable(line):
-            skipped_unspeakable += 1
-            continue
+def iter_text_lines(text: str) -> Iterator[str]:
+    """Yield the lines of text (as text.split("\n") would) without splitting it all up front."""
+    start = 0
+    while start <= len(text):
+        end = text.find("\n", start)
+        if end == -1:
+            end = len(text)
+        yield text[start:end]
+        start = end + 1
 
-        if filter_code and is_code_like(line):
-            skipped_code += 1
-            continue
 
-        result.append(line)
+def iter_speakable_lines(text: str, filter_code: bool = True, normalize: bool = False) -> Iterator[str]:
+    """Lazily split, filter, and optionally normalize text into lines to speak.
+
+    Yields the same lines as filter_lines (then stripping and normalize_for_speech)
+    over the text's lines, skipping blank ones, but one at a time, so the first
+    line can be spoken while the rest of a long paste is still being processed.
+
+    Args:
+        text: Text to read (e.g. clipboard contents or OCR output)
+        filter_code: If True, also filter URLs, paths, and code syntax
+        normalize: If True, apply normalize_for_speech to each line
+
+    Yields:
+        Lines that can be spoken
+    """
+    return _speakable(iter_text_lines(text), filter_code, normalize, strip=True)
+
+
+def _prepare_line(
+    line: str, filter_code: bool, normalize: bool, rules: RuleSet, dictionary: PronunciationDictionary
+) -> tuple[str | None, str]:
+    """(skip reason, None to speak) and the text to speak for one line - uncached."""
+    if is_unspeakable(line):
+        return UNSPEAKABLE, line
+    if not rules.keeps(line):
+        rule = rules.skip_rule(line)
+        if rule:
+            return f"skip:{rule}", line
+        if filter_code:
+            rule = code_like_rule(line)
+            if rule:
+                return rule, line
+    text = rules.replace(line)
+    if normalize:
+        return None, normalize_for_speech(text, filter_paths_urls=filter_code, dictionary=dictionary)
+    return None, dictionary.apply(text)
+
+
+def _speakable(lines: Iterable[str], filter_code: bool, normalize: bool, strip: bool = False) -> Iterator[str]:
+    """Yield the lines that pass filtering (normalized if asked); logs what was skipped once exhausted.
+
+    With strip, lines are stripped and blank ones skipped after code regions are found.
+    """
+    skipped_unspeakable = 0
+    skipped_code = Counter()  # Rule or region name -> lines it filtered
+    hits = misses = 0
+    rules = user_rules()
+    dictionary = pronunciations()
+    regions = code_blocks(lines) if filter_code else ((line, None) for line in lines)
+
+    try:
+        for line, region in regions:
+            if region:
+                skipped_code[region] += 1
+                continue
+            if strip:
+                line = line.strip()
+                if not line:
+                    continue
+
+            key = (line, filter_code, normalize)
+            result = _line_cache.get(key)
+            if result is not None:
+                hits += 1
+            else:
+                misses += 1
+                result = _prepare_line(line, filter_code, normalize, rules, dictionary)
+                if len(line) <= LINE_CACHE_MAX_CHARS:
+                    _line_cache.put(key, result)
+
+            reason, spoken = result
+            if reason is None:
+                yield spoken
+            elif reason == UNSPEAKABLE:
+                skipped_unspeakable += 1
+            else:
+                skipped_code[reason] += 1
+    finally:
+        LINE_CACHE_HITS.inc(hits)
+        LINE_CACHE_MISSES.inc(misses)
 
     # Log filtering results at debug level
-    total_skipped = skipped_unspeakable + skipped_code
+    total_code = sum(skipped_code.values())
+    total_skipped = skipped_unspeakable + total_code
     if total_skipped > 0:
-        logger.debug(f"Filtered {total_skipped} lines: {skipped_unspeakable} unspeakable, {skipped_code} code-like")
-
-    return result
+        rules = ", ".join(f"{rule}: {count}" for rule, count in skipped_code.most_common(5))
+        logger.debug(
+            f"Filtered {total_skipped} lines: {skipped_unspeakable} unspeakable, {total_code} code-like"
+            + (f" ({rules})" if rules else "")
+        )
 
 
 # Self-test
@@ -10,6 +10,11 @@ import pyperclip
 import keyboard
 from loguru import logger
 
+from metrics import REGISTRY
+from tracing import NULL_TRACE, Trace
+
+OCR_SECONDS = REGISTRY.histogram("herald_ocr_seconds", "Time to OCR an image")
+
 
 def get_clipboard_text() -> str | None:
     """
@@ -95,12 +100,13 @@ def get_text_to_speak(auto_copy: bool = True) -> str | None:
     return get_clipboard_text()
 
 
-def get_content_to_speak(auto_copy: bool = True) -> tuple[str | None, str]:
+def get_content_to_speak(auto_copy: bool = True, trace: Trace = NULL_TRACE) -> tuple[str | None, str]:
     """
     Get content to speak - either text or OCR'd image.
 
     Args:
         auto_copy: If True, simulate Ctrl+C first to copy selection.
+        trace: Latency trace of the read (for the OCR span).
 
     Returns:
         Tuple of (text, source) where source is "text", "ocr", or "none".
@@ -109,7 +115,7 @@ def get_content_to_speak(auto_copy: bool = True) -> tuple[str | None, str]:
     image = get_clipboard_image()
     if image:
         logger.debug("Found image in clipboard, running OCR...")
-        ocr_text = ocr_image(image)
+        ocr_text = ocr_image(image, trace)
         if ocr_text:
             return (ocr_text, "ocr")
         else:
@@ -127,12 +133,13 @@ def get_content_to_speak(auto_copy: bool = True) -> tuple[str | None, str]:
     return (None, "none")
 
 
-def ocr_image(image) -> str | None:
+def ocr_image(image, trace: Trace = NULL_TRACE) -> str | None:
     """
     Run OCR on a PIL Image using Windows OCR.
 
     Args:
         image: PIL Image to OCR.
+        trace: Latency trace of the read (for the OCR span).
 
     Returns:
         Extracted text, or None if OCR failed.
@@ -162,14 +169,17 @@ def ocr_image(image) -> str | None:
         except RuntimeError:
             loop = None
 
-        if loop is not None:
-            # Already in async context - create new loop in thread
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(asyncio.run, run_ocr())
-                text = future.result(timeout=10)
-        else:
-            text = asyncio.run(run_ocr())
+        started = time.time()
+        with trace.span("ocr", width=width, height=height):
+            if loop is not None:
+                # Already in async context - create new loop in thread
+                import concurrent.futures
+                with concurrent.futures.ThreadPoolExecutor() as executor:
+                    future = executor.submit(asyncio.run, run_ocr())
+                    text = future.result(timeout=10)
+            else:
+                text = asyncio.run(run_ocr())
+        OCR_SECONDS.observe(time.time() - started)
 
         if text and text.strip():
             logger.info(f"OCR extracted {len(text)} characters")
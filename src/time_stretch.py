@@ -0,0 +1,80 @@
+"""
+Herald Time Stretch
+
+Pitch-preserving speed change for PCM audio (WSOLA - waveform similarity
+overlap-add), so audio rendered once at a base rate can be played at any
+speed. Requires numpy, which is optional: check AVAILABLE before use.
+"""
+
+try:
+    import numpy as np
+
+    AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+    AVAILABLE = False
+
+# Analysis frame length; ~2-3 pitch periods of speech
+FRAME_MS = 40.0
+
+# How far around the nominal position to search for the best-aligned frame
+SEARCH_MS = 12.0
+
+# Similarity search runs on a decimated mono mix (alignment error < 0.1 ms at 44.1 kHz)
+SEARCH_DECIMATION = 4
+
+
+def time_stretch(samples: "np.ndarray", speed: float, sample_rate: int) -> "np.ndarray":
+    """Change playback speed without changing pitch.
+
+    Args:
+        samples: int16 PCM shaped (frames, channels)
+        speed: Playback speed factor (2.0 = twice as fast, half as long)
+        sample_rate: Sample rate in Hz
+
+    Returns:
+        int16 PCM shaped (round(frames / speed), channels)
+    """
+    if abs(speed - 1.0) < 0.01 or len(samples) == 0:
+        return samples
+
+    frame = max(int(sample_rate * FRAME_MS / 1000) // 2 * 2, 2 * SEARCH_DECIMATION)
+    hop_out = frame // 2  # 50% overlap; periodic Hann windows then sum to 1
+    hop_in = hop_out * speed
+    search = int(sample_rate * SEARCH_MS / 1000) // SEARCH_DECIMATION
+    window = (0.5 - 0.5 * np.cos(2 * np.pi * np.arange(frame) / frame)).astype(np.float32)[:, None]
+
+    # Pad so the first and last real samples get full overlap-add coverage
+    pad = np.zeros((hop_out, samples.shape[1]), dtype=np.float32)
+    padded = np.concatenate([pad, samples.astype(np.float32), pad, pad])
+    coarse = padded.mean(axis=1)[::SEARCH_DECIMATION]
+    coarse_frame = frame // SEARCH_DECIMATION
+    last_start = len(padded) - frame
+
+    out_len = int(round(len(samples) / speed))
+    n_frames = (out_len + hop_out) // hop_out + 1
+    out = np.zeros(((n_frames - 1) * hop_out + frame, samples.shape[1]), dtype=np.float32)
+
+    position = 0
+    for k in range(n_frames):
+        nominal = min(int(round(k * hop_in)), last_start)
+        if k > 0:
+            # Pick the frame near the nominal position that best continues the previous one
+            natural = (position + hop_out) // SEARCH_DECIMATION
+            template = coarse[natural : natural + coarse_frame]
+            lo = max(0, nominal // SEARCH_DECIMATION - search)
+            hi = min(last_start // SEARCH_DECIMATION, nominal // SEARCH_DECIMATION + search)
+            if len(template) == coarse_frame and hi > lo:
+                region = coarse[lo : hi + coarse_frame]
+                best = int(np.argmax(np.correlate(region, template, mode="valid")))
+                nominal = min((lo + best) * SEARCH_DECIMATION, last_start)
+        position = nominal
+        out[k * hop_out : k * hop_out + frame] += padded[position : position + frame] * window
+
+    return np.clip(out[hop_out : hop_out + out_len], -32768, 32767).astype(np.int16)
+
+
+def stretch_pcm(pcm: bytes, speed: float, sample_rate: int, channels: int) -> bytes:
+    """time_stretch() for raw interleaved int16 PCM bytes (pygame mixer format)."""
+    samples = np.frombuffer(pcm, dtype=np.int16).reshape(-1, channels)
+    return time_stretch(samples, speed, sample_rate).tobytes()
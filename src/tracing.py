@@ -0,0 +1,206 @@
+"""
+Herald Tracing
+
+Per-utterance latency spans, from hotkey press to the last audio sample:
+- One trace per read (speak hotkey, OCR region, auto-read), passed explicitly to
+  the stages of that read, so announcements and other reads never land in it
+- Spans can be recorded from any thread (main loop, speak thread, OCR)
+- Appended to a JSONL file as they finish, one span per line
+- Exportable to Chrome trace-event JSON (chrome://tracing, ui.perfetto.dev):
+      python src/tracing.py logs/trace.jsonl
+
+Off by default ("tracing" setting); while off, traces are no-op objects.
+"""
+
+import json
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from loguru import logger
+
+
+class Trace:
+    """Spans of one utterance. Thread-safe; records are written as they're added."""
+
+    def __init__(self, tracer: "Tracer", trace_id: int, name: str, start: float):
+        self._tracer = tracer
+        self.trace_id = trace_id
+        self.name = name
+        self.start = start
+
+    def add(self, name: str, start: float, end: float | None = None, **attrs):
+        """Record a finished span (end=None records an instant event at start)."""
+        record = {
+            "trace": self.trace_id,
+            "utterance": self.name,
+            "name": name,
+            "ts": round(start, 6),
+            "dur": None if end is None else round(max(end - start, 0.0), 6),
+            "thread": threading.current_thread().name,
+        }
+        if attrs:
+            record["attrs"] = attrs
+        self._tracer._write(record)
+
+    @contextmanager
+    def span(self, name: str, **attrs) -> Iterator[None]:
+        """Record the enclosed block as a span."""
+        start = time.time()
+        try:
+            yield
+        finally:
+            self.add(name, start, time.time(), **attrs)
+
+    def mark(self, name: str, **attrs):
+        """Record an instant event (e.g. first audio byte)."""
+        self.add(name, time.time(), **attrs)
+
+
+class _NullTrace(Trace):
+    """Stand-in used while tracing is off - every call does nothing."""
+
+    def __init__(self):
+        self.trace_id = 0
+        self.name = ""
+        self.start = 0.0
+
+    def add(self, name: str, start: float, end: float | None = None, **attrs):
+        return
+
+    @contextmanager
+    def span(self, name: str, **attrs) -> Iterator[None]:
+        yield
+
+
+NULL_TRACE = _NullTrace()
+
+
+class Tracer:
+    """Creates traces and appends their spans to a JSONL file."""
+
+    def __init__(self):
+        self.path: Path | None = None  # None = tracing off
+        self._lock = threading.Lock()
+        self._file = None
+        self._next_id = 1
+
+    @property
+    def enabled(self) -> bool:
+        return self.path is not None
+
+    def configure(self, enabled: bool, path: Path | str):
+        """Turn tracing on (appending to path) or off."""
+        with self._lock:
+            if self._file:
+                self._file.close()
+                self._file = None
+            self.path = Path(path) if enabled else None
+        logger.debug(f"Tracing {'enabled: ' + str(path) if enabled else 'disabled'}")
+
+    def start_trace(self, name: str, start: float | None = None) -> Trace:
+        """Begin a new utterance trace.
+
+        Args:
+            name: What started the utterance (e.g. "hotkey_speak", "auto_read")
+            start: When it started (e.g. the hotkey press), default now
+        """
+        if not self.enabled:
+            return NULL_TRACE
+        with self._lock:
+            trace_id = self._next_id
+            self._next_id += 1
+        return Trace(self, trace_id, name, time.time() if start is None else start)
+
+    def _write(self, record: dict):
+        with self._lock:
+            if self.path is None:
+                return
+            try:
+                if self._file is None:
+                    self.path.parent.mkdir(parents=True, exist_ok=True)
+                    self._file = open(self.path, "a", encoding="utf-8")  # noqa: SIM115 - kept open
+                self._file.write(json.dumps(record) + "\n")
+                self._file.flush()
+            except OSError as e:
+                logger.warning(f"Failed to write trace span, tracing disabled: {e}")
+                self.path = None
+
+
+# Shared tracer (configured from settings at startup)
+_tracer = Tracer()
+
+
+def configure_tracing(enabled: bool, path: Path | str):
+    """Turn tracing on or off for the process."""
+    _tracer.configure(enabled, path)
+
+
+def start_trace(name: str, start: float | None = None) -> Trace:
+    """Begin a new utterance trace (see Tracer.start_trace)."""
+    return _tracer.start_trace(name, start)
+
+
+def to_chrome_trace(records: list[dict]) -> dict:
+    """Convert span records to Chrome trace-event format.
+
+    Each utterance becomes a process row and each Herald thread a track,
+    so the stages of one read line up left to right.
+    """
+    events = []
+    thread_ids: dict[str, int] = {}
+    seen_traces = set()
+    for record in records:
+        pid = record["trace"]
+        tid = thread_ids.setdefault(record["thread"], len(thread_ids) + 1)
+        if pid not in seen_traces:
+            seen_traces.add(pid)
+            label = f"#{pid} {record.get('utterance', '')}".strip()
+            events.append({"name": "process_name", "ph": "M", "pid": pid, "args": {"name": label}})
+        event = {
+            "name": record["name"],
+            "pid": pid,
+            "tid": tid,
+            "ts": int(record["ts"] * 1_000_000),
+            "args": record.get("attrs", {}),
+        }
+        if record.get("dur") is None:
+            event.update(ph="i", s="t")
+        else:
+            event.update(ph="X", dur=int(record["dur"] * 1_000_000))
+        events.append(event)
+
+    for pid in seen_traces:
+        for thread, tid in thread_ids.items():
+            events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": thread}})
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def export_chrome_trace(jsonl_path: Path | str, output_path: Path | str) -> int:
+    """Write the spans in a trace JSONL file as a Chrome trace. Returns the span count."""
+    records = []
+    with open(jsonl_path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue  # Partial last line (written while exporting)
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(to_chrome_trace(records), f)
+    return len(records)
+
+
+# Export: python src/tracing.py [trace.jsonl] [output.json]
+if __name__ == "__main__":
+    import sys
+
+    from config import TRACE_FILE
+
+    source = Path(sys.argv[1]) if len(sys.argv) > 1 else TRACE_FILE
+    target = Path(sys.argv[2]) if len(sys.argv) > 2 else source.with_suffix(".chrome.json")
+    count = export_chrome_trace(source, target)
+    print(f"Exported {count} spans to {target} (open in chrome://tracing or ui.perfetto.dev)")
@@ -154,6 +154,9 @@ class TrayApp:
         on_hotkey_change: Callable[[str, str], None] | None = None,
         on_reset_hotkeys: Callable[[], None] | None = None,
         on_quit: Callable[[], None] | None = None,
+        get_diagnostics: Callable[[], list[str]] | None = None,
+        on_reset_diagnostics: Callable[[], None] | None = None,
+        on_profiling_change: Callable[[bool], None] | None = None,
         current_voice: str = "aria",
         current_speed: int = 500,
         current_line_delay: int = 0,
@@ -182,6 +185,9 @@ class TrayApp:
         self.on_hotkey_change = on_hotkey_change
         self.on_reset_hotkeys = on_reset_hotkeys
         self.on_quit_callback = on_quit
+        self.get_diagnostics = get_diagnostics
+        self.on_reset_diagnostics = on_reset_diagnostics
+        self.on_profiling_change = on_profiling_change
 
         self.current_voice = current_voice
         self.current_speed = current_speed
@@ -196,6 +202,7 @@ class TrayApp:
         self.current_hotkeys = current_hotkeys or {}
         self.console_visible = console_visible
         self.is_paused = False
+        self.is_profiling = False
         self.is_speaking = False
 
         self.icon: pystray.Icon | None = None
@@ -328,6 +335,21 @@ class TrayApp:
         hotkey_category_items.append(pystray.Menu.SEPARATOR)
         hotkey_category_items.append(pystray.MenuItem("Reset All to Defaults", self._on_reset_hotkeys))
 
+        # Diagnostics submenu - live metrics as of the last menu refresh
+        diagnostics_items = []
+        if self.get_diagnostics:
+            try:
+                diagnostics_items = [pystray.MenuItem(line, None, enabled=False) for line in self.get_diagnostics()]
+            except Exception as e:
+                logger.debug(f"Diagnostics unavailable: {e}")
+        diagnostics_items.append(pystray.Menu.SEPARATOR)
+        diagnostics_items.append(pystray.MenuItem("Refresh", self._refresh_menu))
+        diagnostics_items.append(pystray.MenuItem("Reset Counters", self._on_reset_diagnostics))
+        diagnostics_items.append(pystray.Menu.SEPARATOR)
+        diagnostics_items.append(
+            pystray.MenuItem("Profiling", self._on_profiling_toggle, checked=lambda item: self.is_profiling)
+        )
+
         return pystray.Menu(
             pystray.MenuItem("Voice (Online)", pystray.Menu(*edge_voice_items)),
             pystray.MenuItem("Voice (Offline)", pystray.Menu(*offline_voice_items)),
@@ -365,6 +387,7 @@ class TrayApp:
                 "Normalize Text", self._on_normalize_text_toggle, checked=lambda item: self.current_normalize_text
             ),
             pystray.Menu.SEPARATOR,
+            pystray.MenuItem("Diagnostics", pystray.Menu(*diagnostics_items)),
             pystray.MenuItem(
                 self._get_about_label(),
                 pystray.Menu(
@@ -516,6 +539,21 @@ class TrayApp:
             self.on_reset_hotkeys()
         self._refresh_menu()
 
+    def _on_reset_diagnostics(self):
+        """Zero the diagnostics counters."""
+        logger.info("Diagnostics counters reset")
+        if self.on_reset_diagnostics:
+            self.on_reset_diagnostics()
+        self._refresh_menu()
+
+    def _on_profiling_toggle(self):
+        """Start or stop a profiling session (results are written to logs/)."""
+        self.is_profiling = not self.is_profiling
+        logger.info(f"Profiling: {self.is_profiling}")
+        if self.on_profiling_change:
+            self.on_profiling_change(self.is_profiling)
+        self._refresh_menu()
+
     def _on_pause_toggle(self):
         """Handle pause/resume toggle."""
         if self.on_pause_toggle:
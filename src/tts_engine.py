@@ -4,18 +4,53 @@ Herald TTS Engine
 Abstraction layer supporting multiple TTS backends:
 - pyttsx3: Offline, uses Windows SAPI voices (Zira, David)
 - edge-tts: Online, uses Microsoft Azure neural voices (Aria, Guy, Jenny)
+- synthetic: Offline stand-in for edge-tts with generated silent audio (benchmarks, load tests)
 """
 
-import asyncio
-import os
+import io
+import sys
 import time
 import threading
+from collections import deque
 from abc import ABC, abstractmethod
+from collections.abc import Callable
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
 from loguru import logger
 
 import ctypes
 
-from config import MIN_RATE, MAX_RATE, load_settings, set_setting, PROJECT_ROOT
+from config import (
+    MIN_RATE,
+    MAX_RATE,
+    DEFAULT_STREAM_AUDIO,
+    DEFAULT_GAPLESS_LINES,
+    DEFAULT_TIME_STRETCH,
+    TIME_STRETCH_BASE_RATE,
+    AUDIO_CACHE_DIR,
+    DEFAULT_AUDIO_CACHE_MAX_MB,
+    DEFAULT_AUDIO_CACHE_MAX_AGE_DAYS,
+    PREFETCH_WORKERS,
+    PREFETCH_MIN_LOOKAHEAD,
+    PREFETCH_MAX_LOOKAHEAD,
+    CONTINUOUS_CHUNK_SECONDS,
+    CONTINUOUS_WORKERS,
+    DEFAULT_EDGE_ENDPOINT,
+    DEFAULT_SYNTHETIC_LATENCY_MS,
+    DEFAULT_SYNTHETIC_JITTER_MS,
+    DEFAULT_SYNTHETIC_FAILURE_RATE,
+    DEFAULT_SYNTHETIC_REALTIME_FACTOR,
+    DEFAULT_SYNTHETIC_SEED,
+    load_settings,
+    set_setting,
+)
+from audio_cache import AudioCache
+from edge_service import EdgeGenerationService, StreamHandle, mp3_duration
+from metrics import REGISTRY
+from prefetch import PREFETCH_USED, PREFETCH_WASTED, PrefetchScheduler
+from synthetic_service import SyntheticGenerationService
+from text_chunker import split_into_chunks, words_for_duration
+from time_stretch import AVAILABLE as TIME_STRETCH_AVAILABLE, stretch_pcm
+from tracing import NULL_TRACE, Trace
 
 # Speaking mutex — lets external tools (claude-narrator) know Herald is actively speaking
 _SPEAKING_MUTEX_NAME = "Global\\HeraldSpeaking"
@@ -24,8 +59,8 @@ _speaking_mutex_handle = None
 
 def _acquire_speaking_mutex():
     global _speaking_mutex_handle
-    if _speaking_mutex_handle:
-        return  # already held
+    if _speaking_mutex_handle or sys.platform != "win32":
+        return  # already held, or no named mutexes to share (headless test runs)
     kernel32 = ctypes.windll.kernel32
     _speaking_mutex_handle = kernel32.CreateMutexW(None, True, _SPEAKING_MUTEX_NAME)
 
@@ -38,12 +73,41 @@ def _release_speaking_mutex():
         _speaking_mutex_handle = None
 
 
+CACHE_HITS = REGISTRY.counter("herald_cache_hits_total", "Utterances played from already generated audio")
+CACHE_MISSES = REGISTRY.counter("herald_cache_misses_total", "Utterances that had to be generated when spoken")
+INTER_LINE_GAP = REGISTRY.histogram("herald_inter_line_gap_seconds", "Silence between consecutive lines")
+PREFETCH_PENDING = REGISTRY.gauge("herald_prefetch_pending", "Prefetch jobs waiting for a worker")
+PREFETCH_RUNNING = REGISTRY.gauge("herald_prefetch_running", "Prefetch jobs generating")
+AUDIO_CACHE_BYTES = REGISTRY.gauge("herald_audio_cache_bytes", "Size of the persistent audio cache")
+
+# Called from the speak thread whenever an utterance ends (finished or stopped)
+_playback_listener: Callable[[], None] | None = None
+
+
+def set_playback_listener(callback: Callable[[], None] | None):
+    """Register a callback run when any engine finishes speaking.
+
+    Lets the main loop advance to the next line immediately instead of
+    noticing the end on its next polling tick. Survives engine switches.
+    """
+    global _playback_listener
+    _playback_listener = callback
+
+
+def _notify_playback_finished():
+    if _playback_listener:
+        try:
+            _playback_listener()
+        except Exception as e:
+            logger.debug(f"Playback listener error: {e}")
+
+
 class BaseTTSEngine(ABC):
     """Abstract base class for TTS engines."""
 
     @abstractmethod
-    def speak(self, text: str) -> None:
-        """Speak the given text (non-blocking)."""
+    def speak(self, text: str, trace: Trace = NULL_TRACE) -> None:
+        """Speak the given text (non-blocking), recording its stages on trace."""
         pass
 
     @abstractmethod
@@ -78,6 +142,11 @@ class BaseTTSEngine(ABC):
         """Whether currently generating audio (edge-tts only)."""
         return False  # Default: no generation phase
 
+    @property
+    def rate_changes_live(self) -> bool:
+        """Whether a rate change is heard immediately, mid-utterance."""
+        return False
+
     @property
     @abstractmethod
     def rate(self) -> int:
@@ -107,6 +176,22 @@ class BaseTTSEngine(ABC):
         """Get list of available voice names."""
         pass
 
+    def speak_continuous(self, text: str, trace: Trace = NULL_TRACE) -> None:
+        """Speak a long block of text as one uninterrupted stream (non-blocking)."""
+        self.speak(text, trace)  # Default: one utterance
+
+    def set_next_line(self, text: str) -> None:
+        """Play text straight after the current utterance, if supported (gapless lines)."""
+        return  # Default: caller speaks each line itself
+
+    def take_lines_advanced(self) -> int:
+        """Number of gapless line switches since the last call."""
+        return 0
+
+    def shutdown(self) -> None:
+        """Release background resources (engine is being replaced or app is exiting)."""
+        self.stop()
+
 
 class Pyttsx3Engine(BaseTTSEngine):
     """Offline TTS using Windows SAPI via pyttsx3."""
@@ -152,7 +237,7 @@ class Pyttsx3Engine(BaseTTSEngine):
                 return
         logger.warning(f"Voice '{self._voice_name}' not found")
 
-    def speak(self, text: str) -> None:
+    def speak(self, text: str, trace: Trace = NULL_TRACE) -> None:
         if not text or not text.strip():
             return
         self.stop()
@@ -163,13 +248,15 @@ class Pyttsx3Engine(BaseTTSEngine):
             self._paused = False
             try:
                 engine = self._get_engine()
-                engine.say(text)
-                engine.runAndWait()
+                with trace.span("playback", chars=len(text)):
+                    engine.say(text)
+                    engine.runAndWait()
             except Exception as e:
                 logger.error(f"TTS error: {e}")
             finally:
                 self._speaking = False
                 _release_speaking_mutex()
+                _notify_playback_finished()
 
         self._thread = threading.Thread(target=_speak_thread, daemon=True)
         self._thread.start()
@@ -265,6 +352,19 @@ class EdgeTTSEngine(BaseTTSEngine):
     # edge-tts uses percentage like "+50%" or "-25%"
     # Default is about 150 wpm, we want 50-600 range
 
+    # Streaming playback: start output once this many audio chunks have arrived
+    STREAM_START_CHUNKS = 4
+    # PCM held back from each partial decode - the tail of a truncated MP3
+    # (last frame overlap + resampler edge) changes once more data arrives
+    STREAM_HOLDBACK_MS = 100
+
+    # Mixer check interval once the expected end of playback has passed (seconds)
+    END_POLL_INTERVAL = 0.01
+
+    # Timeouts prevent indefinite hangs from network issues or WebSocket disconnects
+    GENERATION_TIMEOUT = 30  # seconds
+    PREFETCH_TIMEOUT = 15  # seconds (shorter than speak timeout)
+
     def __init__(self):
         import pygame
 
@@ -281,57 +381,112 @@ class EdgeTTSEngine(BaseTTSEngine):
             logger.error("Pygame mixer failed to initialize!")
             _speak_error("Audio system failed to initialize.")
 
+        # Reserved channel for streamed audio (mixer.music can't play a growing buffer)
+        self._channel = self._reserve_stream_channel()
+
         self._generating = False  # True while fetching audio from API
         self._speaking = False  # True while audio is playing
         self._paused = False
-        self._audio_file: str | None = None
         self._thread: threading.Thread | None = None
         self._thread_start_time: float = 0.0  # When current speak thread started
-        self._file_counter = 0  # Unique filename counter to avoid race conditions
         self._stop_requested = False  # Signal to stop current generation
+        self._request: Future | StreamHandle | None = None  # In-progress speak generation
+        self._play_end = 0.0  # Expected time.time() at which queued audio finishes
+        self._paused_at = 0.0  # When playback was paused (expected times shift on resume)
+        self._playback_wake = threading.Event()  # Interrupts playback waits (stop/pause/resume)
+        self._next_key: str | None = None  # Cache key of the line to queue gaplessly after this one
+        self._line_boundary: float | None = None  # Expected time.time() the queued next line starts
+        self._lines_advanced = 0  # Gapless line switches not yet taken by the caller
+        self._advance_lock = threading.Lock()
+        self._trace: Trace = NULL_TRACE  # Latency trace of the audio now playing (playback spans)
+        self._playback_started = 0.0  # When the audio now playing started (for its trace span)
+        self._last_playback_end = 0.0  # When the previous line finished (for the inter-line gap)
+        self._prefetched: set[str] = set()  # Cache keys prefetched but not played yet
+        self._prefetch_claimed: set[str] = set()  # Keys whose in-flight prefetch a speak() took over
+
+        # Time stretch: unstretched PCM of the playing line, so a speed change can re-stretch the rest
+        self._stretch_state: tuple[bytes, int, float, float] | None = None  # (pcm, offset, started, speed)
+        self._queued_stretch: tuple[bytes, float] | None = None  # (pcm, speed) of the gapless next line
+        self._queued_key: str | None = None  # Cache key of the gapless next line once queued
+        self._restretch_pending = False  # Speed changed while a line is playing
 
         # Thread lock for pygame mixer operations (pygame is not thread-safe)
         self._mixer_lock = threading.Lock()
 
-        # Prefetch cache: text_hash -> audio_file_path (ordered dict for LRU eviction)
-        self._prefetch_cache: dict[str, str] = {}
-        self._prefetch_cache_max_size = 10  # Max cached audio files
-        self._prefetch_thread: threading.Thread | None = None
+        # All generation runs on one background event loop (no per-line loop/thread setup)
+        self._service = self._create_service()
 
-        # Temp directory for audio files
-        self._temp_dir = PROJECT_ROOT / "temp"
-        self._temp_dir.mkdir(exist_ok=True)
-        self._cleanup_old_files()  # Clean up any leftover files from previous runs
+        # Finished prefetches are written to the cache here, not on the generation loop
+        # (a disk write there would hold up every other stream and prefetch)
+        self._cache_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="audio_cache")
+
+        # Upcoming lines: bounded concurrency, nearest first, cancelled when out of window
+        self._prefetcher = PrefetchScheduler(
+            submit=lambda job: self._service.submit(*job, timeout=self.PREFETCH_TIMEOUT),
+            on_result=lambda key, job, audio: self._cache_writer.submit(self._store_prefetched, key, job, audio),
+            audio_seconds=mp3_duration,
+            max_workers=PREFETCH_WORKERS,
+            min_lookahead=PREFETCH_MIN_LOOKAHEAD,
+            max_lookahead=PREFETCH_MAX_LOOKAHEAD,
+        )
 
         # Load saved settings
         settings = load_settings()
+
+        # Persistent audio cache: prefetched and spoken audio, reused across restarts
+        cache_dir = settings.get("audio_cache_dir") or AUDIO_CACHE_DIR
+        self._cache = AudioCache(
+            cache_dir,
+            max_bytes=settings.get("audio_cache_max_mb", DEFAULT_AUDIO_CACHE_MAX_MB) * 1024 * 1024,
+            max_age=settings.get("audio_cache_max_age_days", DEFAULT_AUDIO_CACHE_MAX_AGE_DAYS) * 86400,
+        )
+        PREFETCH_PENDING.set_reader(lambda: self._prefetcher.pending_count)
+        PREFETCH_RUNNING.set_reader(lambda: self._prefetcher.running_count)
+        AUDIO_CACHE_BYTES.set_reader(lambda: self._cache.total_bytes)
+
         self._rate = settings.get("rate", 500)
         voice = settings.get("voice", "aria")
+        self._stream_audio = settings.get("stream_audio", DEFAULT_STREAM_AUDIO)
+        self._gapless_lines = settings.get("gapless_lines", DEFAULT_GAPLESS_LINES)
+        self._time_stretch = bool(settings.get("time_stretch", DEFAULT_TIME_STRETCH) and self._channel)
+        if self._time_stretch and not TIME_STRETCH_AVAILABLE:
+            logger.warning("numpy not installed - time stretch disabled")
+            self._time_stretch = False
+        self._first_chunk_latency: float | None = None  # Seconds from request to first audio chunk
 
         # Ensure voice is valid for this engine
         if voice not in self.VOICES:
             voice = "aria"
         self._voice_name = voice
 
-    def _cleanup_old_files(self):
-        """Clean up any leftover audio files from previous runs."""
-        try:
-            for f in self._temp_dir.glob("herald_*.mp3"):
-                try:
-                    f.unlink()
-                except Exception:  # noqa: S110
-                    pass
-        except Exception:  # noqa: S110
-            pass
+    def _create_service(self) -> EdgeGenerationService:
+        """Create the generation service this engine sends requests to."""
+        endpoint = load_settings().get("edge_endpoint", DEFAULT_EDGE_ENDPOINT)
+        if endpoint:
+            logger.info(f"Edge TTS endpoint: {endpoint}")
+        return EdgeGenerationService(endpoint)
 
-    def _get_text_hash(self, text: str) -> str:
-        """Get a short hash for text to use as cache key."""
-        import hashlib
+    def _reserve_stream_channel(self):
+        """Reserve mixer channel 0 for streamed playback."""
+        try:
+            self._pygame.mixer.set_reserved(1)
+            return self._pygame.mixer.Channel(0)
+        except Exception as e:
+            logger.error(f"Failed to reserve stream channel: {e}")
+            return None
 
-        return hashlib.md5(text.encode()).hexdigest()[:12]
+    def _request_params(self, text: str) -> tuple[str, str, str]:
+        """Get (voice_id, rate_modifier, cache_key) for text at the current settings."""
+        voice_id = self.VOICES.get(self._voice_name, "en-US-AriaNeural")
+        rate = self._rate_to_edge_modifier()
+        return voice_id, rate, AudioCache.make_key(text, voice_id, rate)
 
     def _rate_to_edge_modifier(self) -> str:
-        """Convert our rate (wpm) to edge-tts rate modifier."""
+        """Convert our rate (wpm) to edge-tts rate modifier.
+
+        With time stretch on, audio is always rendered at TIME_STRETCH_BASE_RATE
+        (so cached audio stays valid across speeds) and sped up at playback.
+        """
         # Edge-tts rate modifier has practical limits (about -50% to +200%)
         # Map our wpm range to edge-tts percentage:
         #   100 wpm  -> -50%
@@ -342,252 +497,620 @@ class EdgeTTSEngine(BaseTTSEngine):
         # Linear interpolation from wpm to percentage
         # At 300 wpm = 0%, every 300 wpm = 100% change
         baseline_wpm = 300
-        percent = int((self._rate - baseline_wpm) / 3)
+        wpm = TIME_STRETCH_BASE_RATE if self._time_stretch else self._rate
+        percent = int((wpm - baseline_wpm) / 3)
 
         # Clamp to edge-tts practical limits
         percent = max(-50, min(200, percent))
 
-        logger.debug(f"Rate {self._rate} wpm -> {percent}%")
+        logger.debug(f"Rate {wpm} wpm -> {percent}%")
 
         if percent >= 0:
             return f"+{percent}%"
         return f"{percent}%"
 
+    def _cancel_request(self):
+        """Abort the in-progress speak generation, if any."""
+        request = self._request
+        self._request = None
+        if request is not None:
+            request.cancel()
+
     def _stop_playback(self):
         """Stop current playback without clearing prefetch cache (for line transitions)."""
         self._stop_requested = True
+        self._cancel_request()
         self._generating = False
         self._speaking = False
         _release_speaking_mutex()
         self._paused = False
+        self._next_key = None
+        self._line_boundary = None
+        self._stretch_state = None
+        self._restretch_pending = False
+        self._trace_playback(time.time(), stopped=True)
+        self._playback_wake.set()
         with self._mixer_lock:
             try:
                 self._pygame.mixer.music.stop()
+                if self._channel:
+                    self._channel.stop()
             except Exception:  # noqa: S110
                 pass
         self._cleanup_audio()
 
-    def speak(self, text: str) -> None:
+    def _decode_pcm(self, mp3_data: bytes) -> bytes:
+        """Decode MP3 bytes to raw PCM in the mixer's output format."""
+        return self._pygame.mixer.Sound(file=io.BytesIO(mp3_data)).get_raw()
+
+    @property
+    def _playback_speed(self) -> float:
+        """Speed factor applied at playback (time stretch), relative to the rendered audio."""
+        return self._rate / TIME_STRETCH_BASE_RATE if self._time_stretch else 1.0
+
+    def _stretch(self, pcm: bytes, speed: float) -> bytes:
+        """Time-stretch mixer-format PCM to the given speed (pitch unchanged)."""
+        if speed == 1.0:
+            return pcm
+        freq, _, channels = self._pygame.mixer.get_init()
+        return stretch_pcm(pcm, speed, freq, channels)
+
+    def _make_sound(self, audio: bytes) -> tuple:
+        """Decode MP3 bytes into a Sound at the current playback speed.
+
+        Returns (sound, (pcm, speed)) with time stretch on - the unstretched PCM
+        is kept so a later speed change can re-stretch what's left - else (sound, None).
+        """
+        if not self._time_stretch:
+            return self._pygame.mixer.Sound(file=io.BytesIO(audio)), None
+        pcm, speed = self._decode_pcm(audio), self._playback_speed
+        return self._pygame.mixer.Sound(buffer=self._stretch(pcm, speed)), (pcm, speed)
+
+    def _feed_channel(self, pcm: bytes) -> bool:
+        """Play or queue a PCM segment on the stream channel.
+
+        Returns False if the channel's single queue slot is still occupied.
+        """
+        with self._mixer_lock:
+            if self._stop_requested or not self._channel:
+                return True
+            if self._channel.get_queue() is not None:
+                return False
+            sound = self._pygame.mixer.Sound(buffer=pcm)
+            sound.set_volume(1.0)
+            if self._channel.get_busy():
+                self._channel.queue(sound)
+                self._play_end += sound.get_length()
+            else:
+                # First segment, or generation fell behind playback (underrun)
+                self._channel.play(sound)
+                self._play_end = time.time() + sound.get_length()
+            return True
+
+    def _stream_slot_free(self) -> bool:
+        """Whether the stream channel can accept another segment."""
+        with self._mixer_lock:
+            try:
+                return self._channel is not None and self._channel.get_queue() is None
+            except Exception:
+                return False
+
+    def _channel_busy(self) -> bool:
+        """Whether the stream channel is playing or has a segment queued."""
+        with self._mixer_lock:
+            try:
+                return bool(self._channel and (self._channel.get_busy() or self._channel.get_queue()))
+            except Exception:
+                return False
+
+    def _music_busy(self) -> bool:
+        """Whether mixer.music is playing (fallback when no channel is reserved)."""
+        with self._mixer_lock:
+            try:
+                return self._pygame.mixer.music.get_busy()
+            except Exception:
+                return False
+
+    def _play_audio(self, audio: bytes) -> bool:
+        """Start playing MP3 bytes straight from memory. Returns False if stopped or failed."""
+        try:
+            sound = stretched = None
+            if self._channel:
+                # Decode (and stretch) before taking the lock, so pause and stop aren't held up by it
+                sound, stretched = self._make_sound(audio)
+                sound.set_volume(1.0)
+            with self._mixer_lock:
+                if self._stop_requested:
+                    return False
+                if sound is not None:
+                    self._channel.play(sound)
+                    self._play_end = time.time() + sound.get_length()
+                    if stretched:
+                        self._stretch_state = (stretched[0], 0, time.time(), stretched[1])
+                else:
+                    self._pygame.mixer.music.load(io.BytesIO(audio), "mp3")
+                    self._pygame.mixer.music.set_volume(1.0)  # Ensure volume is max
+                    self._pygame.mixer.music.play()
+                    self._play_end = time.time() + mp3_duration(audio)
+                self._playback_began()
+            logger.debug(f"Started playback: {len(audio)} bytes")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to play audio: {e}")
+            _speak_error("Audio playback failed.")
+            return False
+
+    def _store_audio(self, cache_key: str, audio: bytes):
+        """Save generated audio to the persistent cache (playback doesn't depend on it)."""
+        try:
+            self._cache.put(cache_key, audio)
+        except OSError as e:
+            logger.warning(f"Failed to cache audio: {e}")
+
+    def _wait_for_playback(self, is_busy) -> None:
+        """Block until playback finishes, is stopped, or times out.
+
+        Sleeps until the expected end of the queued audio (woken early by
+        stop/pause/resume), then checks the mixer at a short interval until
+        it drains, so line transitions aren't delayed by a polling tick.
+        """
+        # Timeout prevents a hang when the audio device disappears (e.g. RDP disconnect)
+        PLAYBACK_TIMEOUT = 30  # seconds past the expected end
+        while self._speaking:
+            if self._paused:
+                self._playback_wake.wait()
+            else:
+                if self._restretch_pending:
+                    self._restretch_current()
+                self._queue_next_line()
+                self._check_line_boundary()
+                if not is_busy():
+                    break
+                overdue = time.time() - self._play_end
+                if overdue > PLAYBACK_TIMEOUT:
+                    logger.warning("Playback timeout - audio device may be unavailable")
+                    break
+                # Wake at the next line's start (to report it) or at the end of playback
+                until = self._line_boundary if self._line_boundary is not None else self._play_end
+                self._playback_wake.wait(max(until - time.time(), self.END_POLL_INTERVAL))
+            self._playback_wake.clear()
+        # On stop the span is already recorded, and a replacing speak thread may have started its own
+        if not self._stop_requested and self._thread is threading.current_thread():
+            self._trace_playback(time.time())
+            self._last_playback_end = time.time()
+
+    def _playback_began(self):
+        """Note that audio became audible (trace span start, gap since the previous line)."""
+        now = time.time()
+        if self._last_playback_end:
+            INTER_LINE_GAP.observe(now - self._last_playback_end)
+            self._last_playback_end = 0.0
+        self._playback_started = now
+
+    def _trace_playback(self, end: float, **attrs):
+        """Record the trace span of the audio that just finished playing."""
+        if self._playback_started:
+            self._trace.add("playback", self._playback_started, end, **attrs)
+            self._playback_started = 0.0
+
+    def set_next_line(self, text: str) -> None:
+        """Play text straight after the current utterance, without a gap.
+
+        Once the line's audio is in the cache (prefetched), it is queued on the
+        stream channel behind the current audio, so the mixer switches over
+        sample-accurately. Each switch is counted for take_lines_advanced().
+        If the audio isn't ready in time, the utterance ends as usual and the
+        caller speaks the line itself.
+        """
+        if not self._gapless_lines or not self._channel or not text or not text.strip():
+            return
+        self._next_key = self._request_params(text)[2]
+        self._playback_wake.set()
+
+    def take_lines_advanced(self) -> int:
+        """Number of gapless line switches since the last call."""
+        with self._advance_lock:
+            count, self._lines_advanced = self._lines_advanced, 0
+        return count
+
+    def _queue_next_line(self):
+        """Queue the next line's audio behind the current audio, if it's ready."""
+        key = self._next_key
+        if key is None or self._line_boundary is not None or not self._stream_slot_free():
+            return
+        audio = self._cache.read(key)
+        if not audio:
+            return
+        sound, stretched = self._make_sound(audio)
+        sound.set_volume(1.0)
+        with self._mixer_lock:
+            if self._stop_requested or self._next_key != key or not self._channel.get_busy():
+                return
+            self._channel.queue(sound)
+            self._next_key = None
+            self._queued_key, self._queued_stretch = key, stretched
+            self._line_boundary = self._play_end
+            self._play_end += sound.get_length()
+        self._take_prefetched(key)
+        logger.debug(f"Queued next line gaplessly: {key[:8]}...")
+
+    def _restretch_current(self):
+        """Re-stretch the rest of the playing line at the new speed (time stretch)."""
+        self._restretch_pending = False
+        state = self._stretch_state
+        if state is None:
+            return
+        pcm, offset, started, speed = state
+        freq, size, channels = self._pygame.mixer.get_init()
+        frame_bytes = abs(size) // 8 * channels
+        elapsed = (self._paused_at if self._paused else time.time()) - started
+        position = offset + int(elapsed * speed * freq) * frame_bytes
+        if position >= len(pcm):
+            return
+        new_speed = self._playback_speed
+        sound = self._pygame.mixer.Sound(buffer=self._stretch(pcm[position:], new_speed))
+        sound.set_volume(1.0)
+
+        with self._mixer_lock:
+            if self._stop_requested or self._stretch_state is not state:
+                return
+            self._channel.play(sound)  # Also drops a queued next line
+            now = time.time()
+            if self._paused:
+                self._channel.pause()
+                self._paused_at = now
+            self._stretch_state = (pcm, position, now, new_speed)
+            self._play_end = now + sound.get_length()
+            if self._line_boundary is not None:
+                # Queue the next line again, stretched to the new speed
+                self._line_boundary = None
+                self._next_key = self._queued_key
+        logger.debug(f"Playback speed {speed:.2f}x -> {new_speed:.2f}x mid-line")
+
+    def _check_line_boundary(self):
+        """Report the switch to a gaplessly queued line once the mixer starts it."""
+        if self._line_boundary is None or time.time() < self._line_boundary:
+            return
+        with self._mixer_lock:
+            if self._channel.get_queue() is not None:
+                return  # Current audio is still finishing
+            boundary, self._line_boundary = self._line_boundary, None
+            if self._queued_stretch:
+                self._stretch_state = (self._queued_stretch[0], 0, time.time(), self._queued_stretch[1])
+        with self._advance_lock:
+            self._lines_advanced += 1
+        self._trace_playback(boundary)
+        self._playback_started = boundary
+        INTER_LINE_GAP.observe(0.0)
+        _notify_playback_finished()
+
+    def _speak_streaming(self, text: str, voice_id: str, rate: str, cache_key: str, trace: Trace) -> None:
+        """Generate and play audio concurrently, starting after the first few chunks.
+
+        Chunks accumulate in an MP3 buffer. Each time the channel's queue slot
+        frees up, the whole buffer is re-decoded and only the PCM beyond what was
+        already handed off is queued, so segment seams are sample-exact (MP3
+        frames depend on their predecessors, so tails can't be decoded alone).
+        """
+        freq, size, channels = self._pygame.mixer.get_init()
+        frame_bytes = abs(size) // 8 * channels
+        holdback = int(freq * self.STREAM_HOLDBACK_MS / 1000) * frame_bytes
+
+        mp3_data = bytearray()
+        handed_off = 0  # PCM bytes already given to the channel
+        chunk_count = 0
+        request_time = time.time()
+        self._first_chunk_latency = None
+
+        handle = self._service.stream(text, voice_id, rate, timeout=self.GENERATION_TIMEOUT)
+        self._request = handle
+
+        def hand_off(final: bool) -> bool:
+            """Queue newly decoded PCM. Returns True once everything is handed off."""
+            nonlocal handed_off
+            if not self._stream_slot_free():
+                return False
+            pcm = self._decode_pcm(bytes(mp3_data))
+            end = len(pcm) if final else len(pcm) - holdback
+            end -= end % frame_bytes
+            if end > handed_off and self._feed_channel(pcm[handed_off:end]):
+                if not self._speaking:
+                    # Done generating the first segment, now playing
+                    self._generating = False
+                    self._speaking = True
+                    _acquire_speaking_mutex()
+                    self._playback_began()
+                    logger.debug(f"Streaming playback started after {time.time() - request_time:.2f}s")
+                handed_off = end
+            return final and handed_off >= end
+
+        for data in handle:
+            if self._stop_requested or handle.cancelled:
+                return
+            if self._first_chunk_latency is None:
+                self._first_chunk_latency = handle.first_chunk_latency
+                trace.mark("first_byte", latency=self._first_chunk_latency)
+                logger.debug(f"First audio chunk after {self._first_chunk_latency:.2f}s")
+            mp3_data.extend(data)
+            chunk_count += 1
+            if chunk_count >= self.STREAM_START_CHUNKS:
+                hand_off(final=False)
+
+        if self._stop_requested or handle.cancelled:
+            return
+        if not mp3_data:
+            logger.error("Edge TTS stream returned no audio")
+            _speak_error("Audio generation failed. Check your internet connection.")
+            return
+        logger.debug(f"Streamed audio: {len(mp3_data)} bytes in {chunk_count} chunks")
+        trace.add("generate", request_time, time.time(), source="stream", chars=len(text))
+
+        # Hand off the remainder as the queue slot frees up
+        while not self._stop_requested and not hand_off(final=True):
+            self._pygame.time.wait(20)
+        self._store_audio(cache_key, bytes(mp3_data))
+
+        self._wait_for_playback(self._channel_busy)
+
+    def speak(self, text: str, trace: Trace = NULL_TRACE) -> None:
         if not text or not text.strip():
             return
         self._stop_playback()
 
-        text_hash = self._get_text_hash(text)
+        voice_id, rate, cache_key = self._request_params(text)
+
+        # A prefetch of this line may still be generating - take it over now, before a
+        # prefetch window update for the following lines can cancel it
+        in_flight = None if cache_key in self._cache else self._prefetcher.claim(cache_key)
+        if in_flight is not None:
+            self._prefetch_claimed.add(cache_key)
+
+        def _speak():
+            unsaved = False  # Generated here and not cached yet
+            # Check if this text was already generated (prefetched or spoken before)
+            audio = self._cache.read(cache_key)
+            if audio:
+                logger.debug(f"Using cached audio for: {text[:30]}...")
+                trace.mark("cache_hit", chars=len(text))
+                self._take_prefetched(cache_key)
+            (CACHE_HITS if audio else CACHE_MISSES).inc()
+
+            # Wait for an in-flight prefetch instead of duplicating it
+            future = None if audio else in_flight
+
+            # Stream if not cached (playback starts before generation finishes)
+            # (not with time stretch: the whole line is needed to stretch it seamlessly)
+            if not audio and future is None and self._stream_audio and self._channel and not self._time_stretch:
+                self._speak_streaming(text, voice_id, rate, cache_key, trace)
+                return
 
-        def _speak_thread():
-            self._generating = True
-            self._paused = False
-            self._stop_requested = False
-            audio_file = None
+            # Generate if not cached
+            if not audio:
+                source = "prefetch" if future is not None else "request"
+                if future is None:
+                    future = self._service.submit(text, voice_id, rate, timeout=self.GENERATION_TIMEOUT)
+                self._request = future
+                started = time.time()
+                audio = future.result()
+                trace.add("generate", started, time.time(), source=source, chars=len(text))
+
+                if not audio:
+                    logger.error("Edge TTS generated no audio")
+                    _speak_error("Audio generation failed. Check your internet connection.")
+                    return
+                logger.debug(f"Generated audio: {len(audio)} bytes")
 
-            try:
-                # Check if we have a prefetched file for this text
-                if text_hash in self._prefetch_cache:
-                    audio_file = self._prefetch_cache.pop(text_hash)
-                    if os.path.exists(audio_file):
-                        logger.debug(f"Using prefetched audio for: {text[:30]}...")
-                    else:
-                        audio_file = None  # File was cleaned up, regenerate
-
-                # Generate if not prefetched
-                if audio_file is None:
-                    import edge_tts
-
-                    voice_id = self.VOICES.get(self._voice_name, "en-US-AriaNeural")
-                    rate = self._rate_to_edge_modifier()
-
-                    # Create unique temp file
-                    self._file_counter += 1
-                    audio_file = str(self._temp_dir / f"herald_{self._file_counter}.mp3")
-
-                    # Run async edge-tts with timeout (prevents indefinite hangs
-                    # from network issues or WebSocket disconnects)
-                    GENERATION_TIMEOUT = 30  # seconds
-
-                    async def generate():
-                        communicate = edge_tts.Communicate(text, voice_id, rate=rate)
-                        await asyncio.wait_for(communicate.save(audio_file), timeout=GENERATION_TIMEOUT)
-
-                    asyncio.run(generate())
-
-                    # Verify file was generated successfully
-                    if os.path.exists(audio_file):
-                        file_size = os.path.getsize(audio_file)
-                        if file_size == 0:
-                            logger.error(f"Edge TTS generated empty file: {audio_file}")
-                            _speak_error("Audio generation failed. Check your internet connection.")
-                            return
-                        logger.debug(f"Generated audio: {file_size} bytes")
-                    else:
-                        logger.error(f"Edge TTS failed to create file: {audio_file}")
-                        _speak_error("Audio generation failed. Check your internet connection.")
-                        return
+                # An attached prefetch stores its own result
+                unsaved = future is not in_flight
 
+            try:
                 # Check if stop was requested during generation
                 if self._stop_requested:
-                    self._cleanup_file(audio_file)
                     return
 
-                # Store for cleanup
-                self._audio_file = audio_file
-
                 # Done generating, now playing
                 self._generating = False
                 self._speaking = True
                 _acquire_speaking_mutex()
 
-                # Play the audio (with lock for thread safety)
-                with self._mixer_lock:
-                    if self._stop_requested:
-                        return
-                    try:
-                        self._pygame.mixer.music.load(self._audio_file)
-                        self._pygame.mixer.music.set_volume(1.0)  # Ensure volume is max
-                        self._pygame.mixer.music.play()
-                        logger.debug(f"Started playback: {self._audio_file}")
-                    except Exception as e:
-                        logger.error(f"Failed to play audio: {e}")
-                        _speak_error("Audio playback failed.")
-                        return
-
-                # Wait for playback to complete (with timeout to prevent hang
-                # when audio device disappears, e.g. RDP disconnect)
-                playback_start = time.time()
-                PLAYBACK_TIMEOUT = 30  # seconds
-                while True:
-                    with self._mixer_lock:
-                        try:
-                            busy = self._pygame.mixer.music.get_busy()
-                        except Exception:
-                            busy = False
-                    if not busy and not self._paused:
-                        break
-                    if not self._speaking:
-                        break
-                    if time.time() - playback_start > PLAYBACK_TIMEOUT:
-                        logger.warning("Playback timeout - audio device may be unavailable")
-                        break
-                    self._pygame.time.wait(100)
-
-            except Exception as e:
-                logger.error(f"Edge TTS error: {e}")
-                _speak_error(f"Text to speech error: {str(e)[:50]}")
+                if not self._play_audio(audio):
+                    return
             finally:
-                self._generating = False
-                self._speaking = False
-                _release_speaking_mutex()
-                self._cleanup_audio()
+                # Cached once playback has started: the disk write stays off the time to first audio
+                if unsaved:
+                    self._store_audio(cache_key, audio)
 
-        self._thread_start_time = time.time()
-        self._thread = threading.Thread(target=_speak_thread, daemon=True)
-        self._thread.start()
+            # Wait for playback to complete
+            self._wait_for_playback(self._channel_busy if self._channel else self._music_busy)
 
-    def prefetch(self, text: str) -> None:
-        """Pre-generate audio for text (for next line prefetching)."""
-        if not text or not text.strip():
-            return
+        self._start_speak_thread(_speak, trace)
 
-        text_hash = self._get_text_hash(text)
+    def speak_continuous(self, text: str, trace: Trace = NULL_TRACE) -> None:
+        """Speak a long block of text as one stream of sentence chunks.
 
-        # Don't prefetch if already cached
-        if text_hash in self._prefetch_cache:
+        Chunks sized to CONTINUOUS_CHUNK_SECONDS are generated with bounded
+        parallelism and queued on the stream channel in order, so playback
+        starts after the first chunk and no single request has to fit the
+        generation timeout. Pause, resume and stop apply to the whole stream.
+        """
+        if not text or not text.strip():
             return
+        chunks = split_into_chunks(text, words_for_duration(CONTINUOUS_CHUNK_SECONDS, self._rate))
+        if len(chunks) <= 1 or not self._channel:
+            self.speak(text, trace)
+            return
+        self._stop_playback()
 
-        def _prefetch_thread():
-            try:
-                import edge_tts
-
-                voice_id = self.VOICES.get(self._voice_name, "en-US-AriaNeural")
-                rate = self._rate_to_edge_modifier()
+        voice_id = self.VOICES.get(self._voice_name, "en-US-AriaNeural")
+        rate = self._rate_to_edge_modifier()
+        logger.debug(f"Continuous read: {len(chunks)} chunks")
 
-                # Create unique temp file
-                self._file_counter += 1
-                audio_file = str(self._temp_dir / f"herald_prefetch_{self._file_counter}.mp3")
+        def _speak():
+            self._play_chunks(chunks, voice_id, rate, trace)
+            self._wait_for_playback(self._channel_busy)
 
-                PREFETCH_TIMEOUT = 15  # seconds (shorter than speak timeout)
+        self._start_speak_thread(_speak, trace)
 
-                async def generate():
-                    communicate = edge_tts.Communicate(text, voice_id, rate=rate)
-                    await asyncio.wait_for(communicate.save(audio_file), timeout=PREFETCH_TIMEOUT)
+    def _play_chunks(self, chunks: list[str], voice_id: str, rate: str, trace: Trace):
+        """Generate chunks (up to CONTINUOUS_WORKERS at once) and queue them for playback in order."""
+        remaining = iter(chunks)
+        jobs: deque[tuple[str, Future | bytes]] = deque()  # (cache key, generation or cached audio)
 
-                asyncio.run(generate())
+        def fill():
+            while len(jobs) < CONTINUOUS_WORKERS:
+                text = next(remaining, None)
+                if text is None:
+                    return
+                key = AudioCache.make_key(text, voice_id, rate)
+                audio = self._cache.read(key)
+                (CACHE_HITS if audio else CACHE_MISSES).inc()
+                jobs.append((key, audio or self._service.submit(text, voice_id, rate, timeout=self.GENERATION_TIMEOUT)))
 
-                # Verify file was generated successfully
-                if os.path.exists(audio_file):
-                    file_size = os.path.getsize(audio_file)
-                    if file_size == 0:
-                        logger.error(f"Prefetch generated empty file: {audio_file}")
-                        return
+        fill()
+        try:
+            while jobs and not self._stop_requested:
+                key, job = jobs[0]
+                generated = isinstance(job, Future)
+                if generated:
+                    self._request = job
+                    started = time.time()
+                    audio = job.result()
+                    trace.add("generate", started, time.time(), source="chunk")
                 else:
-                    logger.error(f"Prefetch failed to create file: {audio_file}")
-                    return
+                    audio = job
+                jobs.popleft()
+                fill()
+
+                if not audio:
+                    logger.warning("Edge TTS generated no audio for a chunk - skipping it")
+                    continue
+                pcm = self._stretch(self._decode_pcm(audio), self._playback_speed)
+                # The queue slot frees when the playing chunk ends and the queued one starts
+                while not self._feed_channel(pcm):
+                    self._pygame.time.wait(20)
+                if not self._speaking and not self._stop_requested:
+                    # First chunk generated, now playing
+                    self._generating = False
+                    self._speaking = True
+                    _acquire_speaking_mutex()
+                    self._playback_began()
+                if generated:
+                    self._store_audio(key, audio)  # Once queued, so the write doesn't delay playback
+        finally:
+            for _, job in jobs:
+                if isinstance(job, Future):
+                    job.cancel()
+
+    def _start_speak_thread(self, body: Callable[[], None], trace: Trace):
+        """Run body on a new speak thread, with shared state setup, error reporting and cleanup.
+
+        trace receives the playback spans of the audio body plays (including
+        lines queued gaplessly behind it, which belong to the same read).
+        """
 
-                # Store in cache and evict old entries if needed
-                self._prefetch_cache[text_hash] = audio_file
-                self._evict_prefetch_cache()
-                logger.debug(f"Prefetched: {text[:30]}...")
+        def _speak_thread():
+            self._generating = True
+            self._paused = False
+            self._stop_requested = False
 
+            try:
+                body()
+            except CancelledError:
+                logger.debug("Generation cancelled")
             except Exception as e:
-                logger.debug(f"Prefetch failed: {e}")
+                logger.error(f"Edge TTS error: {e}")
+                _speak_error(f"Text to speech error: {str(e)[:50]}")
+            finally:
+                # A newer speak() has taken over - leave its state and audio alone
+                if self._thread is threading.current_thread():
+                    self._generating = False
+                    self._speaking = False
+                    _release_speaking_mutex()
+                    self._cleanup_audio()
+                    _notify_playback_finished()
+
+        # Mark busy before the thread starts so the main loop can't mistake the gap for "finished"
+        self._generating = True
+        self._trace = trace
+        self._thread_start_time = time.time()
+        self._thread = threading.Thread(target=_speak_thread, daemon=True)
+        self._thread.start()
 
-        self._prefetch_thread = threading.Thread(target=_prefetch_thread, daemon=True)
-        self._prefetch_thread.start()
+    def prefetch_ahead(self, lines: list[str], current_index: int) -> None:
+        """Pre-generate audio for the lines after current_index.
+
+        How far ahead adapts to measured generation speed vs. playback length.
+        In-flight prefetches for lines that fell out of the window (skip back,
+        jump ahead) are cancelled.
+        """
+        voice_id = self.VOICES.get(self._voice_name, "en-US-AriaNeural")
+        rate = self._rate_to_edge_modifier()
+
+        jobs = []
+        for distance in range(1, self._prefetcher.lookahead + 1):
+            index = current_index + distance
+            if index >= len(lines):
+                break
+            text = lines[index]
+            if not text or not text.strip():
+                continue
+            cache_key = AudioCache.make_key(text, voice_id, rate)
+            if cache_key not in self._cache:
+                jobs.append((distance, cache_key, (text, voice_id, rate)))
+
+        self._prefetcher.update(jobs)
+
+    def _store_prefetched(self, cache_key: str, job: tuple[str, str, str], audio: bytes):
+        """Store a completed prefetch in the cache (evicts old entries if needed). Runs on the cache writer thread."""
+        if not audio:
+            logger.error("Prefetch generated no audio")
+            return
+        self._store_audio(cache_key, audio)
+        logger.debug(f"Prefetched: {job[0][:30]}...")
+        if cache_key in self._prefetch_claimed:
+            self._prefetch_claimed.discard(cache_key)  # Already counted as used when claimed
+        else:
+            self._prefetched.add(cache_key)
+        if cache_key == self._next_key:
+            self._playback_wake.set()  # The playing line can queue it now
 
     def clear_prefetch_cache(self):
-        """Clear all prefetched audio files."""
-        for audio_file in self._prefetch_cache.values():
-            self._cleanup_file(audio_file)
-        self._prefetch_cache.clear()
-
-    def _evict_prefetch_cache(self):
-        """Remove oldest entries if cache exceeds max size (LRU eviction)."""
-        while len(self._prefetch_cache) > self._prefetch_cache_max_size:
-            # dict maintains insertion order in Python 3.7+, pop first item
-            oldest_key = next(iter(self._prefetch_cache))
-            old_file = self._prefetch_cache.pop(oldest_key)
-            self._cleanup_file(old_file)
-            logger.debug(f"Evicted prefetch cache entry: {oldest_key[:8]}...")
-
-    def _cleanup_file(self, filepath: str):
-        """Clean up a specific audio file."""
-        try:
-            if filepath and os.path.exists(filepath):
-                os.remove(filepath)
-        except Exception:  # noqa: S110
-            pass
+        """Cancel outstanding prefetches when the line queue is cleared.
+
+        Prefetched audio lives in the persistent cache, so it is kept for
+        re-reads rather than deleted.
+        """
+        self._prefetcher.cancel_all()
+        self._cache.flush()
+        PREFETCH_WASTED.inc(len(self._prefetched))
+        self._prefetched.clear()
+        self._prefetch_claimed.clear()
+        self._last_playback_end = 0.0  # The next read doesn't follow on from this one
+
+    def _take_prefetched(self, cache_key: str):
+        """Count a prefetched line as used once it plays."""
+        if cache_key in self._prefetched:
+            self._prefetched.discard(cache_key)
+            PREFETCH_USED.inc()
 
     def _cleanup_audio(self):
-        """Clean up current audio file."""
-        file_to_delete = None
+        """Release the in-memory audio held by mixer.music (fallback playback)."""
         with self._mixer_lock:
             try:
-                if self._audio_file and os.path.exists(self._audio_file):
-                    try:
-                        self._pygame.mixer.music.stop()
-                    except Exception:  # noqa: S110
-                        pass
-                    try:
-                        self._pygame.mixer.music.unload()
-                    except Exception:  # noqa: S110
-                        pass
-                    file_to_delete = self._audio_file
-                    self._audio_file = None
+                self._pygame.mixer.music.unload()
             except Exception as e:
                 logger.debug(f"Cleanup error (safe to ignore): {e}")
 
-        # File deletion outside the lock — no need to hold mixer lock for I/O
-        if file_to_delete:
-            self._pygame.time.wait(50)  # Wait for file handle release
-            try:
-                os.remove(file_to_delete)
-            except Exception:  # noqa: S110
-                pass
-
     @property
     def is_generating(self) -> bool:
         """Whether currently generating audio (before playback)."""
         return self._generating
 
+    @property
+    def first_chunk_latency(self) -> float | None:
+        """Seconds from request to first audio chunk for the last streamed utterance."""
+        return self._first_chunk_latency
+
     @property
     def speak_thread_age(self) -> float:
         """How long the current speak thread has been running (seconds). 0 if not running."""
@@ -597,13 +1120,22 @@ class EdgeTTSEngine(BaseTTSEngine):
 
     def stop(self) -> None:
         self._stop_requested = True
+        self._cancel_request()
         self._generating = False
         self._speaking = False
         _release_speaking_mutex()
         self._paused = False
+        self._next_key = None
+        self._line_boundary = None
+        self._stretch_state = None
+        self._restretch_pending = False
+        self._trace_playback(time.time(), stopped=True)
+        self._playback_wake.set()
         with self._mixer_lock:
             try:
                 self._pygame.mixer.music.stop()
+                if self._channel:
+                    self._channel.stop()
             except Exception:  # noqa: S110
                 pass
         self._cleanup_audio()
@@ -614,9 +1146,13 @@ class EdgeTTSEngine(BaseTTSEngine):
             with self._mixer_lock:
                 try:
                     self._pygame.mixer.music.pause()
+                    if self._channel:
+                        self._channel.pause()
                 except Exception:  # noqa: S110
                     pass
             self._paused = True
+            self._paused_at = time.time()
+            self._playback_wake.set()
             logger.debug("Paused")
 
     def resume(self) -> None:
@@ -624,9 +1160,19 @@ class EdgeTTSEngine(BaseTTSEngine):
             with self._mixer_lock:
                 try:
                     self._pygame.mixer.music.unpause()
+                    if self._channel:
+                        self._channel.unpause()
                 except Exception:  # noqa: S110
                     pass
+            paused_for = time.time() - self._paused_at
+            self._play_end += paused_for
+            if self._line_boundary is not None:
+                self._line_boundary += paused_for
+            if self._stretch_state is not None:
+                pcm, offset, started, speed = self._stretch_state
+                self._stretch_state = (pcm, offset, started + paused_for, speed)
             self._paused = False
+            self._playback_wake.set()
             logger.debug("Resumed")
 
     @property
@@ -645,6 +1191,17 @@ class EdgeTTSEngine(BaseTTSEngine):
     def rate(self, value: int):
         self._rate = max(MIN_RATE, min(MAX_RATE, value))
         set_setting("rate", self._rate)
+        if self._time_stretch:
+            # Audio is rendered at the base rate, so nothing is regenerated - the playing line speeds up
+            self._restretch_pending = True
+            self._playback_wake.set()
+        else:
+            # Prefetches in flight were requested at the old rate
+            self._prefetcher.cancel_all()
+
+    @property
+    def rate_changes_live(self) -> bool:
+        return self._time_stretch
 
     @property
     def voice_name(self) -> str:
@@ -656,6 +1213,7 @@ class EdgeTTSEngine(BaseTTSEngine):
         if name in self.VOICES:
             self._voice_name = name
             set_setting("voice", self._voice_name)
+            self._prefetcher.cancel_all()
 
     def check_mixer_health(self) -> bool:
         """Check if pygame mixer is still functional."""
@@ -683,6 +1241,7 @@ class EdgeTTSEngine(BaseTTSEngine):
                 init = self._pygame.mixer.get_init()
                 if init:
                     logger.info(f"Mixer reinitialized: freq={init[0]}, format={init[1]}, channels={init[2]}")
+                    self._channel = self._reserve_stream_channel()
                     return True
                 else:
                     logger.error("Mixer reinitialization returned None")
@@ -694,6 +1253,33 @@ class EdgeTTSEngine(BaseTTSEngine):
     def get_available_voices(self) -> list[str]:
         return list(self.VOICES.keys())
 
+    def shutdown(self) -> None:
+        self.stop()
+        self._service.shutdown()
+        self._cache_writer.shutdown()  # After the service, so no prefetch result arrives later
+
+
+class SyntheticTTSEngine(EdgeTTSEngine):
+    """Offline engine with deterministic generated audio, for benchmarks and load tests.
+
+    Runs the full online-voice pipeline (prefetch, cache, streaming, gapless
+    and continuous playback) against SyntheticGenerationService. Audio is
+    silence as long as the text takes to speak at the current rate.
+    """
+
+    # Own voice IDs, so synthetic audio never shares cache keys with real Edge audio
+    VOICES = {name: f"synthetic-{name}" for name in EdgeTTSEngine.VOICES}
+
+    def _create_service(self) -> EdgeGenerationService:
+        settings = load_settings()
+        return SyntheticGenerationService(
+            latency=settings.get("synthetic_latency_ms", DEFAULT_SYNTHETIC_LATENCY_MS) / 1000,
+            jitter=settings.get("synthetic_jitter_ms", DEFAULT_SYNTHETIC_JITTER_MS) / 1000,
+            failure_rate=settings.get("synthetic_failure_rate", DEFAULT_SYNTHETIC_FAILURE_RATE),
+            realtime_factor=settings.get("synthetic_realtime_factor", DEFAULT_SYNTHETIC_REALTIME_FACTOR),
+            seed=settings.get("synthetic_seed", DEFAULT_SYNTHETIC_SEED),
+        )
+
 
 # Singleton instance
 _engine_instance: BaseTTSEngine | None = None
@@ -707,13 +1293,18 @@ def get_engine() -> BaseTTSEngine:
         engine_type = settings.get("engine", "edge")  # Default to edge for better quality
         voice = settings.get("voice", "aria")
 
-        # Auto-select engine based on voice if not specified
-        if voice in EdgeTTSEngine.VOICES:
+        # Auto-select engine based on voice if not specified (synthetic is only chosen explicitly)
+        if engine_type == "synthetic":
+            pass
+        elif voice in EdgeTTSEngine.VOICES:
             engine_type = "edge"
         elif voice in Pyttsx3Engine.VOICES:
             engine_type = "pyttsx3"
 
-        if engine_type == "edge":
+        if engine_type == "synthetic":
+            logger.info("Using synthetic TTS (offline, generated silence for testing)")
+            _engine_instance = SyntheticTTSEngine()
+        elif engine_type == "edge":
             logger.info("Using Edge TTS (online, neural voices)")
             _engine_instance = EdgeTTSEngine()
         else:
@@ -727,7 +1318,7 @@ def switch_engine(engine_type: str) -> BaseTTSEngine:
     """Switch to a different TTS engine."""
     global _engine_instance
     if _engine_instance:
-        _engine_instance.stop()
+        _engine_instance.shutdown()
     _engine_instance = None
     set_setting("engine", engine_type)
     return get_engine()
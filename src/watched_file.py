@@ -0,0 +1,76 @@
+"""
+Herald Watched File
+
+A JSON config file that is rebuilt into an object whenever it changes on disk
+(filter_rules.json, pronunciation.json), so edits apply on the next read:
+- One stat() per read; the file is parsed again only when its mtime or size changes
+- A missing file gives the empty value; invalid JSON keeps the last good contents
+"""
+
+import json
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from loguru import logger
+
+
+class WatchedJsonFile:
+    """A JSON object file built into a value, rebuilt when its modification time or size changes. Thread-safe."""
+
+    def __init__(
+        self,
+        path: Path | str,
+        build: Callable[[dict], object],
+        empty: object,
+        describe: Callable[[object], str],
+        on_reload: Callable[[], None] | None = None,
+    ):
+        """
+        Args:
+            path: JSON file holding an object (it's fine for it not to exist)
+            build: Turns the file's contents into the value
+            empty: Value while the file doesn't exist
+            describe: Summary of a value for the log ("12 filter rules")
+            on_reload: Called after the value changes (e.g. to drop cached results)
+        """
+        self.path = Path(path)
+        self.on_reload = on_reload
+        self._build = build
+        self._empty = empty
+        self._describe = describe
+        self._value = empty
+        self._stamp: tuple[int, int] | None = None
+        self._lock = threading.Lock()
+
+    def current(self) -> object:
+        """The value for the file as it is now, rebuilt first if the file changed."""
+        try:
+            stat = self.path.stat()
+            stamp = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            stamp = None
+        if stamp != self._stamp:
+            with self._lock:
+                if stamp != self._stamp:
+                    self._load(stamp is not None)
+                    self._stamp = stamp
+        return self._value
+
+    def _load(self, exists: bool):
+        if not exists:
+            if self._value is not self._empty:
+                logger.info(f"{self.path.name} removed - no longer using it")
+            value = self._empty
+        else:
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+                if not isinstance(data, dict):
+                    raise ValueError("expected a JSON object")
+            except (OSError, ValueError) as e:
+                logger.error(f"Failed to load {self.path.name}, keeping the previous contents: {e}")
+                return
+            value = self._build(data)
+            logger.info(f"Loaded {self._describe(value)} from {self.path.name}")
+        self._value = value
+        if self.on_reload:
+            self.on_reload()
@@ -55,6 +55,24 @@ if "%TEST_TYPE%"=="slow" (
     goto :end
 )
 
+if "%TEST_TYPE%"=="benchmark" (
+    echo Running benchmarks against the saved baseline...
+    pytest tests/benchmarks -m benchmark --benchmark-compare --benchmark-compare-fail=mean:20%%
+    goto :end
+)
+
+if "%TEST_TYPE%"=="benchmark-baseline" (
+    echo Saving benchmark baseline...
+    pytest tests/benchmarks -m benchmark --benchmark-save=baseline
+    goto :end
+)
+
+if "%TEST_TYPE%"=="benchmark-smoke" (
+    echo Checking the benchmarks run, without timing...
+    pytest tests/benchmarks -m benchmark --benchmark-disable
+    goto :end
+)
+
 if "%TEST_TYPE%"=="coverage" (
     echo Running tests with coverage...
     pytest tests/ -v --cov=src --cov-report=term-missing
@@ -72,6 +90,9 @@ echo   synthetic   - Run synthetic TTS tests
 echo   integration - Run integration tests
 echo   fast        - Run all except slow tests
 echo   slow        - Run only slow tests
+echo   benchmark   - Run benchmarks, fail if 20%% slower than the baseline
+echo   benchmark-baseline - Save the current benchmark timings as the baseline
+echo   benchmark-smoke - Run each benchmark once without timing (CI)
 echo   coverage    - Run with coverage report
 echo.
 
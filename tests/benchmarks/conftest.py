@@ -0,0 +1,182 @@
+"""
+Herald Benchmark Corpora
+
+Generated, seeded text resembling what users paste into Herald, so
+text_filter timings are comparable between runs and machines:
+- build_log: 10k lines of compiler/test-runner output
+- assistant_transcript: coding-assistant terminal session (prose, tool calls, diffs)
+- markdown_doc: README-style docs with headings, lists, links and code fences
+- pdf_prose: hard-wrapped prose with hyphenation, page numbers and footnotes
+- terminal_dump: wide OCR'd terminal screens (box-drawn tables, borders, progress bars, trees)
+
+Plus a 10k-entry pronunciation dictionary (acronyms, abbreviations, units, jargon).
+"""
+
+import random
+import string
+import pytest
+
+CORPUS_LINES = 10_000
+DICTIONARY_ENTRIES = 10_000
+
+VOCABULARY = (
+    "the queue reads each line aloud while the next one is generated so playback never waits "
+    "for the network and long documents start speaking almost immediately after the hotkey "
+    "settings voice speed cache region monitor clipboard selection paragraph sentence window"
+)
+WORDS = VOCABULARY.split()
+
+
+def _sentence(rng: random.Random, low: int = 6, high: int = 18) -> str:
+    words = [rng.choice(WORDS) for _ in range(rng.randint(low, high))]
+    return " ".join(words).capitalize() + rng.choice(".......?!")
+
+
+def build_log(rng: random.Random, count: int) -> list[str]:
+    templates = [
+        lambda: (
+            f"2026-02-{rng.randint(10, 28)} 14:{rng.randint(10, 59)}:{rng.randint(10, 59)} INFO Build {rng.random()}"
+        ),
+        lambda: f"[{rng.randint(1, 500)}/500] Compiling src/engine/part_{rng.randint(1, 99)}.cpp",
+        lambda: f"C:\\dev\\herald\\build\\obj\\Release\\unit_{rng.randint(1, 999)}.obj",
+        lambda: f"warning: unused variable 'buffer_{rng.randint(1, 50)}' [-Wunused-variable]",
+        lambda: f"tests/unit/test_case_{rng.randint(1, 80)}.py::TestThing::test_{rng.choice(WORDS)} PASSED",
+        lambda: "=" * rng.randint(20, 80),
+        lambda: f"$ npm run build -- --target {rng.choice(WORDS)}",
+        lambda: f"{rng.getrandbits(160):040x}",
+        lambda: _sentence(rng),
+        lambda: "",
+    ]
+    weights = [30, 20, 8, 10, 12, 3, 2, 2, 10, 3]
+    return [rng.choices(templates, weights)[0]() for _ in range(count)]
+
+
+def assistant_transcript(rng: random.Random, count: int) -> list[str]:
+    templates = [
+        lambda: _sentence(rng, 10, 30) + " " + _sentence(rng),
+        lambda: f"Read tool: src/{rng.choice(WORDS)}_{rng.choice(WORDS)}.py",
+        lambda: f"Running tests for {rng.choice(WORDS)}...",
+        lambda: f"@@ -{rng.randint(1, 900)},7 +{rng.randint(1, 900)},9 @@",
+        lambda: f"+    self._{rng.choice(WORDS)} = {rng.choice(WORDS)}_{rng.choice(WORDS)}()",
+        lambda: f"-    return self.{rng.choice(WORDS)}",
+        lambda: f"- **{rng.choice(WORDS).title()}**: the `{rng.choice(WORDS)}_{rng.choice(WORDS)}` setting controls it",
+        lambda: "```python" if rng.random() < 0.5 else "```",
+        lambda: f"def {rng.choice(WORDS)}_{rng.choice(WORDS)}(self, text: str) -> bool:",
+        lambda: f"tokens: {rng.randint(1000, 90000)}",
+        lambda: "───" * rng.randint(5, 25),
+    ]
+    weights = [30, 6, 5, 4, 8, 4, 10, 4, 6, 2, 2]
+    return [rng.choices(templates, weights)[0]() for _ in range(count)]
+
+
+def markdown_doc(rng: random.Random, count: int) -> list[str]:
+    templates = [
+        lambda: f"## {rng.choice(WORDS).title()} {rng.choice(WORDS).title()}",
+        lambda: _sentence(rng, 12, 30) + " " + _sentence(rng),
+        lambda: f"- Use **{rng.choice(WORDS)}** with [the docs](https://example.com/{rng.choice(WORDS)}) for details",
+        lambda: f"1. Press `Alt+{rng.choice('SNBPOM')}` to {rng.choice(WORDS)} the {rng.choice(WORDS)}",
+        lambda: f"| {rng.choice(WORDS)} | {rng.randint(0, 2000)} | {rng.choice(WORDS)} |",
+        lambda: "|---|---|---|",
+        lambda: "```",
+        lambda: f"pip install {rng.choice(WORDS)}",
+        lambda: f'"{rng.choice(WORDS)}_{rng.choice(WORDS)}": {rng.randint(0, 500)},',
+        lambda: "",
+    ]
+    weights = [6, 35, 12, 8, 6, 2, 4, 2, 5, 20]
+    return [rng.choices(templates, weights)[0]() for _ in range(count)]
+
+
+def pdf_prose(rng: random.Random, count: int) -> list[str]:
+    text = " ".join(_sentence(rng, 8, 24) for _ in range(count))
+    lines = []
+    position = 0
+    while len(lines) < count:
+        width = rng.randint(60, 80)
+        line = text[position : position + width]
+        position += width
+        if line and line[-1].isalpha() and rng.random() < 0.1:
+            line += "-"  # Hyphenated break
+        lines.append(line.strip())
+        if rng.random() < 0.02:
+            lines.append(str(rng.randint(1, 400)))  # Page number
+        if rng.random() < 0.01:
+            lines.append(f"{rng.randint(1, 40)} See {rng.choice(WORDS).title()} et al., {rng.randint(1990, 2025)}.")
+    return lines[:count]
+
+
+def terminal_dump(rng: random.Random, count: int) -> list[str]:
+    def table_row() -> str:
+        cells = [
+            f" {rng.choice(WORDS):<12}" if rng.random() < 0.6 else f" {rng.randint(0, 99999):>12}" for _ in range(8)
+        ]
+        return "│" + "│".join(cells) + "│"
+
+    templates = [
+        table_row,
+        lambda: "├" + "┼".join("─" * 13 for _ in range(8)) + "┤",
+        lambda: "╔" + "═" * rng.randint(100, 180) + "╗",
+        lambda: "║ " + _sentence(rng, 8, 20).ljust(rng.randint(110, 170)) + " ║",
+        lambda: (
+            f"{rng.choice(WORDS)} " + "█" * rng.randint(0, 60) + "░" * rng.randint(0, 60) + f" {rng.randint(0, 100)}%"
+        ),
+        lambda: "━" * rng.randint(120, 200),
+        lambda: "│   " * rng.randint(0, 4) + f"├── {rng.choice(WORDS)}_{rng.choice(WORDS)}.py",
+        lambda: (
+            f"  {rng.randint(100, 99999):>6} root      20   0 {rng.randint(1000, 999999):>8}K  "
+            + f"{rng.random() * 100:4.1f} {rng.choice(WORDS)}"
+        ),
+        lambda: _sentence(rng, 10, 30),
+    ]
+    weights = [30, 10, 4, 10, 8, 6, 12, 10, 10]
+    return [rng.choices(templates, weights)[0]() for _ in range(count)]
+
+
+CORPORA = {
+    "build_log": build_log,
+    "assistant_transcript": assistant_transcript,
+    "markdown_doc": markdown_doc,
+    "pdf_prose": pdf_prose,
+    "terminal_dump": terminal_dump,
+}
+
+
+@pytest.fixture
+def record_throughput(benchmark):
+    """Report per-line throughput alongside pytest-benchmark's per-call timings: record_throughput(lines)."""
+
+    def record(lines: list[str]):
+        benchmark.extra_info["lines"] = len(lines)
+        # No stats with --benchmark-disable (each benchmark runs once, untimed, as a smoke test)
+        if benchmark.stats is not None and benchmark.stats.stats.mean:
+            benchmark.extra_info["lines_per_second"] = round(len(lines) / benchmark.stats.stats.mean)
+
+    return record
+
+
+@pytest.fixture(scope="session", params=sorted(CORPORA))
+def corpus(request) -> tuple[str, list[str]]:
+    """(name, lines) for each generated corpus, CORPUS_LINES lines, seeded."""
+    name = request.param
+    return name, CORPORA[name](random.Random(name), CORPUS_LINES)
+
+
+def pronunciation_entries(rng: random.Random, count: int) -> dict[str, str]:
+    entries = {word: word.upper() for word in WORDS[::3]}  # Corpus words, so lines have matches to replace
+    while len(entries) < count:
+        kind = rng.random()
+        if kind < 0.4:
+            term = "".join(rng.choices(string.ascii_uppercase, k=rng.randint(2, 5)))  # Acronym
+        elif kind < 0.6:
+            term = ".".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 3))) + "."  # Abbreviation
+        elif kind < 0.7:
+            term = f"{rng.choice(string.ascii_lowercase)}{rng.randint(2, 99)}{rng.choice(string.ascii_lowercase)}"
+        else:
+            term = "".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 12)))  # Jargon
+        entries[term] = " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 3)))
+    return entries
+
+
+@pytest.fixture(scope="session")
+def pronunciation_data() -> dict[str, str]:
+    """Term -> spoken form, DICTIONARY_ENTRIES entries, seeded."""
+    return pronunciation_entries(random.Random("pronunciation"), DICTIONARY_ENTRIES)
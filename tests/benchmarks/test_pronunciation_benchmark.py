@@ -0,0 +1,29 @@
+"""
+Benchmarks for Herald's pronunciation dictionary (applied to every spoken line).
+
+Uses the generated 10k-entry dictionary from conftest.py; save a baseline
+and compare as described in test_text_filter_benchmark.py.
+"""
+
+import pytest
+
+
+@pytest.mark.benchmark(group="pronunciation")
+def test_apply_pronunciations(benchmark, corpus, pronunciation_data, record_throughput):
+    """One pass of the 10k-entry dictionary over every line of a corpus."""
+    from pronunciation import PronunciationDictionary
+
+    _, lines = corpus
+    dictionary = PronunciationDictionary.from_dict(pronunciation_data)
+    result = benchmark(lambda: [dictionary.apply(line) for line in lines])
+    record_throughput(lines)
+    assert result != lines
+
+
+@pytest.mark.benchmark(group="pronunciation_load")
+def test_build_dictionary(benchmark, pronunciation_data):
+    """Compiling the trie, as done at startup and whenever the file is saved."""
+    from pronunciation import PronunciationDictionary
+
+    dictionary = benchmark(PronunciationDictionary.from_dict, pronunciation_data)
+    assert len(dictionary) == len(pronunciation_data)
@@ -0,0 +1,67 @@
+"""
+Benchmarks for Herald's text filter (runs on every clipboard read).
+
+Not part of the default test run. Timings depend on the machine, so the
+baseline is saved locally (in the gitignored .benchmarks/) rather than
+committed: save one on a clean checkout, then compare after changing
+text_filter.py (fails if any benchmark's mean is 20% slower):
+    pytest tests/benchmarks -m benchmark --benchmark-save=baseline
+    pytest tests/benchmarks -m benchmark --benchmark-compare --benchmark-compare-fail=mean:20%
+(test_runner.bat benchmark-baseline / benchmark). On CI, or to just check the
+benchmarks still run, add --benchmark-disable to run each once without timing.
+"""
+
+import pytest
+
+
+@pytest.mark.benchmark(group="filter_lines")
+def test_filter_lines(benchmark, corpus, record_throughput):
+    """Whole-paste filtering of new text, as done for every speak hotkey."""
+    from text_filter import clear_line_cache, filter_lines
+
+    _, lines = corpus
+    result = benchmark.pedantic(
+        filter_lines, args=(lines,), kwargs={"filter_code": True}, setup=clear_line_cache, rounds=20
+    )
+    record_throughput(lines)
+    assert 0 < len(result) < len(lines)
+
+
+@pytest.mark.benchmark(group="filter_lines")
+def test_filter_lines_repeated(benchmark, corpus, record_throughput):
+    """Filtering text that was read before (auto-read re-OCR, re-reading a document) - served by the line cache."""
+    from text_filter import clear_line_cache, filter_lines
+
+    _, lines = corpus
+    clear_line_cache()
+    filter_lines(lines, filter_code=True)
+    result = benchmark(filter_lines, lines, filter_code=True)
+    record_throughput(lines)
+    assert 0 < len(result) < len(lines)
+
+
+@pytest.mark.benchmark(group="is_code_like")
+def test_is_code_like(benchmark, corpus, record_throughput):
+    from text_filter import is_code_like
+
+    _, lines = corpus
+    benchmark(lambda: [is_code_like(line) for line in lines])
+    record_throughput(lines)
+
+
+@pytest.mark.benchmark(group="is_unspeakable")
+def test_is_unspeakable(benchmark, corpus, record_throughput):
+    from text_filter import is_unspeakable
+
+    _, lines = corpus
+    benchmark(lambda: [is_unspeakable(line) for line in lines])
+    record_throughput(lines)
+
+
+@pytest.mark.benchmark(group="normalize_for_speech")
+def test_normalize_for_speech(benchmark, corpus, record_throughput):
+    from text_filter import normalize_for_speech
+
+    _, lines = corpus
+    benchmark(lambda: [normalize_for_speech(line, filter_paths_urls=True) for line in lines])
+    record_throughput(lines)
@@ -0,0 +1,105 @@
+"""
+Integration tests for the Edge stand-in server.
+
+Runs the real edge-tts client and EdgeGenerationService against the local
+stand-in, so no internet access is needed.
+"""
+
+import asyncio
+import time
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def edge_tts_url(monkeypatch):
+    """Restore edge-tts's module-level service URL after each test, whatever the test left behind."""
+    import edge_tts.communicate
+
+    monkeypatch.setattr(edge_tts.communicate, "WSS_URL", edge_tts.communicate.WSS_URL)
+    return edge_tts.communicate.WSS_URL
+
+
+@pytest.fixture
+def standin():
+    """Start a fast stand-in server on a free local port."""
+    from edge_standin import EdgeStandInServer
+
+    server = EdgeStandInServer(latency=0.02, jitter=0, realtime_factor=100)
+    server.start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def service(standin):
+    """EdgeGenerationService pointed at the stand-in."""
+    from edge_service import EdgeGenerationService
+
+    service = EdgeGenerationService(standin.url)
+    yield service
+    service.shutdown()
+
+
+@pytest.mark.integration
+class TestEdgeStandIn:
+    """Test the real generation path against the stand-in."""
+
+    def test_submit_returns_audio_for_text_and_rate(self, service):
+        """Whole-utterance requests get audio sized to the text and rate."""
+        from synthetic_service import synthetic_audio
+
+        text = "Fish & chips, <quoted> text"
+        audio = service.submit(text, "en-US-AriaNeural", "+100%", timeout=5).result(timeout=6)
+        assert audio == synthetic_audio(text, "+100%")
+
+    def test_stream_delivers_chunks(self, service):
+        """Streamed requests deliver the same audio chunk by chunk."""
+        from synthetic_service import synthetic_audio
+
+        handle = service.stream("one two three four", "en-US-AriaNeural", "+0%", timeout=5)
+        chunks = list(handle)
+        assert len(chunks) > 1
+        assert b"".join(chunks) == synthetic_audio("one two three four", "+0%")
+        assert handle.first_chunk_latency is not None
+
+    def test_word_boundaries(self, service, monkeypatch):
+        """edge-tts receives one WordBoundary per word, in order."""
+        import edge_tts
+
+        async def boundaries():
+            communicate = edge_tts.Communicate("alpha beta gamma", "en-US-AriaNeural", boundary="WordBoundary")
+            return [chunk["text"] async for chunk in communicate.stream() if chunk["type"] == "WordBoundary"]
+
+        monkeypatch.setattr("edge_tts.communicate.WSS_URL", service._wss_url())
+        assert asyncio.run(boundaries()) == ["alpha", "beta", "gamma"]
+
+    def test_rejected_connection_raises(self, standin, service):
+        """Scripted failures surface as errors from the request."""
+        standin.failure_rate = 1.0
+        future = service.submit("Hello", "en-US-AriaNeural", "+0%", timeout=5)
+        assert future.exception(timeout=6) is not None
+        assert standin.failures == 1
+
+    def test_stalled_request_times_out(self, standin, service):
+        """A request the server never answers hits the generation timeout."""
+        standin.stall_rate = 1.0
+        future = service.submit("Hello", "en-US-AriaNeural", "+0%", timeout=0.3)
+        assert isinstance(future.exception(timeout=3), TimeoutError)
+
+    def test_endpoint_override_is_restored(self, standin, edge_tts_url):
+        """The stand-in URL is only set while requests run, and never outlives the service."""
+        import edge_tts.communicate
+        from edge_service import EdgeGenerationService
+
+        service = EdgeGenerationService(standin.url)
+        service.submit("Hello", "en-US-AriaNeural", "+0%", timeout=5).result(timeout=6)
+        assert edge_tts_url == edge_tts.communicate.WSS_URL
+
+        standin.stall_rate = 1.0
+        service.submit("Hello", "en-US-AriaNeural", "+0%", timeout=30)
+        deadline = time.time() + 5
+        while not standin.stalls and time.time() < deadline:
+            time.sleep(0.01)
+        assert edge_tts_url != edge_tts.communicate.WSS_URL  # Overridden while the request is connected
+        service.shutdown()
+        assert edge_tts_url == edge_tts.communicate.WSS_URL
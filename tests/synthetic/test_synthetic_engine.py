@@ -0,0 +1,214 @@
+"""
+Synthetic tests for Herald's offline synthetic TTS engine.
+
+Runs the full online-voice playback pipeline with generated audio,
+on the SDL dummy audio driver (no network or sound device needed).
+"""
+
+import json
+import time
+from unittest.mock import patch
+
+import pytest
+
+
+@pytest.mark.synthetic
+class TestSyntheticTTSEngine:
+    """Test end-to-end playback with the synthetic engine."""
+
+    @pytest.fixture
+    def synthetic_engine(self, temp_config_dir, tmp_path, monkeypatch):
+        """Create a SyntheticTTSEngine with fast generation and a temporary cache."""
+        monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
+        settings_file = temp_config_dir / "settings.json"
+        settings = {
+            "engine": "synthetic",
+            "rate": 600,
+            "audio_cache_dir": str(tmp_path / "cache"),
+            "synthetic_latency_ms": 20,
+            "synthetic_jitter_ms": 0,
+            "synthetic_realtime_factor": 50,
+        }
+        settings_file.write_text(json.dumps(settings))
+
+        with patch("config.SETTINGS_FILE", settings_file), patch("config.CONFIG_DIR", temp_config_dir):
+            from tts_engine import SyntheticTTSEngine
+
+            engine = SyntheticTTSEngine()
+            yield engine
+            engine.shutdown()
+            engine._pygame.mixer.quit()
+
+    @staticmethod
+    def _speak_and_time(engine, text: str, trace=None) -> float:
+        start = time.time()
+        if trace is None:
+            engine.speak(text)
+        else:
+            engine.speak(text, trace)
+        while engine.is_speaking or engine.is_generating:
+            assert time.time() - start < 10, "playback never finished"
+            time.sleep(0.01)
+        return time.time() - start
+
+    def test_playback_length_matches_text(self, synthetic_engine):
+        """A 6-word line at 600 wpm plays for about 0.6 s."""
+        elapsed = self._speak_and_time(synthetic_engine, "one two three four five six")
+        assert 0.55 < elapsed < 1.2
+
+    def test_spoken_line_is_cached(self, synthetic_engine):
+        """Replaying a line uses cached audio instead of generating again."""
+        text = "cached line of synthetic speech"
+        self._speak_and_time(synthetic_engine, text)
+        self._speak_and_time(synthetic_engine, text)
+        assert synthetic_engine._service.requests == 1
+
+    def test_spans_recorded_on_the_trace_passed_in(self, synthetic_engine, tmp_path):
+        """A line's spans go to its own read's trace; untraced speech (announcements) records none."""
+        from tracing import Tracer
+
+        path = tmp_path / "trace.jsonl"
+        tracer = Tracer()
+        tracer.configure(True, path)
+        read = tracer.start_trace("hotkey_speak")
+        tracer.start_trace("auto_read")  # A later read must not collect the first read's spans
+
+        self._speak_and_time(synthetic_engine, "first line of the read", read)
+        self._speak_and_time(synthetic_engine, "Speed 600")
+
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        assert {r["name"] for r in records} >= {"generate", "playback"}
+        assert {r["trace"] for r in records} == {read.trace_id}
+
+    def test_empty_chunk_audio_not_cached(self, synthetic_engine, monkeypatch):
+        """A continuous-read chunk that generated no audio is skipped, not cached."""
+        from concurrent.futures import Future
+
+        from audio_cache import AudioCache
+
+        monkeypatch.setattr("tts_engine.CONTINUOUS_CHUNK_SECONDS", 0.5)  # 5 words per chunk at 600 wpm
+        chunks = ["One two three four five.", "Silent chunk goes here now.", "Six seven eight nine ten."]
+        submit = synthetic_engine._service.submit
+
+        def submit_with_empty(text, voice_id, rate, timeout):
+            if text.startswith("Silent"):
+                future = Future()
+                future.set_result(b"")
+                return future
+            return submit(text, voice_id, rate, timeout)
+
+        monkeypatch.setattr(synthetic_engine._service, "submit", submit_with_empty)
+        start = time.time()
+        synthetic_engine.speak_continuous(" ".join(chunks))
+        while synthetic_engine.is_speaking or synthetic_engine.is_generating:
+            assert time.time() - start < 10, "playback never finished"
+            time.sleep(0.01)
+
+        voice_id = synthetic_engine.VOICES[synthetic_engine.voice_name]
+        rate = synthetic_engine._rate_to_edge_modifier()
+        cached = [AudioCache.make_key(chunk, voice_id, rate) in synthetic_engine._cache for chunk in chunks]
+        assert cached == [True, False, True]
+
+    def test_streaming_starts_before_generation_finishes(self, synthetic_engine):
+        """An uncached line starts playing after the first chunks, while the rest is still generating."""
+        synthetic_engine._service.realtime_factor = 2  # 2 s of audio takes about 1 s to generate
+        start = time.time()
+        synthetic_engine.speak(" ".join(["word"] * 20))
+        while not synthetic_engine.is_speaking:
+            assert time.time() - start < 5, "playback never started"
+            time.sleep(0.005)
+        first_audio = time.time() - start
+        still_generating = not synthetic_engine._request._future.done()
+        synthetic_engine.stop()
+
+        assert still_generating
+        assert first_audio < 0.8  # Generating the whole line takes about 1 s
+        assert synthetic_engine._first_chunk_latency is not None
+        assert synthetic_engine._first_chunk_latency < first_audio
+
+    def test_completion_listener_called_when_playback_ends(self, synthetic_engine):
+        """The playback listener fires as soon as a line ends, with the engine already idle."""
+        import threading
+
+        from tts_engine import set_playback_listener
+
+        finished = threading.Event()
+        idle_when_notified = []
+
+        def on_finished():
+            idle_when_notified.append(not synthetic_engine.is_speaking and not synthetic_engine.is_generating)
+            finished.set()
+
+        set_playback_listener(on_finished)
+        try:
+            start = time.time()
+            synthetic_engine.speak("one two three four five six")
+            assert finished.wait(5), "completion listener never called"
+            elapsed = time.time() - start
+        finally:
+            set_playback_listener(None)
+
+        assert idle_when_notified == [True]
+        assert 0.55 < elapsed < 0.85  # 0.6 s of audio, without a polling interval after it
+
+    def test_next_line_queued_without_gap(self, synthetic_engine):
+        """A prefetched next line plays straight after the current one, with no idle moment between."""
+        lines = ["one two three four five six", "seven eight nine ten eleven twelve"]
+        start = time.time()
+        synthetic_engine.speak(lines[0])
+        synthetic_engine.prefetch_ahead(lines, 0)
+        synthetic_engine.set_next_line(lines[1])
+        while synthetic_engine.is_speaking or synthetic_engine.is_generating:
+            assert time.time() - start < 10, "playback never finished"
+            time.sleep(0.005)
+        elapsed = time.time() - start
+
+        assert synthetic_engine.take_lines_advanced() == 1
+        assert synthetic_engine._service.requests == 2
+        assert 1.1 < elapsed < 1.45  # Both lines (0.6 s each) before the engine first went idle
+
+    def test_cache_writes_stay_off_the_playback_path(self, synthetic_engine, monkeypatch):
+        """Generated audio is cached after playback starts, and prefetches are cached off the generation loop."""
+        import threading
+
+        events = []
+        put, play_audio = synthetic_engine._cache.put, synthetic_engine._play_audio
+
+        def recording_put(key, audio):
+            events.append(("put", threading.current_thread().name))
+            put(key, audio)
+
+        def recording_play(audio):
+            events.append(("play", threading.current_thread().name))
+            return play_audio(audio)
+
+        monkeypatch.setattr(synthetic_engine._cache, "put", recording_put)
+        monkeypatch.setattr(synthetic_engine, "_play_audio", recording_play)
+        synthetic_engine._stream_audio = False  # Generate whole, then play
+
+        lines = ["one two three four five six", "seven eight nine ten eleven twelve"]
+        self._speak_and_time(synthetic_engine, lines[0])
+        assert [name for name, _ in events] == ["play", "put"]
+
+        events.clear()
+        synthetic_engine.prefetch_ahead(lines, 0)
+        start = time.time()
+        while not events:
+            assert time.time() - start < 5, "prefetch never cached"
+            time.sleep(0.01)
+        assert events[0][0] == "put"
+        assert events[0][1].startswith("audio_cache")
+
+    def test_audio_decoded_outside_mixer_lock(self, synthetic_engine, monkeypatch):
+        """Decoding a whole line doesn't hold the mixer lock that pause, stop and health checks need."""
+        lock_held = []
+        make_sound = synthetic_engine._make_sound
+
+        def recording_make_sound(audio):
+            lock_held.append(synthetic_engine._mixer_lock.locked())
+            return make_sound(audio)
+
+        monkeypatch.setattr(synthetic_engine, "_make_sound", recording_make_sound)
+        synthetic_engine._stream_audio = False  # Generate whole, then play
+        self._speak_and_time(synthetic_engine, "one two three four five six")
+        assert lock_held == [False]
@@ -0,0 +1,110 @@
+"""
+Unit tests for Herald's persistent audio cache.
+
+Uses a temporary directory; no audio hardware or network needed.
+"""
+
+import json
+import time
+import pytest
+
+
+@pytest.mark.unit
+class TestAudioCacheKeys:
+    """Test cache key derivation."""
+
+    def test_key_depends_on_voice_and_rate(self):
+        """Same text at a different voice or rate must not share a key."""
+        from audio_cache import AudioCache
+
+        base = AudioCache.make_key("Hello world", "en-US-AriaNeural", "+100%")
+        assert base != AudioCache.make_key("Hello world", "en-US-GuyNeural", "+100%")
+        assert base != AudioCache.make_key("Hello world", "en-US-AriaNeural", "+50%")
+
+    def test_key_normalizes_whitespace(self):
+        """Whitespace differences should map to the same key."""
+        from audio_cache import AudioCache
+
+        assert AudioCache.make_key("  Hello   world\n", "v", "+0%") == AudioCache.make_key("Hello world", "v", "+0%")
+
+
+@pytest.mark.unit
+class TestAudioCacheStorage:
+    """Test storing, retrieving and evicting audio."""
+
+    def test_put_and_get(self, temp_audio_dir):
+        """Stored bytes should be retrievable by key."""
+        from audio_cache import AudioCache
+
+        cache = AudioCache(temp_audio_dir, max_bytes=10_000, max_age=3600)
+        cache.put("abc", b"audio-data")
+
+        path = cache.get("abc")
+        assert path is not None
+        assert path.read_bytes() == b"audio-data"
+        assert cache.get("missing") is None
+
+    def test_read_returns_bytes(self, temp_audio_dir):
+        """read should return the stored audio bytes, or None when missing."""
+        from audio_cache import AudioCache
+
+        cache = AudioCache(temp_audio_dir, max_bytes=10_000, max_age=3600)
+        cache.put("abc", b"audio-data")
+
+        assert cache.read("abc") == b"audio-data"
+        assert cache.read("missing") is None
+
+    def test_index_survives_restart(self, temp_audio_dir):
+        """A new cache instance should see entries written by a previous one."""
+        from audio_cache import AudioCache
+
+        AudioCache(temp_audio_dir, max_bytes=10_000, max_age=3600).put("persist", b"data")
+
+        reopened = AudioCache(temp_audio_dir, max_bytes=10_000, max_age=3600)
+        assert "persist" in reopened
+        assert reopened.get("persist").read_bytes() == b"data"
+
+    def test_size_eviction_removes_least_recently_used(self, temp_audio_dir):
+        """Exceeding max_bytes should evict the least recently used entry."""
+        from audio_cache import AudioCache
+
+        cache = AudioCache(temp_audio_dir, max_bytes=250, max_age=3600)
+        cache.put("first", b"a" * 100)
+        time.sleep(0.01)
+        cache.put("second", b"b" * 100)
+        time.sleep(0.01)
+        cache.get("first")  # first is now more recent than second
+        time.sleep(0.01)
+        cache.put("third", b"c" * 100)
+
+        assert "first" in cache
+        assert "second" not in cache
+        assert "third" in cache
+        assert not (temp_audio_dir / "second.mp3").exists()
+
+    def test_age_eviction(self, temp_audio_dir):
+        """Entries unused for longer than max_age should be evicted on load."""
+        from audio_cache import AudioCache
+
+        AudioCache(temp_audio_dir, max_bytes=10_000, max_age=3600).put("old", b"data")
+
+        # Backdate the entry in the persisted index
+        index_path = temp_audio_dir / AudioCache.INDEX_FILE
+        index = json.loads(index_path.read_text())
+        index["entries"]["old"]["last_used"] -= 7200
+        index_path.write_text(json.dumps(index))
+
+        reopened = AudioCache(temp_audio_dir, max_bytes=10_000, max_age=3600)
+        assert "old" not in reopened
+        assert not (temp_audio_dir / "old.mp3").exists()
+
+    def test_orphaned_files_removed(self, temp_audio_dir):
+        """Audio files missing from the index should be cleaned up on load."""
+        from audio_cache import AudioCache
+
+        orphan = temp_audio_dir / "orphan.mp3"
+        orphan.write_bytes(b"data")
+
+        cache = AudioCache(temp_audio_dir, max_bytes=10_000, max_age=3600)
+        assert not orphan.exists()
+        assert len(cache) == 0
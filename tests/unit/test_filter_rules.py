@@ -0,0 +1,98 @@
+"""
+Unit tests for Herald's user-defined filter rules.
+"""
+
+import json
+import os
+import pytest
+
+
+@pytest.mark.unit
+class TestPatternValidation:
+    """Test that patterns which could backtrack catastrophically are rejected."""
+
+    def test_nested_and_overlapping_repeats_rejected(self):
+        """Nested quantifiers whose iterations can split the same text are refused."""
+        from filter_rules import pattern_problem
+
+        for pattern in (r"(a+)+", r"(.*a)+", r"(a|aa)*b", r"^(\w+\s?)*$", "(", r"(?P<name>x)", "x" * 501):
+            assert pattern_problem(pattern), pattern
+
+    def test_delimited_repeats_accepted(self):
+        """Repeats separated by a character their body can't match are linear."""
+        from filter_rules import pattern_problem
+
+        for pattern in (r"(\w+\.)+", r"(\s+\w+)*", r"(\d+,)*\d+", r"^kubectl\s", r"\bk8s\b"):
+            assert pattern_problem(pattern) is None, pattern
+
+
+@pytest.mark.unit
+class TestRuleSet:
+    """Test per-rule hit counting."""
+
+    def test_hits_counted_per_rule_without_registering_metrics(self):
+        """Names that slug alike or aren't ASCII get separate counts and add nothing to the registry."""
+        from filter_rules import RuleSet
+        from metrics import REGISTRY
+
+        before = REGISTRY.render_prometheus().count("# TYPE")
+        rules = RuleSet.from_dict({"skip": [{"name": "café", "pattern": "^a"}, {"name": "caf!", "pattern": "^b"}]})
+        assert rules.skip_rule("a line") == "café"
+        assert rules.skip_rule("b line") == "caf!"
+        assert rules.skip_rule("another") == "café"
+
+        assert rules.hit_counts() == [("skip:café", 2), ("skip:caf!", 1)]
+        assert REGISTRY.render_prometheus().count("# TYPE") == before
+
+
+@pytest.mark.unit
+class TestRulesFile:
+    """Test rules applied through text_filter and reloaded when the file changes."""
+
+    def _write(self, path, data, mtime_ns):
+        path.write_text(json.dumps(data), encoding="utf-8")
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+    def test_skip_keep_and_replace(self, tmp_path, monkeypatch):
+        """Skip rules drop lines, keep rules override code filtering, replacements rewrite text."""
+        import text_filter
+        from filter_rules import RulesFile
+
+        path = tmp_path / "filter_rules.json"
+        self._write(
+            path,
+            {
+                "skip": [{"name": "ticket", "pattern": r"^[A-Z]+-\d+$"}],
+                "keep": [r"^\$ say "],
+                "replace": [{"pattern": r"\bk8s\b", "with": "kubernetes", "ignore_case": True}],
+            },
+            1_000_000_000,
+        )
+        monkeypatch.setattr(text_filter, "_user_rules", RulesFile(path, on_reload=text_filter.clear_line_cache))
+        text_filter.clear_line_cache()
+
+        lines = ["PROJ-123", "$ say hello", "$ npm install", "Deploy K8s today"]
+        assert text_filter.filter_lines(lines, filter_code=True) == ["$ say hello", "Deploy kubernetes today"]
+        assert ("skip:ticket", 1) in text_filter.user_rules().hit_counts()
+
+    def test_reloads_on_change_and_keeps_rules_on_bad_json(self, tmp_path, monkeypatch):
+        """Saving the file takes effect on the next read; a broken save keeps the last good rules."""
+        import text_filter
+        from filter_rules import RulesFile
+
+        path = tmp_path / "filter_rules.json"
+        self._write(path, {"skip": ["^draft"]}, 1_000_000_000)
+        monkeypatch.setattr(text_filter, "_user_rules", RulesFile(path, on_reload=text_filter.clear_line_cache))
+        text_filter.clear_line_cache()
+
+        assert text_filter.filter_lines(["draft one", "final one"]) == ["final one"]
+
+        self._write(path, {"skip": ["^final"]}, 2_000_000_000)
+        assert text_filter.filter_lines(["draft one", "final one"]) == ["draft one"]
+
+        path.write_text("{not json", encoding="utf-8")
+        os.utime(path, ns=(3_000_000_000, 3_000_000_000))
+        assert text_filter.filter_lines(["draft one", "final one"]) == ["draft one"]
+
+        path.unlink()
+        assert text_filter.filter_lines(["draft one", "final one"]) == ["draft one", "final one"]
@@ -0,0 +1,59 @@
+"""
+Unit tests for Herald's background-filled line queue.
+"""
+
+import threading
+import pytest
+
+
+@pytest.mark.unit
+class TestLineQueue:
+    """Test incremental filling, waiting, and cancellation."""
+
+    def test_lines_readable_while_source_still_producing(self):
+        """The first line can be read before the source is exhausted."""
+        from line_queue import LineQueue
+
+        release = threading.Event()
+
+        def source():
+            yield "first"
+            release.wait(timeout=5)
+            yield "second"
+
+        lines = LineQueue(source())
+        assert lines.wait_for(0, timeout=5)
+        assert lines[0] == "first"
+        assert lines.filling
+        assert lines.total_label == "1+"
+        assert not lines.wait_for(1, timeout=0)
+
+        release.set()
+        assert lines.wait_for(1, timeout=5)
+        assert lines[1] == "second"
+        assert not lines.wait_for(2, timeout=5)
+        assert not lines.filling
+        assert lines.total_label == "2"
+
+    def test_close_stops_filling_and_closes_source(self):
+        """A closed queue stops pulling lines and finalizes its generator."""
+        from line_queue import LineQueue
+
+        produced = threading.Event()
+        finalized = threading.Event()
+
+        def source():
+            try:
+                while True:
+                    produced.set()
+                    yield "line"
+            finally:
+                finalized.set()
+
+        lines = LineQueue(source())
+        assert produced.wait(timeout=5)
+        lines.close()
+        assert finalized.wait(timeout=5)
+        assert not lines.wait_for(len(lines), timeout=5)
+        assert not lines.filling
+        assert not LineQueue()
@@ -0,0 +1,69 @@
+"""
+Unit tests for Herald's metrics registry and localhost endpoint.
+"""
+
+import urllib.error
+import urllib.request
+import pytest
+
+
+@pytest.mark.unit
+class TestMetricsRegistry:
+    """Test counters, histograms and Prometheus rendering."""
+
+    def test_histogram_buckets_and_percentiles(self):
+        """Observations land in the right buckets and percentiles use recent samples."""
+        from metrics import Histogram
+
+        histogram = Histogram("gap_seconds", "Gap", buckets=(0.1, 1.0))
+        for value in (0.05, 0.2, 0.3, 0.4, 5.0):
+            histogram.observe(value)
+
+        lines = histogram.render()
+        assert 'gap_seconds_bucket{le="0.1"} 1' in lines
+        assert 'gap_seconds_bucket{le="1"} 4' in lines
+        assert 'gap_seconds_bucket{le="+Inf"} 5' in lines
+        assert "gap_seconds_count 5" in lines
+        assert histogram.percentile(50) == 0.3
+        assert histogram.percentile(95) == 5.0
+
+    def test_registry_get_or_create_and_reset(self):
+        """Declaring a metric twice returns the same one; reset zeroes it."""
+        from metrics import MetricsRegistry
+
+        registry = MetricsRegistry()
+        registry.counter("hits_total", "Hits").inc()
+        registry.counter("hits_total", "Hits").inc(2)
+        registry.gauge("depth", "Depth", read=lambda: 7)
+
+        text = registry.render_prometheus()
+        assert "# TYPE hits_total counter\nhits_total 3" in text
+        assert "depth 7" in text
+
+        registry.reset()
+        assert registry.get("hits_total").value == 0
+        assert registry.get("depth").value == 7  # Live readers keep reporting
+
+
+@pytest.mark.unit
+class TestMetricsServer:
+    """Test the localhost Prometheus endpoint."""
+
+    def test_serves_metrics_only(self):
+        """GET /metrics returns the registry; other paths are 404."""
+        from metrics import REGISTRY, start_metrics_server
+
+        REGISTRY.counter("herald_test_requests_total", "Test counter").inc()
+        server = start_metrics_server(0)
+        try:
+            base = f"http://127.0.0.1:{server.server_address[1]}"
+            with urllib.request.urlopen(f"{base}/metrics", timeout=5) as response:  # noqa: S310
+                body = response.read().decode()
+            assert "herald_test_requests_total 1" in body
+
+            with pytest.raises(urllib.error.HTTPError) as error:
+                urllib.request.urlopen(f"{base}/other", timeout=5)  # noqa: S310
+            assert error.value.code == 404
+        finally:
+            server.shutdown()
+            server.server_close()
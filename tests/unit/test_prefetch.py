@@ -0,0 +1,128 @@
+"""
+Unit tests for Herald's prefetch scheduler.
+
+Generation is simulated with manually resolved futures; no network needed.
+"""
+
+from concurrent.futures import Future
+import pytest
+
+
+class FakeGenerator:
+    """Records submitted payloads and hands back futures the test resolves."""
+
+    def __init__(self):
+        self.futures: dict[str, Future] = {}
+        self.order: list[str] = []
+
+    def submit(self, payload):
+        future = Future()
+        self.futures[payload] = future
+        self.order.append(payload)
+        return future
+
+
+def make_scheduler(generator, results, **kwargs):
+    from prefetch import PrefetchScheduler
+
+    return PrefetchScheduler(
+        submit=generator.submit,
+        on_result=lambda key, payload, result: results.append((key, result)),
+        audio_seconds=lambda result: 1.0,
+        **kwargs,
+    )
+
+
+@pytest.mark.unit
+class TestPrefetchScheduler:
+    """Test worker bounds, ordering, cancellation and adaptive lookahead."""
+
+    def test_bounded_workers_nearest_first(self):
+        """Only max_workers jobs run at once, dispatched nearest line first."""
+        gen, results = FakeGenerator(), []
+        scheduler = make_scheduler(gen, results, max_workers=2)
+
+        scheduler.update([(3, "k3", "line3"), (1, "k1", "line1"), (2, "k2", "line2")])
+        assert gen.order == ["line1", "line2"]
+        assert scheduler.running_count == 2
+        assert scheduler.pending_count == 1
+
+        gen.futures["line1"].set_result(b"audio1")
+        assert gen.order == ["line1", "line2", "line3"]
+        assert results == [("k1", b"audio1")]
+
+    def test_update_cancels_jobs_out_of_window(self):
+        """Skipping ahead cancels running jobs no longer wanted."""
+        gen, results = FakeGenerator(), []
+        scheduler = make_scheduler(gen, results, max_workers=2)
+
+        scheduler.update([(1, "k1", "line1"), (2, "k2", "line2")])
+        scheduler.update([(1, "k2", "line2"), (2, "k3", "line3")])
+
+        assert gen.futures["line1"].cancelled()
+        assert not gen.futures["line2"].cancelled()
+        assert gen.order == ["line1", "line2", "line3"]
+
+    def test_cancel_all(self):
+        """cancel_all drops pending and cancels running jobs."""
+        gen, results = FakeGenerator(), []
+        scheduler = make_scheduler(gen, results, max_workers=1)
+
+        scheduler.update([(1, "k1", "line1"), (2, "k2", "line2")])
+        scheduler.cancel_all()
+
+        assert gen.futures["line1"].cancelled()
+        assert scheduler.pending_count == 0
+        assert scheduler.running_count == 0
+        assert results == []
+
+    def test_lookahead_grows_when_generation_is_slow(self):
+        """Lookahead should track generation time relative to playback time."""
+        gen, results = FakeGenerator(), []
+        scheduler = make_scheduler(gen, results, max_lookahead=8, default_lookahead=2)
+        assert scheduler.lookahead == 2
+
+        # Generation takes 3x as long as the audio plays
+        scheduler._record_timing(3.0, 1.0)
+        assert scheduler.lookahead == 4
+
+        # Very slow generation is capped
+        scheduler._ratio = None
+        scheduler._record_timing(100.0, 1.0)
+        assert scheduler.lookahead == 8
+
+    def test_lookahead_shrinks_when_generation_is_fast(self):
+        """Fast generation needs only a short window."""
+        gen, results = FakeGenerator(), []
+        scheduler = make_scheduler(gen, results, min_lookahead=1)
+
+        scheduler._record_timing(0.2, 2.0)
+        assert scheduler.lookahead == 2
+
+    def test_failed_job_frees_worker(self):
+        """A failed generation should not block the next job."""
+        gen, results = FakeGenerator(), []
+        scheduler = make_scheduler(gen, results, max_workers=1)
+
+        scheduler.update([(1, "k1", "line1"), (2, "k2", "line2")])
+        gen.futures["line1"].set_exception(RuntimeError("network down"))
+
+        assert gen.order == ["line1", "line2"]
+        assert results == []
+
+    def test_claim_detaches_in_flight_job(self):
+        """A claimed job survives window updates and still reports its result."""
+        gen, results = FakeGenerator(), []
+        scheduler = make_scheduler(gen, results, max_workers=1)
+
+        scheduler.update([(1, "k1", "line1"), (2, "k2", "line2")])
+        claimed = scheduler.claim("k1")
+        assert claimed is gen.futures["line1"]
+        assert scheduler.claim("k2") is None  # pending, not running
+        assert scheduler.pending_count == 0
+
+        scheduler.update([(1, "k3", "line3")])
+        assert not claimed.cancelled()
+
+        claimed.set_result(b"audio1")
+        assert results == [("k1", b"audio1")]
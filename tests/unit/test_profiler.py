@@ -0,0 +1,55 @@
+"""
+Unit tests for Herald's on-demand profiling sessions.
+"""
+
+import pstats
+import threading
+import time
+import pytest
+
+
+@pytest.mark.unit
+class TestProfilingSession:
+    """Test cProfile and stack sampler output."""
+
+    def test_session_writes_pstats_and_collapsed_stacks(self, tmp_path):
+        """Main-thread calls land in pstats; other threads appear in the sampled stacks."""
+        from profiler import ProfilingSession
+
+        def busy_main_thread_work():
+            return sum(i * i for i in range(20000))
+
+        def speak_loop(stop):
+            while not stop.is_set():
+                time.sleep(0.001)
+
+        stop = threading.Event()
+        worker = threading.Thread(target=speak_loop, args=(stop,), name="speak_thread")
+        worker.start()
+        session = ProfilingSession(tmp_path, interval=0.005)
+        try:
+            session.start()
+            assert session.active
+            busy_main_thread_work()
+            time.sleep(0.1)
+            stats_path, stacks_path = session.stop()
+        finally:
+            stop.set()
+            worker.join()
+
+        assert not session.active
+        functions = {name for _, _, name in pstats.Stats(str(stats_path)).stats}
+        assert "busy_main_thread_work" in functions
+
+        stacks = stacks_path.read_text(encoding="utf-8").splitlines()
+        speak_stacks = [line for line in stacks if line.startswith("speak_thread;")]
+        assert speak_stacks
+        assert any("test_profiler:speak_loop" in line for line in speak_stacks)
+        assert all(line.rsplit(" ", 1)[1].isdigit() for line in stacks)
+
+    def test_stop_without_start_is_noop(self, tmp_path):
+        """Stopping an idle session writes nothing."""
+        from profiler import ProfilingSession
+
+        assert ProfilingSession(tmp_path).stop() is None
+        assert not list(tmp_path.iterdir())
@@ -0,0 +1,91 @@
+"""
+Unit tests for Herald's pronunciation dictionary.
+"""
+
+import json
+import os
+import pytest
+
+
+@pytest.mark.unit
+class TestPronunciationDictionary:
+    """Test case rules, word boundaries and longest-match replacement."""
+
+    def test_case_rules(self):
+        """Capitalized terms match exactly; lowercase ones match any case and keep a leading capital."""
+        from pronunciation import PronunciationDictionary
+
+        dictionary = PronunciationDictionary.from_dict(
+            {
+                "API": "A P I",
+                "k8s": "kubernetes",
+                "e.g.": "for example",
+                "ms": {"say": "milliseconds", "match_case": True},
+            }
+        )
+        assert dictionary.apply("The API, not the api") == "The A P I, not the api"
+        assert dictionary.apply("E.g. K8S and k8s") == "For example Kubernetes and kubernetes"
+        assert dictionary.apply("5 ms, 5 MS") == "5 milliseconds, 5 MS"
+
+    def test_whole_words_and_longest_match(self):
+        """Terms never match inside words, and the longest term at a position wins."""
+        from pronunciation import PronunciationDictionary
+
+        dictionary = PronunciationDictionary.from_dict(
+            {"new": "fresh", "New York": "N Y", "cat": "feline", "->": " to ", "C++": "C plus plus"}
+        )
+        assert dictionary.apply("New York is new") == "N Y is fresh"
+        assert dictionary.apply("concat catalog cat_name cat.") == "concat catalog cat_name feline."
+        assert dictionary.apply("a->b in C++") == "a to b in C plus plus"
+        assert dictionary.apply("nothing here") == "nothing here"
+
+    def test_file_reload_through_text_filter(self, tmp_path, monkeypatch):
+        """Spoken lines use the current file; editing it takes effect on the next read."""
+        import text_filter
+        from pronunciation import PronunciationFile
+
+        path = tmp_path / "pronunciation.json"
+        path.write_text(json.dumps({"k8s": "kubernetes"}), encoding="utf-8")
+        monkeypatch.setattr(
+            text_filter, "_pronunciations", PronunciationFile(path, on_reload=text_filter.clear_line_cache)
+        )
+        text_filter.clear_line_cache()
+
+        assert list(text_filter.iter_speakable_lines("Deploy k8s now", normalize=True)) == ["Deploy kubernetes now"]
+        assert list(text_filter.iter_speakable_lines("Deploy k8s now", normalize=False)) == ["Deploy kubernetes now"]
+
+        path.write_text(json.dumps({"k8s": "kates"}), encoding="utf-8")
+        os.utime(path, ns=(2_000_000_000, 2_000_000_000))
+        assert list(text_filter.iter_speakable_lines("Deploy k8s now", normalize=True)) == ["Deploy kates now"]
+
+    def test_terms_inside_identifiers_and_units(self):
+        """Identifiers and numbers with units are split before lookup, so terms inside them are found."""
+        from pronunciation import PronunciationDictionary
+        from text_filter import normalize_for_speech, split_identifiers
+
+        dictionary = PronunciationDictionary.from_dict(
+            {
+                "API": "A P I",
+                "k8s": "kubernetes",
+                "GitHub": "git hub",
+                "ms": {"say": "milliseconds", "match_case": True},
+                "GB": "gigabytes",
+            },
+            variant=split_identifiers,
+        )
+        cases = {
+            "Call getAPIKey first": "Call get A P I Key first",
+            "Raise max_API_calls": "Raise max A P I calls",
+            "Resize the k8s_cluster": "Resize the kubernetes cluster",
+            "Timed out after 30ms": "Timed out after 30 milliseconds",
+            "Uses 1.5GB of RAM": "Uses 1.5 gigabytes of RAM",
+            "Push to GitHub": "Push to git hub",
+            "The 2nd run took 30MS": "The 2nd run took 30MS",
+            "Render 4K at 3x in 1080p": "Render 4K at 3x in 1080p",
+        }
+        assert {text: normalize_for_speech(text, dictionary=dictionary) for text in cases} == cases
+
+        # Without a dictionary, numbers and units stay together as they always have
+        unchanged = "Enable 2FA, took 30ms at 3x"
+        assert normalize_for_speech(unchanged) == unchanged
+        assert normalize_for_speech(unchanged, dictionary=PronunciationDictionary()) == unchanged
@@ -0,0 +1,51 @@
+"""
+Unit tests for Herald's resource (leak) monitor.
+"""
+
+import pytest
+
+
+@pytest.mark.unit
+class TestResourceMonitor:
+    """Test readings and steady-growth detection."""
+
+    def test_steady_growth_past_threshold_warns(self, tmp_path):
+        """A value that never falls across the window and grows past its threshold is flagged once."""
+        from loguru import logger
+        from resource_monitor import ResourceMonitor
+
+        monitor = ResourceMonitor(tmp_path, thresholds={"threads": 3}, window=4)
+        warnings = []
+        sink = logger.add(lambda message: warnings.append(str(message)), level="WARNING")
+        try:
+            for value in (10, 10, 11, 12):  # Growth 2 < 3: not flagged
+                monitor._record("threads", value)
+            assert not warnings
+            for value in (13, 14):  # Window 11..14, growth 3
+                monitor._record("threads", value)
+            assert len(warnings) == 1
+            assert "threads" in warnings[0]
+
+            for value in (20, 5, 30, 40):  # Dips: not steady growth
+                monitor._record("threads", value)
+            assert len(warnings) == 1
+        finally:
+            logger.remove(sink)
+
+    def test_sample_counts_open_temp_files(self, tmp_path):
+        """Readings include open handles under the temp directory and live threads."""
+        from resource_monitor import ResourceMonitor
+
+        monitor = ResourceMonitor(tmp_path)
+        monitor.start()
+        try:
+            with open(tmp_path / "leaked.mp3", "wb"):
+                readings = monitor.sample()
+            assert readings["temp_files"] == 1
+            assert readings["threads"] >= 1
+            assert readings["traced_mb"] > 0
+            assert "prefetch_cache_mb" in readings
+            assert "prefetch_cache_mb" not in monitor.thresholds  # Bounded by its LRU cap, not a leak signal
+            assert monitor.sample()["temp_files"] == 0
+        finally:
+            monitor.stop()
@@ -0,0 +1,59 @@
+"""
+Unit tests for Herald's synthetic (offline) generation service.
+"""
+
+import pytest
+
+
+@pytest.mark.unit
+class TestSyntheticAudio:
+    """Test generated audio length."""
+
+    def test_duration_follows_words_and_rate(self):
+        """Audio lasts as long as the text takes to speak at the rate modifier."""
+        from edge_service import mp3_duration
+        from synthetic_service import synthetic_audio
+
+        # 10 words at 300 wpm (+0%) = 2 s; at 600 wpm (+100%) = 1 s
+        assert mp3_duration(synthetic_audio("word " * 10, "+0%")) == pytest.approx(2.0, abs=0.03)
+        assert mp3_duration(synthetic_audio("word " * 10, "+100%")) == pytest.approx(1.0, abs=0.03)
+
+    def test_rate_modifier_to_wpm(self):
+        """Rate modifiers map to wpm like EdgeTTSEngine's conversion."""
+        from synthetic_service import rate_modifier_to_wpm
+
+        assert rate_modifier_to_wpm("+0%") == 300
+        assert rate_modifier_to_wpm("-50%") == 150
+        assert rate_modifier_to_wpm("+200%") == 900
+
+
+@pytest.mark.unit
+class TestSyntheticGenerationService:
+    """Test latency, failures and determinism."""
+
+    def test_submit_returns_audio(self):
+        """Requests resolve to the generated MP3."""
+        from synthetic_service import SyntheticGenerationService, synthetic_audio
+
+        service = SyntheticGenerationService(latency=0.01, jitter=0, realtime_factor=1000)
+        try:
+            audio = service.submit("Hello there", "synthetic-aria", "+50%", timeout=5).result(timeout=5)
+        finally:
+            service.shutdown()
+        assert audio == synthetic_audio("Hello there", "+50%")
+
+    def test_failures_are_seeded(self):
+        """The same seed fails the same requests."""
+        from synthetic_service import SyntheticGenerationService
+
+        def outcomes(seed):
+            service = SyntheticGenerationService(latency=0, jitter=0, failure_rate=0.5, realtime_factor=1000, seed=seed)
+            try:
+                futures = [service.submit("Hi", "synthetic-aria", "+0%", timeout=5) for _ in range(20)]
+                return [future.exception(timeout=5) is None for future in futures]
+            finally:
+                service.shutdown()
+
+        first = outcomes(seed=7)
+        assert first == outcomes(seed=7)
+        assert 0 < first.count(True) < 20
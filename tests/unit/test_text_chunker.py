@@ -0,0 +1,52 @@
+"""
+Unit tests for Herald's continuous-mode text chunker.
+"""
+
+import pytest
+
+
+@pytest.mark.unit
+class TestSplitIntoChunks:
+    """Test sentence-boundary chunking."""
+
+    def test_packs_whole_sentences(self):
+        """Sentences are packed up to the word budget without being split."""
+        from text_chunker import split_into_chunks
+
+        text = "One two three. Four five six. Seven eight nine."
+        assert split_into_chunks(text, 6) == ["One two three. Four five six.", "Seven eight nine."]
+
+    def test_keeps_text_order_and_content(self):
+        """Joining the chunks gives back every word in order."""
+        from text_chunker import split_into_chunks
+
+        text = 'He said "Hi." Then he left! Was it late? Yes.\nAnother line\nAnd a last one.'
+        chunks = split_into_chunks(text, 5)
+        assert " ".join(chunks).split() == text.split()
+        assert all(len(chunk.split()) <= 5 for chunk in chunks)
+
+    def test_line_breaks_are_kept_within_a_chunk(self):
+        """Unpunctuated lines keep their line break so they aren't run together."""
+        from text_chunker import split_into_chunks
+
+        assert split_into_chunks("First line\nSecond line", 10) == ["First line\nSecond line"]
+
+    def test_long_sentence_split_at_clauses(self):
+        """A sentence over the budget breaks at clause punctuation first."""
+        from text_chunker import split_into_chunks
+
+        text = "This sentence is long, it has clauses, and it keeps going"
+        assert split_into_chunks(text, 5) == ["This sentence is long,", "it has clauses,", "and it keeps going"]
+
+    def test_empty_text(self):
+        """Blank input produces no chunks."""
+        from text_chunker import split_into_chunks
+
+        assert split_into_chunks("  \n\n ", 10) == []
+
+    def test_words_for_duration(self):
+        """Word budget follows rate and duration, never below one word."""
+        from text_chunker import words_for_duration
+
+        assert words_for_duration(15, 600) == 150
+        assert words_for_duration(0.01, 100) == 1
@@ -0,0 +1,337 @@
+"""
+Unit tests for Herald's text filter.
+"""
+
+import random
+import re
+import pytest
+
+
+def _reference_is_code_like(line: str) -> bool:
+    """The rule-by-rule checks the combined matcher replaced, for differential testing."""
+    import text_filter as tf
+
+    if not line or not line.strip():
+        return False
+    stripped = line.strip()
+    return bool(
+        tf.URL_PATTERN.match(stripped)
+        or (tf.FILE_PATH_PATTERN.match(stripped) and len(stripped.split()) <= 2)
+        or tf.SHELL_PROMPT_PATTERN.match(stripped)
+        or any(cmdlet in stripped for cmdlet in tf.POWERSHELL_CMDLETS)
+        or any(stripped.lower().startswith(cmd) for cmd in tf.CLI_COMMANDS)
+        or any(regex.search(stripped) for regex in tf.CODE_REGEX)
+        or tf.GIT_HASH_PATTERN.match(stripped)
+        or tf.SHORT_HASH_PATTERN.match(stripped)
+        or tf.UUID_PATTERN.match(stripped)
+        or re.search(r"(0x[a-f0-9]+\s*){3,}", stripped, re.IGNORECASE)
+        or tf.LOG_TIMESTAMP_PATTERN.match(stripped)
+        or tf.EMAIL_PATTERN.match(stripped)
+        or any(pattern.match(stripped) for pattern in tf.CLAUDE_CODE_PATTERNS)
+    )
+
+
+def _reference_normalize_for_speech(text: str, filter_paths_urls: bool = False) -> str:
+    """The pass-per-rule normalization the guarded version replaced, for differential testing."""
+    if not text:
+        return text
+    result = text
+    if filter_paths_urls:
+        result = re.sub(r'https?://[^\s<>"\')\]]+|www\.[^\s<>"\')\]]+', "", result, flags=re.IGNORECASE)
+        result = re.sub(
+            r'[A-Za-z]:\\[^\s<>"\')\]]+|(?<!\w)/(?:usr|home|var|etc|tmp|opt|mnt|dev)[^\s<>"\')\]]*|'
+            r'(?<!\w)\.{1,2}/[^\s<>"\')\]]+',
+            "",
+            result,
+            flags=re.IGNORECASE,
+        )
+        result = re.sub(r" {2,}", " ", result).strip()
+    result = re.sub(r"\x1b\[[0-9;]*m", "", result)
+    for pattern in (r"\*\*([^*]+)\*\*", r"__([^_]+)__", r"`([^`]+)`", r"~~([^~]+)~~", r"\[([^\]]+)\]\([^)]+\)"):
+        result = re.sub(pattern, r"\1", result)
+    result = re.sub(r"#(\w+)", r"\1", result)
+    result = re.sub(r"@(\w+)", r"\1", result)
+    result = re.sub(r"(\w)_(\w)", r"\1 \2", result)
+    while "_" in result and re.search(r"(\w)_(\w)", result):
+        result = re.sub(r"(\w)_(\w)", r"\1 \2", result)
+    result = re.sub(r"([a-z])([A-Z])", r"\1 \2", result)
+    result = re.sub(r"([A-Z]+)([A-Z][a-z])", r"\1 \2", result)
+    result = re.sub(r"\.{2,}", ".", result)
+    result = re.sub(r"!{2,}", "!", result)
+    result = re.sub(r"\?{2,}", "?", result)
+    result = re.sub(r"…", ".", result)
+    return re.sub(r" {2,}", " ", result)
+
+
+def _reference_is_unspeakable(line: str) -> bool:
+    """The per-character loops the table-driven check replaced, for differential testing."""
+    from text_filter import BOX_DRAWING_CHARS
+
+    if not line or not line.strip():
+        return True
+    stripped = line.strip()
+    box_char_count = sum(1 for c in stripped if c in BOX_DRAWING_CHARS)
+    if box_char_count > 0 and box_char_count >= len(stripped) * 0.5:
+        return True
+    return not any(c.isalpha() for c in stripped)
+
+
+@pytest.mark.unit
+class TestNormalizeForSpeech:
+    """Test the guarded normalization passes."""
+
+    def test_matches_pass_per_rule_normalization(self):
+        """Differential test: byte-for-byte the same output as running every pass in turn."""
+        from text_filter import normalize_for_speech
+
+        rng = random.Random(0)
+        alphabet = "aAbBzZ_ _*`~[]()#@.!?…\x1b[0;31m/:\\wé1 "
+        lines = ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 24))) for _ in range(30000)]
+        lines += [
+            "Call **on_filter_code_change** from `TrayApp`... really!!",
+            "See https://github.com/ityeti/herald or ./src/main.py for XMLParser__init__ details",
+            "\x1b[31mRed\x1b[0m #tag @user a___b ..… ??",
+        ]
+
+        for filter_paths_urls in (False, True):
+            mismatches = [
+                line
+                for line in lines
+                if normalize_for_speech(line, filter_paths_urls)
+                != _reference_normalize_for_speech(line, filter_paths_urls)
+            ]
+            assert mismatches == []
+
+
+@pytest.mark.unit
+class TestCodeLikeMatcher:
+    """Test the combined is_code_like matcher."""
+
+    def test_reports_rule_that_fired(self):
+        """Each kind of code-like line is attributed to its rule."""
+        from text_filter import code_like_rule
+
+        assert code_like_rule("https://github.com/ityeti/herald") == "url"
+        assert code_like_rule("  C:\\dev\\herald\\src\\main.py  ") == "file_path"
+        assert code_like_rule("$ pip install herald") == "shell_prompt"
+        assert code_like_rule("Git clone repo") == "cli_command"
+        assert code_like_rule("Then run Get-Process | Out-File x") == "powershell_cmdlet"
+        assert code_like_rule("fn parse() -> Result") == "code_syntax_10"
+        assert code_like_rule("bytes 0x1F 0x2A 0x00") == "hex_dump"
+        assert code_like_rule("--- a/src/main.py") == "tool_output_1"
+        assert code_like_rule("Hello, this is a test.") is None
+        assert code_like_rule("This line mentions C:\\Users but is a sentence.") is None
+
+    def test_matches_rule_by_rule_checks(self):
+        """Differential test: same verdict as checking every rule in turn."""
+        from text_filter import is_code_like
+
+        rng = random.Random(0)
+        alphabet = "aAxX:/\\.-_=>{}[]#*@$ 0123fGSetpigo`~+\t"
+        lines = ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 16))) for _ in range(20000)]
+        lines += ["Get-Item", "get-item", "PIP3 install", "pip3", "--- A/x", "Read tool", "deadbeef", "0x1 0X2 0x3"]
+
+        mismatches = [line for line in lines if is_code_like(line) != _reference_is_code_like(line)]
+        assert mismatches == []
+
+
+@pytest.mark.unit
+class TestUnspeakable:
+    """Test the table-driven character classification."""
+
+    def test_matches_per_character_checks(self):
+        """Differential test: same verdict as counting characters one by one."""
+        from text_filter import is_unspeakable
+
+        rng = random.Random(0)
+        alphabet = "─│┌═║█░■●★☆aZé漢ß²½Ⅻ_9٣ -|+=#.\t"
+        lines = ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12))) for _ in range(30000)]
+        lines += ["", "   ", "│ name │", "──── Results ────", "████████░░ 80%", "² ½", "ｈｅｌｌｏ", "[15/52]"]
+
+        mismatches = [line for line in lines if is_unspeakable(line) != _reference_is_unspeakable(line)]
+        assert mismatches == []
+
+
+@pytest.mark.unit
+class TestStreamingPipeline:
+    """Test the lazy split/filter/normalize pipeline."""
+
+    def test_matches_whole_text_preparation(self):
+        """Yields exactly what splitting, filter_lines and normalizing the whole text gives."""
+        from text_filter import filter_lines, iter_speakable_lines, normalize_for_speech
+
+        text = "\n".join(
+            [
+                "  First line to read.  ",
+                "",
+                "https://github.com/ityeti/herald",
+                "Call get_user_name from `HttpClient` now",
+                "============",
+                "$ pip install herald",
+                "Last line\r",
+            ]
+        )
+        for filter_code in (False, True):
+            raw_lines = [line.strip() for line in text.split("\n") if line.strip()]
+            filtered = filter_lines(raw_lines, filter_code=filter_code)
+            assert list(iter_speakable_lines(text, filter_code=filter_code)) == filtered
+            assert list(iter_speakable_lines(text, filter_code=filter_code, normalize=True)) == [
+                normalize_for_speech(line, filter_paths_urls=filter_code) for line in filtered
+            ]
+
+    def test_first_line_available_before_rest_is_processed(self, monkeypatch):
+        """Only the lines needed so far are filtered."""
+        import text_filter
+
+        checked = []
+        original = text_filter.is_unspeakable
+
+        def counting_is_unspeakable(line):
+            checked.append(line)
+            return original(line)
+
+        monkeypatch.setattr(text_filter, "is_unspeakable", counting_is_unspeakable)
+        text_filter.clear_line_cache()
+        lines = text_filter.iter_speakable_lines("Hello there.\n" * 100_000, normalize=True)
+
+        assert next(lines) == "Hello there."
+        assert len(checked) == 1
+
+
+@pytest.mark.unit
+class TestLineCache:
+    """Test memoized per-line filtering and normalization."""
+
+    def test_repeated_text_skips_filtering(self, monkeypatch):
+        """Re-reading the same text reuses cached results and counts hits."""
+        import text_filter
+        from metrics import REGISTRY
+
+        calls = []
+        original = text_filter.code_like_rule
+
+        def counting_code_like_rule(line):
+            calls.append(line)
+            return original(line)
+
+        monkeypatch.setattr(text_filter, "code_like_rule", counting_code_like_rule)
+        text_filter.clear_line_cache()
+        REGISTRY.reset()
+        text = "Read the getUserName docs\nhttps://example.com\nRead the getUserName docs"
+
+        first = list(text_filter.iter_speakable_lines(text, normalize=True))
+        calls_after_first = len(calls)
+        second = list(text_filter.iter_speakable_lines(text, normalize=True))
+
+        assert first == second == ["Read the get User Name docs", "Read the get User Name docs"]
+        assert calls_after_first == 2
+        assert len(calls) == calls_after_first
+        assert text_filter.filter_lines(["https://example.com"]) == []  # Different flags, separate entry
+        stats = text_filter.line_cache_stats()
+        assert stats["hits"] == 4
+        assert stats["misses"] == 3
+        assert stats["size"] == 3
+        assert stats["hit_rate"] == pytest.approx(4 / 7)
+
+    def test_evicts_least_recently_used(self):
+        """The cache stays bounded, dropping the entry unused the longest."""
+        from text_filter import LineCache
+
+        cache = LineCache(maxsize=2)
+        cache.put(("a",), (None, "a"))
+        cache.put(("b",), (None, "b"))
+        cache.get(("a",))
+        cache.put(("c",), (None, "c"))
+
+        assert len(cache) == 2
+        assert cache.get(("a",)) == (None, "a")
+        assert cache.get(("b",)) is None
+
+
+@pytest.mark.unit
+class TestCodeBlocks:
+    """Test document-level detection of code regions."""
+
+    def test_detects_regions(self):
+        """Fences, diffs, tracebacks and indented code are marked whole; prose around them isn't."""
+        from text_filter import code_blocks
+
+        lines = [
+            "Here is the fix.",
+            "```python",
+            "# strip the prefix first",
+            "```",
+            "diff --git a/src/x.py b/src/x.py",
+            "--- a/src/x.py",
+            "+++ b/src/x.py",
+            "@@ -1,2 +1,2 @@",
+            " keep this line",
+            "-old line",
+            "+new line",
+            "Traceback (most recent call last):",
+            '  File "main.py", line 3, in <module>',
+            "    run()",
+            "ValueError: bad input",
+            "    import herald",
+            "    queue = LineQueue(source)",
+            "",
+            "Then a quote:",
+            "    indented prose quoted from a book",
+            "    that runs on to a second line.",
+            "It failed with:",
+            "   at Herald.Main() in C:\\src\\Main.cs:line 5",
+            "   at Herald.Run() in C:\\src\\Main.cs:line 9",
+            "```",
+            "An unclosed fence is read as text.",
+        ]
+        regions = [region for _, region in code_blocks(lines)]
+
+        expected = [None] + ["fenced_block"] * 3 + ["diff"] * 7 + ["stack_trace"] * 3 + [None]
+        expected += ["indented_code"] * 2 + [None] * 5 + ["stack_trace"] * 2 + [None] * 2
+        assert regions == expected
+
+    def test_indented_prose_starting_with_at_is_read(self):
+        """Only real frame shapes count as a stack trace, not prose that starts with "at"."""
+        from text_filter import code_blocks, filter_lines
+
+        lines = [
+            "Meeting notes:",
+            "  at the office we agreed to ship on Friday.",
+            "  Everyone was happy with the plan.",
+            "Thanks!",
+        ]
+        assert filter_lines(lines) == lines
+        quote = ["    at least two reviewers must approve.", "    at most one may be on leave."]
+        assert [region for _, region in code_blocks(quote)] == [None, None]
+
+        frames = [
+            "    at com.example.Main.run(Main.java:12)",
+            "    at processTicksAndRejections (node:internal/process/task_queues:95:5)",
+            "    at async Promise.all (index 0)",
+            "    at /app/server.js:40:7",
+        ]
+        assert {region for _, region in code_blocks(frames)} == {"stack_trace"}
+
+    def test_indented_runs_are_examined_in_pieces(self):
+        """A blank line ends an indented run and long runs are capped, so lines stream out early."""
+        from text_filter import MAX_RUN_LINES, code_blocks
+
+        def indented_lines():
+            yield "  first paragraph line"
+            yield "  second paragraph line"
+            yield ""
+            for i in range(MAX_RUN_LINES * 10):
+                yield f"  line {i} of an indented document"
+            raise AssertionError("read past the first run")
+
+        blocks = code_blocks(indented_lines())
+        assert [next(blocks)[0] for _ in range(3)] == ["  first paragraph line", "  second paragraph line", ""]
+        assert next(blocks)[0] == "  line 0 of an indented document"
+
+    def test_comments_inside_code_blocks_are_not_spoken(self):
+        """Lines no per-line rule catches are dropped with their block."""
+        from text_filter import iter_speakable_lines
+
+        text = "Before.\n```\n# explain the loop\nThis sentence is in the block\n```\nAfter."
+        assert list(iter_speakable_lines(text)) == ["Before.", "After."]
+        assert "This sentence is in the block" in iter_speakable_lines(text, filter_code=False)
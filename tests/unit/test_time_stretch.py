@@ -0,0 +1,62 @@
+"""
+Unit tests for Herald's pitch-preserving time stretch.
+
+Requires numpy (optional dependency); skipped when it isn't installed.
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+SAMPLE_RATE = 44100
+
+
+def tone(seconds: float, freq: float = 220.0):
+    """Stereo int16 sine tone shaped (frames, 2)."""
+    t = np.arange(int(SAMPLE_RATE * seconds)) / SAMPLE_RATE
+    mono = (np.sin(2 * np.pi * freq * t) * 8000).astype(np.int16)
+    return np.stack([mono, mono], axis=1)
+
+
+def dominant_frequency(samples) -> float:
+    spectrum = np.abs(np.fft.rfft(samples[:, 0].astype(np.float64)))
+    return np.argmax(spectrum) * SAMPLE_RATE / len(samples)
+
+
+@pytest.mark.unit
+class TestTimeStretch:
+    """Test duration, pitch and continuity of stretched audio."""
+
+    @pytest.mark.parametrize("speed", [0.5, 1.5, 2.0, 3.0])
+    def test_duration_scales_with_speed(self, speed):
+        """Output length is input length divided by speed."""
+        from time_stretch import time_stretch
+
+        samples = tone(2.0)
+        out = time_stretch(samples, speed, SAMPLE_RATE)
+        assert out.shape == (round(len(samples) / speed), 2)
+        assert out.dtype == np.int16
+
+    @pytest.mark.parametrize("speed", [0.5, 2.0])
+    def test_pitch_is_preserved(self, speed):
+        """Changing speed must not change the tone's frequency."""
+        from time_stretch import time_stretch
+
+        out = time_stretch(tone(2.0), speed, SAMPLE_RATE)
+        assert dominant_frequency(out) == pytest.approx(220.0, abs=2.0)
+
+    def test_no_discontinuities(self):
+        """Overlap-add seams shouldn't introduce clicks (jumps beyond the tone's own slope)."""
+        from time_stretch import time_stretch
+
+        samples = tone(1.0)
+        out = time_stretch(samples, 1.7, SAMPLE_RATE)
+        max_step = np.abs(np.diff(samples[:, 0].astype(np.int32))).max()
+        assert np.abs(np.diff(out[:, 0].astype(np.int32))).max() <= max_step * 1.1
+
+    def test_unit_speed_is_unchanged(self):
+        """Speed 1.0 returns the input as-is."""
+        from time_stretch import stretch_pcm
+
+        pcm = tone(0.1).tobytes()
+        assert stretch_pcm(pcm, 1.0, SAMPLE_RATE, 2) == pcm
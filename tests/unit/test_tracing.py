@@ -0,0 +1,65 @@
+"""
+Unit tests for Herald's per-utterance latency tracing.
+"""
+
+import json
+import pytest
+
+
+@pytest.mark.unit
+class TestTracer:
+    """Test span recording and export."""
+
+    def test_disabled_tracing_writes_nothing(self, tmp_path):
+        """While off, traces are no-ops and no file is created."""
+        from tracing import NULL_TRACE, Tracer
+
+        tracer = Tracer()
+        tracer.configure(False, tmp_path / "trace.jsonl")
+        trace = tracer.start_trace("hotkey_speak")
+        with trace.span("get_content"):
+            pass
+        trace.mark("first_byte")
+
+        assert trace is NULL_TRACE
+        assert not (tmp_path / "trace.jsonl").exists()
+
+    def test_spans_written_as_jsonl(self, tmp_path):
+        """Each span is appended as one JSON line tagged with its trace."""
+        from tracing import Tracer
+
+        path = tmp_path / "trace.jsonl"
+        tracer = Tracer()
+        tracer.configure(True, path)
+        trace = tracer.start_trace("hotkey_speak", start=100.0)
+        trace.add("hotkey_queue", 100.0, 100.25)
+        with trace.span("filter_lines", filter_code=True):
+            pass
+        trace.mark("first_byte")
+        tracer.start_trace("auto_read").mark("cache_hit")
+
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [r["name"] for r in records] == ["hotkey_queue", "filter_lines", "first_byte", "cache_hit"]
+        assert records[0]["dur"] == 0.25
+        assert records[1]["attrs"] == {"filter_code": True}
+        assert records[2]["dur"] is None
+        assert records[0]["trace"] == records[2]["trace"] != records[3]["trace"]
+
+    def test_chrome_export(self, tmp_path):
+        """Spans become complete events, marks instant events, in microseconds."""
+        from tracing import Tracer, export_chrome_trace
+
+        path = tmp_path / "trace.jsonl"
+        tracer = Tracer()
+        tracer.configure(True, path)
+        trace = tracer.start_trace("hotkey_speak")
+        trace.add("generate", 10.0, 10.5, source="stream")
+        trace.add("first_byte", 10.2)
+
+        assert export_chrome_trace(path, tmp_path / "trace.json") == 2
+        events = json.loads((tmp_path / "trace.json").read_text())["traceEvents"]
+        spans = {e["name"]: e for e in events if e["ph"] in ("X", "i")}
+        assert spans["generate"]["ts"] == 10_000_000
+        assert spans["generate"]["dur"] == 500_000
+        assert spans["generate"]["args"] == {"source": "stream"}
+        assert spans["first_byte"]["ph"] == "i"